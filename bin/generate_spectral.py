@@ -1,8 +1,71 @@
 """
 Utility script to generate wcps/spectral.py
 """
-import requests
+import ast
+import io
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+INDICES_URL = "https://raw.githubusercontent.com/awesome-spectral-indices/awesome-spectral-indices/main/output/spectral-indices-dict.json"
+"""Location of the upstream JSON with all spectral indices."""
+
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'wcps', 'spectral-indices.json')
+"""
+Local copy of the last downloaded indices JSON, along with its ETag and
+Last-Modified response headers; used to make a conditional request on the
+next run, so that the body is not downloaded again if it has not changed.
+"""
+
+MODULE_HEADER = (
+    '"""\n'
+    'Python classes for spectral indices generated from a standardized list curated at\n'
+    'https://awesome-ee-spectral-indices.readthedocs.io. Each class can be instantiated\n'
+    'with :class:`wcps.model.WCPSExpr` arguments for the respective bands / constants.\n'
+    'Example for applying the NDVI index on red/nir Sentinel-2 bands:\n\n'
+    '.. code:: python\n\n'
+    '  from wcps.model import Datacube\n'
+    '  from wcps.spectral import NDVI\n\n'
+    '  red = Datacube("S2_L2A_32631_B04_10m")\n'
+    '  nir = Datacube("S2_L2A_32631_B08_10m")\n'
+    '  ndvi = NDVI(N=nir, R=red)\n'
+    '  query = ndvi.encode("PNG")\n'
+    '"""\n\n'
+    '# generated with bin/generate_spectral.py, do not edit manually.\n\n'
+    'from wcps.model import WCPSExpr, OperandType\n\n'
+)
+"""Module docstring and imports at the top of the generated file."""
+
+_get_index_details = itemgetter('short_name', 'long_name', 'bands', 'formula',
+                                'platforms', 'reference', 'contributor')
+"""Extract the index details used in the generated classes in a single call."""
+
+MIN_PARALLEL_INDICES = 64
+"""Minimum number of indices for which rendering with multiple workers is attempted."""
+
+CLASS_TEMPLATE = '''class {class_name}(WCPSExpr):
+  """{long_name}"""
+  __slots__ = {slots}
+  short_name = "{short_name}"
+  long_name = "{long_name}"
+  bands = {bands}
+  formula = "{formula}"
+  platforms = {platforms}
+  reference = "{reference}"
+  contributor = "{contributor}"
+
+  def __init__(self, {band_params}):
+    super().__init__(operands=[{formula_expr}])
+{band_assignments}
+  def _parts(self):
+    return (self.operands[0],)
+
+
+'''
+"""Template of a generated class for a single spectral index, rendered with :meth:`str.format`."""
 
 
 def load_indices() -> dict[str, dict]:
@@ -10,6 +73,10 @@ def load_indices() -> dict[str, dict]:
     Retrieves and parses the JSON from
     https://raw.githubusercontent.com/davemlz/awesome-ee-spectral-indices/main/output/spectral-indices-dict.json
 
+    The response is cached in :data:`CACHE_FILE`; subsequent calls send
+    If-None-Match / If-Modified-Since headers and reuse the cached body when
+    the server answers with 304 Not Modified.
+
     :return: a dict of index name -> dict with index details, e.g.
 
         .. code:: json
@@ -41,20 +108,114 @@ def load_indices() -> dict[str, dict]:
               }
             }
     """
-    url = "https://raw.githubusercontent.com/awesome-spectral-indices/awesome-spectral-indices/main/output/spectral-indices-dict.json"
-    indices = requests.get(url).json()
-    print(f"loaded indices from {url}")
-    return indices['SpectralIndices']
+    cached = _read_cache()
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        with urlopen(Request(INDICES_URL, headers=headers), timeout=60) as response:
+            body = response.read().decode('utf-8')
+            _write_cache({'etag': response.headers.get('ETag'),
+                          'last_modified': response.headers.get('Last-Modified'),
+                          'body': body})
+        print(f"loaded indices from {INDICES_URL}")
+    except HTTPError as e:
+        # urllib reports 304 Not Modified as an error
+        if e.code != 304 or 'body' not in cached:
+            raise
+        print(f"indices at {INDICES_URL} not modified, loading from {CACHE_FILE}")
+        body = cached['body']
 
+    return json.loads(body)['SpectralIndices']
 
-def generate_spectral_py(indices, filename='spectral.py'):
+
+def _read_cache() -> dict:
+    """
+    :return: the dict stored in :data:`CACHE_FILE`, or an empty dict if it
+        does not exist or cannot be parsed.
     """
-    Given a dict returned by :meth:`load_indices`, generate a Python files
-    with classes for each index, e.g:
+    try:
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cached: dict):
+    """
+    Save the ``cached`` dict to :data:`CACHE_FILE`; failure to write the
+    cache is not fatal.
+    """
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cached, f)
+    except OSError as e:
+        print(f"failed caching indices to {CACHE_FILE}: {e}")
+
+
+def formula_to_expr(formula: str, bands: list[str]) -> str:
+    """
+    Convert an index formula to a Python expression that can be emitted
+    directly in the generated code, with the bands referring to the
+    respective ``__init__`` parameters; this way the generated classes do not
+    need to ``eval`` the formula at runtime.
+
+    :param formula: the index formula, e.g. ``"(N - R)/(N + R)"``
+    :param bands: the bands / constants allowed in the formula, e.g. ``['N', 'R']``
+    :return: the normalized Python expression, e.g. ``"(N - R) / (N + R)"``
+    :raise ValueError: if the formula is not a valid Python expression, or
+        refers to names which are not in ``bands``.
+    """
+    try:
+        tree = ast.parse(formula, mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Invalid formula {formula}: {e}") from e
+    names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    unknown = names.difference(bands)
+    if unknown:
+        raise ValueError(f"Formula {formula} refers to unknown bands: {sorted(unknown)}")
+    return ast.unparse(tree)
+
+
+def render_class(short_name: str, details: dict) -> str:
+    """
+    Render the Python class for a single spectral index.
+
+    :param short_name: the index name, used as the class name
+    :param details: a dict with index details, as returned by :meth:`load_indices`
+    :return: the class source code
+    """
+    (index_name, long_name, bands, formula,
+     platforms, reference, contributor) = _get_index_details(details)
+    return CLASS_TEMPLATE.format(
+        class_name=short_name,
+        short_name=index_name,
+        long_name=long_name,
+        bands=bands,
+        formula=formula,
+        platforms=platforms,
+        reference=reference,
+        contributor=contributor,
+        slots=repr(tuple(bands)),
+        band_params=', '.join(band + ': OperandType' for band in bands),
+        formula_expr=formula_to_expr(formula, bands),
+        band_assignments=''.join(f'    self.{band} = {band}\n' for band in bands))
+
+
+def generate_spectral_py(indices, filename='spectral.py', workers=None):
+    """
+    Given a dict returned by :meth:`load_indices`, or any iterable of
+    (index name, index details) pairs, generate a Python files with
+    classes for each index, e.g:
 
     .. code:: python
 
         class NDVI(WCPSExpr):
+          __slots__ = ('N', 'R')
           short_name = "NDVI"
           long_name = "Normalized Difference Vegetation Index"
           bands = ['N', 'R']
@@ -64,15 +225,20 @@ def generate_spectral_py(indices, filename='spectral.py'):
           contributor = "https://github.com/davemlz"
 
           def __init__(self, N: OperandType, R: OperandType):
-            super().__init__(operands=['N', 'R'])
+            super().__init__(operands=[(N - R) / (N + R)])
             self.N = N
             self.R = R
 
-          def __str__(self):
-            return str(eval(self.formula, {}, {"N": self.N, "R": self.R}))
+          def _parts(self):
+            return (self.operands[0],)
 
-    :param indices: a dict of index name -> dict with index details
+    :param indices: a dict of index name -> dict with index details, or an
+        iterable of (index name, dict with index details) pairs; it is consumed
+        only once, one index at a time
     :param filename: the Python filename in which the output will be saved
+    :param workers: if more than 1, render the classes in parallel with this
+        many worker processes; by default they are rendered sequentially, as
+        process start-up outweighs the rendering time for a few hundred indices
     """
 
     # get absolute filepath in the wcps dir
@@ -81,51 +247,25 @@ def generate_spectral_py(indices, filename='spectral.py'):
 
     print(f"generating {filepath}")
 
-    with open(filepath, 'w') as f:
-        f.write('"""\n'
-                'Python classes for spectral indices generated from a standardized list curated at\n'
-                'https://awesome-ee-spectral-indices.readthedocs.io. Each class can be instantiated\n'
-                'with :class:`wcps.model.OperandType` arguments for the respective bands / constants.\n'
-                'Example for applying the NDVI index on red/nir Sentinel-2 bands:\n\n'
-                '.. code:: python\n\n'
-                '  from wcps.model import Datacube\n'
-                '  from wcps.spectral import NDVI\n\n'
-                '  red = Datacube("S2_L2A_32631_B04_10m")\n'
-                '  nir = Datacube("S2_L2A_32631_B08_10m")\n'
-                '  ndvi = NDVI(N=nir, R=red)\n'
-                '  query = ndvi.encode("PNG")\n'
-                '"""\n\n')
-        f.write('# generated with bin/generate_spectral.py, do not edit manually.\n\n')
-
-        f.write("from wcps.model import WCPSExpr, OperandType\n\n")
-
-        for short_name, details in indices.items():
-            class_name = short_name  # Using the key as the class name
-            bands = details['bands']
-
-            f.write(f'class {class_name}(WCPSExpr):\n')
-            f.write(f'  """{details["long_name"]}"""\n')
-            f.write(f'  short_name = "{details["short_name"]}"\n')
-            f.write(f'  long_name = "{details["long_name"]}"\n')
-            f.write(f'  bands = {details["bands"]}\n')
-            f.write(f'  formula = "{details["formula"]}"\n')
-            f.write(f'  platforms = {details["platforms"]}\n')
-            f.write(f'  reference = "{details["reference"]}"\n')
-            f.write(f'  contributor = "{details["contributor"]}"\n\n')
-
-            band_params = ', '.join([band + ': OperandType' for band in bands])
-            eval_params = ', '.join([f'"{band}": {band}' for band in bands])
-            f.write(f'  def __init__(self, {band_params}):\n')
-            f.write(f'    super().__init__(operands=[eval(self.formula, {{}}, {{{eval_params}}})])\n')
-            for band in bands:
-                f.write(f'    self.{band} = {band}\n')
-            f.write('\n')
-
-            f.write('  def __str__(self):\n')
-            f.write('    return super().__str__() + str(self.operands[0])\n')
-            f.write('\n\n')
+    if isinstance(indices, dict):
+        indices = indices.items()
+    parallel = workers is not None and workers > 1
+    if parallel:
+        indices = list(indices)
+    # the module text is built in memory, and written to the file at once at the end
+    buf = io.StringIO()
+    buf.write(MODULE_HEADER)
+    if parallel and len(indices) >= MIN_PARALLEL_INDICES:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            buf.writelines(executor.map(render_class, *zip(*indices), chunksize=16))
+    else:
+        for short_name, details in indices:
+            buf.write(render_class(short_name, details))
+
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(buf.getvalue())
 
     print(f"done generating {filepath}")
 
 if __name__ == '__main__':
-    generate_spectral_py(load_indices())
+    generate_spectral_py(load_indices().items())
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for the tests.
+"""
+
+import pytest
+
+from wcps.model import Datacube
+
+
+@pytest.fixture(scope="module")
+def cov1():
+    return Datacube("cov1")
+
+
+@pytest.fixture(scope="module")
+def cov2():
+    return Datacube("cov2")
+
+
+@pytest.fixture(scope="module")
+def cov3():
+    return Datacube("cov3")
+
+
+@pytest.fixture(scope="module")
+def cov4():
+    return Datacube("cov4")
@@ -1,25 +1,22 @@
+import copy
 import math
+import pickle
 
 import pytest
 
-from wcps.model import (Datacube, Exp, Log, Ln, Sqrt, Pow, Sin, Cos, Tan,
+from wcps.model import (Exp, Log, Ln, Sqrt, Pow, Sin, Cos, Tan,
                         Sinh, Cosh, Tanh, ArcSin, ArcCos, ArcTan, ArcTan2, And,
                         Or, Xor, Not, Overlay, Bit, Band, MultiBand, Axis, Extend, Scale,
                         Reproject, ResampleAlg, Cast, CastType, Sum, Avg, Count, Min, Max,
                         All, Some, AxisIter, Condense, CondenseOp, Coverage, Switch, Encode,
-                        Clip, WCPSClientException)
+                        Clip, Datacube, Scalar, WCPSClientException)
 
-cov1 = Datacube("cov1")
-cov2 = Datacube("cov2")
-cov3 = Datacube("cov3")
-cov4 = Datacube("cov4")
 
-
-def test_arithmetic():
+def test_arithmetic(cov1, cov2):
     assert str(cov1 + cov2) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 + $cov2)"
     assert str(cov1 + 1) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + 1)"
     assert str(1 + cov1) == "for $cov1 in (cov1)\nreturn\n  (1 + $cov1)"
-    assert str(1 + cov1 + 2) == "for $cov1 in (cov1)\nreturn\n  ((1 + $cov1) + 2)"
+    assert str(1 + cov1 + 2) == "for $cov1 in (cov1)\nreturn\n  (1 + $cov1 + 2)"
     assert str(cov1 - cov2) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 - $cov2)"
     assert str(2 - cov2) == "for $cov2 in (cov2)\nreturn\n  (2 - $cov2)"
     assert str(cov1 * cov2) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 * $cov2)"
@@ -31,7 +28,7 @@ def test_arithmetic():
     assert str(math.ceil(cov1)) == "for $cov1 in (cov1)\nreturn\n  ceil($cov1)"
 
 
-def test_exponential():
+def test_exponential(cov1, cov2):
     assert str(Exp(cov1)) == "for $cov1 in (cov1)\nreturn\n  exp($cov1)"
     assert str(Log(cov1)) == "for $cov1 in (cov1)\nreturn\n  log($cov1)"
     assert str(Ln(cov1)) == "for $cov1 in (cov1)\nreturn\n  ln($cov1)"
@@ -41,7 +38,7 @@ def test_exponential():
     assert str(Pow(2, cov1)) == "for $cov1 in (cov1)\nreturn\n  pow(2, $cov1)"
 
 
-def test_trigonometric():
+def test_trigonometric(cov1):
     assert str(Sin(cov1)) == "for $cov1 in (cov1)\nreturn\n  sin($cov1)"
     assert str(cov1 + Sin(2)) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + sin(2))"
     assert str(Cos(cov1)) == "for $cov1 in (cov1)\nreturn\n  cos($cov1)"
@@ -55,7 +52,7 @@ def test_trigonometric():
     assert str(ArcTan2(cov1)) == "for $cov1 in (cov1)\nreturn\n  arctan2($cov1)"
 
 
-def test_comparison():
+def test_comparison(cov1, cov2):
     assert str(cov1 > cov2) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 > $cov2)"
     assert str(cov1 > 1) == "for $cov1 in (cov1)\nreturn\n  ($cov1 > 1)"
     assert str(1 < cov1) == "for $cov1 in (cov1)\nreturn\n  ($cov1 > 1)"
@@ -66,7 +63,7 @@ def test_comparison():
     assert str(cov1 != cov2) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 != $cov2)"
 
 
-def test_logical():
+def test_logical(cov1, cov2):
     assert str(And(cov1, cov2)) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 and $cov2)"
     assert str(Or(cov1, cov2)) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 or $cov2)"
     assert str(Xor(cov1, cov2)) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 xor $cov2)"
@@ -75,7 +72,7 @@ def test_logical():
     assert str(Bit(cov1, 2)) == "for $cov1 in (cov1)\nreturn\n  bit($cov1, 2)"
 
 
-def test_multiband():
+def test_multiband(cov1, cov2):
     assert str(Band(cov1, 2)) == "for $cov1 in (cov1)\nreturn\n  $cov1.2"
     assert str(Band(cov1, "red")) == "for $cov1 in (cov1)\nreturn\n  $cov1.red"
     assert str(MultiBand({"red": cov1, "blue": cov2})) == \
@@ -84,7 +81,7 @@ def test_multiband():
            'for $cov1 in (cov1)\nreturn\n  {red: $cov1; blue: 2}'
 
 
-def test_subsetting():
+def test_subsetting(cov1):
     assert str(Axis("X", 15, crs="EPSG:4326")) == 'X:"EPSG:4326"(15)'
     assert str(Axis("X", 15.0, 30.0)) == 'X(15.0:30.0)'
     assert str(Axis("X", 15.0, 30.0, crs="EPSG:4326")) == 'X:"EPSG:4326"(15.0:30.0)'
@@ -105,12 +102,12 @@ def test_subsetting():
            'for $cov1 in (cov1)\nreturn\n  $cov1[X(15.0:30.0), Y:"EPSG:4326"(15.0:30.0)]'
 
 
-def test_extend():
+def test_extend(cov1):
     assert str(Extend(cov1, [("X", 15.0, 30.0), ("Y", 15.0, 30.0, 'EPSG:4326')])) == \
            'for $cov1 in (cov1)\nreturn\n  extend($cov1, { X(15.0:30.0), Y:"EPSG:4326"(15.0:30.0) })'
 
 
-def test_scale():
+def test_scale(cov1, cov2):
     assert str(Scale(cov1).to_explicit_grid_domain([("X", 15, 30), ("Y", 20, 40)])) == \
            'for $cov1 in (cov1)\nreturn\n  scale($cov1, { X(15:30), Y(20:40) })'
     assert str(Scale(cov1).to_grid_domain_of(cov2)) == \
@@ -119,9 +116,13 @@ def test_scale():
            'for $cov1 in (cov1)\nreturn\n  scale($cov1, 2.0)'
     assert str(Scale(cov1).by_factor_per_axis([("X", 1.5), ("Y", 2)])) == \
            'for $cov1 in (cov1)\nreturn\n  scale($cov1, { X(1.5), Y(2) })'
+    scale = Scale(cov1).by_factor(2.0)
+    with pytest.raises(WCPSClientException, match="Cannot set multiple scale specifications"):
+        scale.to_grid_domain_of(cov2)
+    assert str(scale) == 'for $cov1 in (cov1)\nreturn\n  scale($cov1, 2.0)'
 
 
-def test_reproject():
+def test_reproject(cov1, cov2):
     assert str(Reproject(cov1, "EPSG:4326", ResampleAlg.AVERAGE)) == \
            'for $cov1 in (cov1)\nreturn\n  crsTransform($cov1, "EPSG:4326", { average })'
     assert str(Reproject(cov1, "EPSG:4326").subset_by_coverage_domain(cov2)) == \
@@ -130,14 +131,54 @@ def test_reproject():
            'for $cov1 in (cov1)\nreturn\n  crsTransform($cov1, "EPSG:4326", { average }, { X:1.5, Y:2 })'
     assert str(Reproject(cov1, "EPSG:4326").subset_by_axes([("X", 1.5, 2.5), ("Y", 2, 4)])) == \
            'for $cov1 in (cov1)\nreturn\n  crsTransform($cov1, "EPSG:4326", { X(1.5:2.5), Y(2:4) })'
-
-
-def test_cast():
+    assert str(cov1.reproject("EPSG:4326", axis_resolutions=[("X", 1.5)], domain_of_coverage=cov2)) == \
+           ('for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  '
+            'crsTransform($cov1, "EPSG:4326", { X:1.5 }, { domain($cov2) })')
+    with pytest.raises(WCPSClientException):
+        cov1.reproject("EPSG:4326", axis_subsets=[("X", 1.5, 2.5)], domain_of_coverage=cov2)
+    assert str(Reproject(cov1, "EPSG:4326", " near ")) == \
+           'for $cov1 in (cov1)\nreturn\n  crsTransform($cov1, "EPSG:4326", { near })'
+    with pytest.raises(WCPSClientException, match="expected one of: near, bilinear,"):
+        Reproject(cov1, "EPSG:4326", "nearest")
+    reproject = Reproject(cov1, "EPSG:4326")
+    with pytest.raises(WCPSClientException, match="must include both lower and upper bounds"):
+        reproject.subset_by_axes([("X", 1.5, 2.5), ("Y", 2)])
+    assert reproject.axis_subsets is None
+    assert str(reproject) == 'for $cov1 in (cov1)\nreturn\n  crsTransform($cov1, "EPSG:4326")'
+    # identity reprojection of an already reprojected coverage
+    reprojected = Reproject(cov1, "EPSG:4326")
+    assert str(Reproject(reprojected, "http://localhost:8080/rasdaman/def/crs/EPSG/0/4326")) == \
+           'for $cov1 in (cov1)\nreturn\n  crsTransform($cov1, "EPSG:4326")'
+    assert str(Reproject(reprojected, "EPSG/0/4326").subset_by_axes([("X", 1.5, 2.5)])) == \
+           ('for $cov1 in (cov1)\nreturn\n  '
+            'crsTransform(crsTransform($cov1, "EPSG:4326"), "EPSG/0/4326", { X(1.5:2.5) })')
+    assert str(Reproject(reprojected, "EPSG:32633")) == \
+           'for $cov1 in (cov1)\nreturn\n  crsTransform(crsTransform($cov1, "EPSG:4326"), "EPSG:32633")'
+    identity = Reproject(reprojected, "EPSG:4326")
+    assert str(identity) == 'for $cov1 in (cov1)\nreturn\n  crsTransform($cov1, "EPSG:4326")'
+    identity.target_crs = "EPSG:32633"
+    assert str(identity) == \
+           'for $cov1 in (cov1)\nreturn\n  crsTransform(crsTransform($cov1, "EPSG:4326"), "EPSG:32633")'
+    # compound CRSs are not compared by their last component
+    compound = ("http://localhost:8080/rasdaman/def/crs-compound?"
+                "1=http://localhost:8080/rasdaman/def/crs/EPSG/0/4326&"
+                "2=http://localhost:8080/rasdaman/def/crs/OGC/0/AnsiDate")
+    ansi_date = "http://localhost:8080/rasdaman/def/crs/OGC/0/AnsiDate"
+    assert str(Reproject(Reproject(cov1, compound), ansi_date)) == \
+           f'for $cov1 in (cov1)\nreturn\n  crsTransform(crsTransform($cov1, "{compound}"), "{ansi_date}")'
+
+
+def test_cast(cov1):
     assert str(Cast(cov1, CastType.INT)) == "for $cov1 in (cov1)\nreturn\n  ((int) $cov1)"
     assert str(Cast(cov1, CastType.UNSIGNED_CHAR)) == "for $cov1 in (cov1)\nreturn\n  ((unsigned char) $cov1)"
+    cast = Cast(cov1).to(CastType.FLOAT)
+    assert type(cast.target_type) is str  # pylint: disable=unidiomatic-typecheck
+    assert str(cast) == "for $cov1 in (cov1)\nreturn\n  ((float) $cov1)"
+    with pytest.raises(WCPSClientException):
+        cast.to("double precision")
 
 
-def test_reduce():
+def test_reduce(cov1):
     assert str(Sum(cov1)) == "for $cov1 in (cov1)\nreturn\n  sum($cov1)"
     assert str(Avg(cov1)) == "for $cov1 in (cov1)\nreturn\n  avg($cov1)"
     assert str(Count(cov1)) == "for $cov1 in (cov1)\nreturn\n  count($cov1)"
@@ -147,7 +188,7 @@ def test_reduce():
     assert str(Some(cov1)) == "for $cov1 in (cov1)\nreturn\n  some($cov1)"
 
 
-def test_condense():
+def test_condense(cov1):
     pt_var = AxisIter('$pt', 'time').of_grid_axis(cov1)
     pt_ref = pt_var.ref()
     assert str(Condense(CondenseOp.PLUS).over(pt_var).using(cov1 + pt_ref)) == \
@@ -162,26 +203,49 @@ def test_condense():
            ("for $cov1 in (cov1)\nreturn\n  "
             "(condense * over $pt time(imageCrsDomain($cov1, time)), $px X(domain($cov1, X)) "
             "using ($cov1[time($pt)] * $px))")
+    assert str(Condense(CondenseOp.PLUS, over=pt_var, using=cov1[('time', pt_ref)])) == \
+           ("for $cov1 in (cov1)\nreturn\n  "
+            "(condense + over $pt time(imageCrsDomain($cov1, time)) using $cov1[time($pt)])")
+    with pytest.raises(WCPSClientException, match="Duplicate iterator variable name"):
+        Condense(CondenseOp.PLUS, over=[pt_var]).over(px_var).over(AxisIter('$px', 'Y'))
+    # a rejected batch of iterator variables does not reserve its names
+    condense = Condense(CondenseOp.PLUS, over=[pt_var])
+    with pytest.raises(WCPSClientException, match="Duplicate iterator variable name"):
+        condense.over([px_var, AxisIter('$pt', 'Y')])
+    condense.over(px_var)
+    assert condense.iter_vars == [pt_var, px_var]
+    # reassigning iter_vars releases the names of the replaced iterator variables
+    condense.iter_vars = [px_var]
+    condense.over(pt_var)
+    assert condense.iter_vars == [px_var, pt_var]
 
 
 # -------------------------------------------------------------------------------------
 # Coverage
 
-def test_coverage_of_geo_axis():
+EXPECTED_COVERAGE_OF_GEO_AXIS = ("for $cov1 in (cov1)\nreturn\n  ("
+                                 "coverage targetCoverage "
+                                 "over $pLat Lat(domain($cov1[Lat(-30:-28.5)], Lat)), "
+                                 "$pLon Lon(domain($cov1[Lon(111.975:113.475)], Lon)) "
+                                 "values $cov1[Lat($pLat), Lon($pLon)])")
+
+EXPECTED_COVERAGE_WITH_INTERVAL_AND_PARAMS = (
+    'for $cov1 in (cov1)\nreturn\n  '
+    'encode((coverage intervalCoverage over $pt time(0 : 10) values $cov1[time($pt)]), '
+    '"GTiff", "{ \\"configOptions\\": { \\"GDAL_CACHEMAX\\": \\"64\\" } }")'
+)
+
+
+def test_coverage_of_geo_axis(cov1):
     plat_var = AxisIter('$pLat', 'Lat').of_geo_axis(cov1['Lat', -30, -28.5])
     plon_var = AxisIter('$pLon', 'Lon').of_geo_axis(cov1['Lon', 111.975, 113.475])
     cov_expr = (Coverage('targetCoverage')
                 .over(plat_var).over(plon_var)
                 .values(cov1[('Lat', plat_var.ref()), ('Lon', plon_var.ref())]))
-    assert (str(cov_expr) ==
-            "for $cov1 in (cov1)\nreturn\n  ("
-            "coverage targetCoverage "
-            "over $pLat Lat(domain($cov1[Lat(-30:-28.5)], Lat)), "
-            "$pLon Lon(domain($cov1[Lon(111.975:113.475)], Lon)) "
-            "values $cov1[Lat($pLat), Lon($pLon)])")
+    assert str(cov_expr) == EXPECTED_COVERAGE_OF_GEO_AXIS
 
 
-def test_coverage_with_interval():
+def test_coverage_with_interval(cov1):
     time_var = AxisIter('$pt', 'time').interval(0, 10)
     cov_expr = (Coverage('intervalCoverage')
                 .over(time_var)
@@ -193,7 +257,7 @@ def test_coverage_with_interval():
     )
 
 
-def test_coverage_with_interval_and_params():
+def test_coverage_with_interval_and_params(cov1):
     time_var = AxisIter('$pt', 'time').interval(0, 10)
 
     # Create a Coverage expression with additional parameters
@@ -202,21 +266,24 @@ def test_coverage_with_interval_and_params():
                  .values(cov1['time', time_var.ref()]))
                 .encode('GTiff')
                 .params('{ "configOptions": { "GDAL_CACHEMAX": "64" } }'))
-    expected_query = (
-        'for $cov1 in (cov1)\nreturn\n  '
-        'encode((coverage intervalCoverage over $pt time(0 : 10) values $cov1[time($pt)]), '
-        '"GTiff", "{ \\"configOptions\\": { \\"GDAL_CACHEMAX\\": \\"64\\" } }")'
-    )
 
-    assert str(cov_expr) == expected_query
+    assert str(cov_expr) == EXPECTED_COVERAGE_WITH_INTERVAL_AND_PARAMS
+
+
+def test_coverage_over_list_not_mutated(cov1):
+    time_var = AxisIter('$pt', 'time').interval(0, 10)
+    over = [time_var]
+    cov_expr = Coverage('intervalCoverage', over=over).over(AxisIter('$px', 'X').interval(0, 5))
+    assert over == [time_var]
+    assert len(cov_expr.iter_vars) == 2
 
 
-def test_coverage_no_axes():
+def test_coverage_no_axes(cov1):
     with pytest.raises(WCPSClientException):
         str(Coverage('noAxesCoverage').values(cov1))
 
 
-def test_coverage_no_values():
+def test_coverage_no_values(cov1):
     lat_var = AxisIter('$pLat', 'Lat').of_geo_axis(cov1['Lat', -30, -28.5])
     with pytest.raises(WCPSClientException):
         str(Coverage('noValuesCoverage').over(lat_var))
@@ -224,7 +291,7 @@ def test_coverage_no_values():
 # -------------------------------------------------------------------------------------
 # Clip
 
-def test_clip_linestring1():
+def test_clip_linestring1(cov1):
     wkt_linestring = ('LINESTRING("2008-01-01T02:01:20.000Z" 75042.7273594 5094865.55794,'
                       ' "2008-01-08T00:02:58.000Z" 705042.727359 5454865.55794)')
     clip_expr = Clip(cov1, wkt_linestring)
@@ -234,7 +301,7 @@ def test_clip_linestring1():
     assert str(clip_expr) == expected_query
 
 
-def test_clip_invalid_wkt():
+def test_clip_invalid_wkt(cov1):
     invalid_wkt = "INVALID_WKT"
     with pytest.raises(WCPSClientException, match="WKT does not contain a valid geometry type"):
         Clip(cov1, invalid_wkt)
@@ -242,25 +309,27 @@ def test_clip_invalid_wkt():
 # -------------------------------------------------------------------------------------
 # Encode
 
-def test_encode():
+def test_encode(cov1):
     assert str(Encode(cov1, "PNG")) == 'for $cov1 in (cov1)\nreturn\n  encode($cov1, "PNG")'
     assert str(Encode(cov1, "PNG", "params")) == \
            'for $cov1 in (cov1)\nreturn\n  encode($cov1, "PNG", "params")'
 
 
-def test_encode_to_png():
+def test_encode_to_png(cov1):
     encode_expr = Encode(cov1, "PNG")
     expected_query = "for $cov1 in (cov1)\nreturn\n  encode($cov1, \"PNG\")"
     assert str(encode_expr) == expected_query
 
 
-def test_encode_with_params():
+EXPECTED_ENCODE_WITH_PARAMS = 'for $cov1 in (cov1)\nreturn\n  encode($cov1, "PNG", "{\\"compression\\":\\"lzw\\"}")'
+
+
+def test_encode_with_params(cov1):
     encode_expr = Encode(cov1, "PNG").params('{"compression":"lzw"}')
-    expected_query = 'for $cov1 in (cov1)\nreturn\n  encode($cov1, "PNG", "{\\"compression\\":\\"lzw\\"}")'
-    assert str(encode_expr) == expected_query
+    assert str(encode_expr) == EXPECTED_ENCODE_WITH_PARAMS
 
 
-def test_encode_no_format():
+def test_encode_no_format(cov1):
     with pytest.raises(WCPSClientException):
         str(Encode(cov1))
 
@@ -268,81 +337,251 @@ def test_encode_no_format():
 # -------------------------------------------------------------------------------------
 # Switch
 
-def test_switch():
-    assert str(Switch().case(cov1 > 5).then(cov2).default(cov1)) == \
-           ('for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  '
-            '(switch case ($cov1 > 5) return $cov2 default return $cov1)')
-
-
-def test_switch_no_default():
+SWITCH_CASES = [
+    pytest.param(
+        lambda cov1, cov2, cov3, cov4: Switch().case(cov1 > 5).then(cov2).default(cov1),
+        'for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  '
+        '(switch case ($cov1 > 5) return $cov2 default return $cov1)',
+        id="single_case"),
+    pytest.param(
+        lambda cov1, cov2, cov3, cov4: (Switch()
+                                        .case(cov1 > 5).then(cov2)
+                                        .case(cov1 < 3).then(cov3)
+                                        .default(cov1)),
+        "for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3)\n"
+        "return\n  (switch "
+        "case ($cov1 > 5) return $cov2 "
+        "case ($cov1 < 3) return $cov3 "
+        "default return $cov1)",
+        id="multiple_cases"),
+    pytest.param(
+        lambda cov1, cov2, cov3, cov4: (Switch()
+                                        .case(cov1 > 5)
+                                        .then(Switch()
+                                              .case(cov2 > 10)
+                                              .then(cov3)
+                                              .default(cov4))
+                                        .default(cov1)),
+        "for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3), $cov4 in (cov4)\n"
+        "return\n  "
+        "(switch case ($cov1 > 5) return "
+        "(switch case ($cov2 > 10) return $cov3 default return $cov4) "
+        "default return $cov1)",
+        id="nested_switch"),
+    pytest.param(
+        lambda cov1, cov2, cov3, cov4: Switch().case(5).then(cov1).default(cov2),
+        "for $cov1 in (cov1), $cov2 in (cov2)\n"
+        "return\n  (switch "
+        "case 5 return $cov1 "
+        "default return $cov2)",
+        id="scalar_case"),
+    pytest.param(
+        lambda cov1, cov2, cov3, cov4: Switch().case(cov1).then(5).default(cov2),
+        "for $cov1 in (cov1), $cov2 in (cov2)\n"
+        "return\n  (switch "
+        "case $cov1 return 5 "
+        "default return $cov2)",
+        id="scalar_then"),
+    pytest.param(
+        lambda cov1, cov2, cov3, cov4: Switch().case(cov1).then(cov2).default(5),
+        "for $cov1 in (cov1), $cov2 in (cov2)\n"
+        "return\n  (switch "
+        "case $cov1 return $cov2 "
+        "default return 5)",
+        id="scalar_default"),
+]
+"""Switch expression factories, taking the test datacubes, and the expected queries."""
+
+
+@pytest.mark.parametrize("factory, expected", SWITCH_CASES)
+def test_switch(factory, expected, cov1, cov2, cov3, cov4):
+    assert str(factory(cov1, cov2, cov3, cov4)) == expected
+
+
+def test_switch_no_default(cov1, cov2):
     # Creating a Switch expression without a default case should raise an exception
     with pytest.raises(WCPSClientException):
         str(Switch().case(cov1 > 5).then(cov2))
 
 
-def test_switch_multiple_cases():
-    switch_expr = (Switch()
-                   .case(cov1 > 5).then(cov2)
-                   .case(cov1 < 3).then(cov3)
-                   .default(cov1))
-    expected_query = ("for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3)\n"
-                      "return\n  (switch "
-                      "case ($cov1 > 5) return $cov2 "
-                      "case ($cov1 < 3) return $cov3 "
-                      "default return $cov1)")
-    assert str(switch_expr) == expected_query
-
-
-def test_switch_invalid_order():
+def test_switch_invalid_order(cov1):
     with pytest.raises(WCPSClientException):
         Switch().default(cov1).case(cov1 > 5).then(cov1)
+    with pytest.raises(WCPSClientException):
+        Switch().case(cov1 > 5).default(cov1)
+    with pytest.raises(WCPSClientException):
+        Switch().case(cov1 > 5).then(cov1).default(cov1).case(cov1 > 6)
 
 
-def test_nested_switch_expression():
-    switch_expr = (Switch()
-                   .case(cov1 > 5)
-                   .then(Switch()
-                         .case(cov2 > 10)
-                         .then(cov3)
-                         .default(cov4))
-                   .default(cov1))
-    expected_query = ("for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3), $cov4 in (cov4)\n"
-                      "return\n  "
-                      "(switch case ($cov1 > 5) return "
-                      "(switch case ($cov2 > 10) return $cov3 default return $cov4) "
-                      "default return $cov1)")
-    assert str(switch_expr) == expected_query
-
-
-def test_nested_switch_invalid_default_order():
+def test_nested_switch_invalid_default_order(cov1, cov2):
     with pytest.raises(WCPSClientException):
         Switch().case(cov1 > 5).then(
             Switch().default(cov2).case(cov1 < 3).then(cov2)
         ).default(cov1)
 
 
-def test_scalar_case_input():
-    switch_expr = Switch().case(5).then(cov1).default(cov2)
-    expected_query = ("for $cov1 in (cov1), $cov2 in (cov2)\n"
-                      "return\n  (switch "
-                      "case 5 return $cov1 "
-                      "default return $cov2)")
-    assert str(switch_expr) == expected_query
+def test_cached_str(cov1, cov2):
+    expr = cov1 + cov2
+    assert str(expr) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 + $cov2)"
+    assert str(expr) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  ($cov1 + $cov2)"
+    assert str(expr * 2) == "for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  (($cov1 + $cov2) * 2)"
+
 
+def test_cached_str_invalidated_on_change(cov1):
+    cast = Cast(cov1, CastType.CHAR)
+    query = Encode(cast, "PNG")
+    assert str(query) == 'for $cov1 in (cov1)\nreturn\n  encode(((char) $cov1), "PNG")'
+    cast.to(CastType.FLOAT)
+    assert str(query) == 'for $cov1 in (cov1)\nreturn\n  encode(((float) $cov1), "PNG")'
+    query.params("{}")
+    assert str(query) == 'for $cov1 in (cov1)\nreturn\n  encode(((float) $cov1), "PNG", "{}")'
 
-def test_scalar_then_input():
-    switch_expr = Switch().case(cov1).then(5).default(cov2)
-    expected_query = ("for $cov1 in (cov1), $cov2 in (cov2)\n"
-                      "return\n  (switch "
-                      "case $cov1 return 5 "
-                      "default return $cov2)")
-    assert str(switch_expr) == expected_query
 
+def test_cached_str_invalidated_on_format_params_assignment(cov1):
+    query = Encode(cov1 + 1, "PNG")
+    assert str(query) == 'for $cov1 in (cov1)\nreturn\n  encode(($cov1 + 1), "PNG")'
+    query.format_params = '{"a":1}'
+    assert str(query) == 'for $cov1 in (cov1)\nreturn\n  encode(($cov1 + 1), "PNG", "{\\"a\\":1}")'
 
-def test_scalar_default_input():
-    switch_expr = Switch().case(cov1).then(cov2).default(5)
-    expected_query = ("for $cov1 in (cov1), $cov2 in (cov2)\n"
-                      "return\n  (switch "
-                      "case $cov1 return $cov2 "
-                      "default return 5)")
-    assert str(switch_expr) == expected_query
+
+def test_cached_str_invalidated_on_datacube_rename():
+    cube = Datacube("a")
+    expr = (cube + 1) * 2
+    assert str(expr) == "for $a in (a)\nreturn\n  (($a + 1) * 2)"
+    cube.name = "b"
+    assert str(expr) == "for $b in (b)\nreturn\n  (($b + 1) * 2)"
+
+
+def test_cached_str_invalidated_on_attribute_assignment(cov1):
+    query = Encode(cov1 + 1, "PNG")
+    assert str(query) == 'for $cov1 in (cov1)\nreturn\n  encode(($cov1 + 1), "PNG")'
+    query.data_format = "JPEG"
+    assert str(query) == 'for $cov1 in (cov1)\nreturn\n  encode(($cov1 + 1), "JPEG")'
+
+    cast = Cast(cov1, CastType.CHAR)
+    reproject = Reproject(cast, "EPSG:4326")
+    assert str(reproject) == 'for $cov1 in (cov1)\nreturn\n  crsTransform(((char) $cov1), "EPSG:4326")'
+    cast.target_type = CastType.FLOAT.value
+    reproject.target_crs = "EPSG:32633"
+    assert str(reproject) == 'for $cov1 in (cov1)\nreturn\n  crsTransform(((float) $cov1), "EPSG:32633")'
+
+    subset = cov1[Axis("X", 0, 10)]
+    assert str(subset) == 'for $cov1 in (cov1)\nreturn\n  $cov1[X(0:10)]'
+    subset.operands[1].high = 20
+    assert str(subset) == 'for $cov1 in (cov1)\nreturn\n  $cov1[X(0:20)]'
+
+    with pytest.raises(AttributeError):
+        Scalar(5).op = 6
+
+
+def test_cached_prelude_invalidated_on_change(cov1, cov2):
+    switch = Switch().case(cov1 > 0).then(cov1)
+    query = Encode(switch, "PNG")
+    with pytest.raises(WCPSClientException):
+        str(query)
+    switch.default(cov2)
+    assert str(query) == ('for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  '
+                          'encode((switch case ($cov1 > 0) return $cov1 default return $cov2), "PNG")')
+    assert str(query) == ('for $cov1 in (cov1), $cov2 in (cov2)\nreturn\n  '
+                          'encode((switch case ($cov1 > 0) return $cov1 default return $cov2), "PNG")')
+
+
+def test_cached_datacube_operands_invalidated_on_change(cov1, cov2):
+    switch = Switch().case(cov1 > 0).then(cov1)
+    query = Encode(switch, "PNG")
+    assert query.get_datacube_operands() == [cov1]
+    query.get_datacube_operands().append(cov2)
+    assert query.get_datacube_operands() == [cov1]
+    switch.default(cov2)
+    assert query.get_datacube_operands() == [cov1, cov2]
+
+
+def test_no_instance_dict(cov1):
+    expr = Encode(Switch().case(cov1[("X", 0, 10)] > 0).then(Sum(cov1 + 1)).default(cov1), "PNG")
+    nodes = [expr]
+    while nodes:
+        node = nodes.pop()
+        assert type(node).__dictoffset__ == 0, type(node).__name__
+        nodes.extend(node.operands)
+
+
+def test_add_operand_fixed_operands(cov1, cov2):
+    for expr in (Not(cov1), Sqrt(cov1), Axis("X", 0, 10)):
+        with pytest.raises(WCPSClientException, match="fixed number of operands"):
+            expr.add_operand(cov2)
+        with pytest.raises(WCPSClientException, match="fixed number of operands"):
+            expr.add_operands([cov2])
+        assert len(expr.operands) == (2 if isinstance(expr, Axis) else 1)
+
+
+def test_band_getattr_private_name(cov1):
+    with pytest.raises(AttributeError):
+        getattr(cov1, "_red")
+    with pytest.raises(AttributeError):
+        getattr(cov1, "shape")
+    assert str(cov1.band("shape")) == "for $cov1 in (cov1)\nreturn\n  $cov1.shape"
+    assert str(cov1.band("_red")) == "for $cov1 in (cov1)\nreturn\n  $cov1._red"
+    expr = (cov1.red + 1).encode("PNG")
+    assert str(copy.deepcopy(expr)) == str(expr)
+    assert str(pickle.loads(pickle.dumps(expr))) == str(expr)
+
+
+def test_constant_folding(cov1):
+    assert str(cov1 + (Scalar(2) * 3)) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + 6)"
+    assert str(cov1 * (1 + Scalar(0.5))) == "for $cov1 in (cov1)\nreturn\n  ($cov1 * 1.5)"
+    assert str(cov1 + Scalar(2) ** 3) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + 8.0)"
+    assert str(cov1 + Scalar(7) % 4) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + 3)"
+    # not folded
+    assert str(cov1 + Scalar(-7) % 4) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + mod(-7, 4))"
+    assert str(cov1 + Scalar(1) / 0) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + (1 / 0))"
+    assert str(cov1 + Scalar(True) * 2) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + (True * 2))"
+    assert str(cov1 * 2.5 * 3) == "for $cov1 in (cov1)\nreturn\n  ($cov1 * 2.5 * 3)"
+    assert str(cov1 - 2 - 3) == "for $cov1 in (cov1)\nreturn\n  (($cov1 - 2) - 3)"
+    # integer constants ending an associative chain
+    assert str(cov1 * 2 * 3) == "for $cov1 in (cov1)\nreturn\n  ($cov1 * 6)"
+    assert str(1 + cov1 + 2 + 3) == "for $cov1 in (cov1)\nreturn\n  (1 + $cov1 + 5)"
+    expr = cov1 * 2
+    assert str(expr * 3) == "for $cov1 in (cov1)\nreturn\n  ($cov1 * 6)"
+    assert str(expr) == "for $cov1 in (cov1)\nreturn\n  ($cov1 * 2)"
+
+
+def test_common_scalars_shared(cov1, cov2):
+    expr1 = cov1 > 0
+    expr2 = cov2 > 0
+    assert expr1.operands[1] is expr2.operands[1]
+    assert expr1.operands[1].parent is None
+    assert (cov1 > 0.0).operands[1] is not expr1.operands[1]
+    assert (cov1 > 5).operands[1].parent is not None
+    assert str(expr2) == "for $cov2 in (cov2)\nreturn\n  ($cov2 > 0)"
+    assert str(cov1 + False) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + False)"
+    assert str(cov1 + (-0.0)) == "for $cov1 in (cov1)\nreturn\n  ($cov1 + -0.0)"
+
+
+def test_flatten_associative_chains(cov1, cov2, cov3):
+    expr = cov1 + cov2 + cov3 + 1
+    assert len(expr.operands) == 4
+    assert all(op.parent is expr for op in expr.operands[:3])
+    assert str(expr) == ("for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3)\n"
+                         "return\n  ($cov1 + $cov2 + $cov3 + 1)")
+    assert str(And(And(cov1, cov2), cov3)) == ("for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3)\n"
+                                               "return\n  ($cov1 and $cov2 and $cov3)")
+    # right operands, different operators and non-associative operators are not flattened
+    assert str(cov1 + (cov2 + cov3)) == ("for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3)\n"
+                                         "return\n  ($cov1 + ($cov2 + $cov3))")
+    assert str(cov1 * cov2 + cov3) == ("for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3)\n"
+                                       "return\n  (($cov1 * $cov2) + $cov3)")
+    assert str(cov1 - cov2 - cov3) == ("for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3)\n"
+                                       "return\n  (($cov1 - $cov2) - $cov3)")
+    expr = cov1 + cov2
+    expr.operator = "-"
+    assert str(expr + cov3) == ("for $cov1 in (cov1), $cov2 in (cov2), $cov3 in (cov3)\n"
+                                "return\n  (($cov1 - $cov2) + $cov3)")
+
+
+def test_deeply_nested_expression(cov1):
+    expr = cov1
+    for _ in range(5000):
+        expr = expr - 1
+    query = str(expr)
+    assert query.startswith("for $cov1 in (cov1)\nreturn\n  " + "(" * 5000 + "$cov1 - 1)")
+    assert query.endswith(" - 1)" * 5000)
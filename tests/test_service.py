@@ -5,6 +5,7 @@ Test the wcps.service module.
 from hashlib import sha256
 
 import pytest
+import requests
 
 from wcps.model import Datacube, AxisIter, Condense, CondenseOp
 from wcps.service import Service, WCPSResultType
@@ -16,6 +17,14 @@ def get_checksum(response: bytes):
     return hash_func.hexdigest()
 
 
+def get_file_checksum(path) -> str:
+    hash_func = sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            hash_func.update(chunk)
+    return hash_func.hexdigest()
+
+
 def test_execute_raw():
     service = Service("https://ows.rasdaman.org/rasdaman/ows")
 
@@ -99,13 +108,27 @@ def test_execute():
     assert result.value is True
 
 
+def test_execute_many():
+    service = Service("https://ows.rasdaman.org/rasdaman/ows")
+
+    results = service.execute_many([Datacube("NIR").red.sum(),
+                                    'for $c in (NIR) return encode($c, "PNG")',
+                                    (Datacube("NIR").red > 5).all()])
+    assert [r.type for r in results] == [WCPSResultType.SCALAR, WCPSResultType.IMAGE,
+                                         WCPSResultType.SCALAR]
+    assert results[0].value == 269047963
+    expected = 'a71c63b3d24ecc065609395358348e23ce3eb546dc3e3d5f98c714901beda27d'
+    assert get_checksum(results[1].value) == expected
+    assert results[2].value is False
+
+
 def test_download(tmp_path):
     service = Service("https://ows.rasdaman.org/rasdaman/ows")
 
     temp_file_path = tmp_path / "temp_file.png"
     service.download('for $c in (NIR) return encode($c, "PNG")', str(temp_file_path))
     expected = 'a71c63b3d24ecc065609395358348e23ce3eb546dc3e3d5f98c714901beda27d'
-    assert get_checksum(temp_file_path.read_bytes()) == expected
+    assert get_file_checksum(temp_file_path) == expected
 
 
 def test_execute_error():
@@ -123,3 +146,32 @@ def test_execute_error():
     with pytest.raises(Exception) as e_info:
         service.execute(query)
         assert e_info.value == "NoSuchCoverage: Coverage 'S2_L2A' does not exist."
+
+
+def test_context_manager(monkeypatch):
+    requested_urls = []
+    closed = []
+
+    def get(url, **kwargs):
+        requested_urls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'1'  # pylint: disable=protected-access
+        return response
+
+    with Service("https://ows.rasdaman.org/rasdaman/ows") as service:
+        monkeypatch.setattr(service.session, 'get', get)
+        monkeypatch.setattr(service.session, 'close', lambda: closed.append(True))
+        assert service.execute_raw('for $c in (NIR) return 1').text == '1'
+        assert service.execute_raw('for $c in (NIR) return 1').text == '1'
+        assert len(requested_urls) == 2
+        assert not closed
+    assert closed == [True]
+
+
+def test_retry():
+    with Service("https://ows.rasdaman.org/rasdaman/ows") as service:
+        retry = service.session.adapters['https://'].max_retries
+    assert retry.total == 3
+    assert retry.read == 0
+    assert retry.status_forcelist == [502, 503, 504]
@@ -6,25 +6,58 @@ This can be done by:
 1. Composing objects of :class:`WCPSExpr` subclasses, e.g. `Sum(Datacube("cube"))`
 2. Chaining methods on :class:`WCPSExpr` objects, e.g. `Datacube("cube").sum()`
 
-Each subclass defines the ``__str__`` method, so that executing
-``str(Sum(Datacube("cube")))`` returns a valid WCPS query string
-that can be sent to a WCPS server.
+Each subclass defines how it is rendered in the ``_parts`` method, so that
+executing ``str(Sum(Datacube("cube")))`` returns a valid WCPS query string
+that can be sent to a WCPS server. The parts of the whole expression tree are
+collected in a single list and joined once, and the rendered string of each
+expression is cached, so that rendering the same expression repeatedly does
+not walk its subtree again.
 """
 
 # postpone evaluations of type annotations
 # https://stackoverflow.com/a/33533514
 from __future__ import annotations
 
+import math
+import operator
 import re
-from collections import deque
+import sys
 from enum import Enum
-from typing import Union, Optional
+from functools import lru_cache
+from collections.abc import Iterable
 
+try:
+    # Python >= 3.11
+    from enum import StrEnum
+except ImportError:
+    class StrEnum(str, Enum):
+        """Custom implementation of StrEnum for Python <= 3.10"""
+        def __str__(self) -> str:
+            return self.value
 
-class StrEnum(str, Enum):
-    """Custom implementation of StrEnum for Python <= 3.10"""
-    def __str__(self) -> str:
-        return self.value
+
+class _RenderedAttribute:
+    """
+    A public attribute of a :class:`WCPSExpr` which affects its query string. The value
+    is stored in the slot of the same name prefixed with ``_``, and assigning it discards
+    the cached strings (see :meth:`WCPSExpr._invalidate`), so that e.g. assigning
+    ``encode.data_format = "JPEG"`` is reflected when the expression is rendered again.
+    """
+
+    __slots__ = ('_slot',)
+
+    def __set_name__(self, owner, name):
+        # the member descriptor of the slot, created with the owner class
+        self._slot = owner.__dict__[f'_{name}']
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return self._slot.__get__(obj, objtype)
+
+    def __set__(self, obj, value):
+        self._slot.__set__(obj, value)
+        obj._invalidate()  # pylint: disable=protected-access
 
 
 class WCPSExpr:
@@ -45,6 +78,8 @@ class WCPSExpr:
     Various builtin operators are overloaded to allow writing expressions more naturally,
     e.g. ``WCPSExpr * WCPSExpr``. Number/strings are automatically wrapped in a :class:`Scalar`,
     e.g. ``WCPSExpr * 2`` becomes ``WCPSExpr * Scalar(2)``.
+    Arithmetic on two numeric constants is evaluated directly, e.g. ``Scalar(2) * 3``
+    becomes ``Scalar(6)``.
 
     ``__and__``, ``__or__``, ``__xor__``, ``__invert__`` correspond to BITWISE operators,
     not to the logical and, or, and not. They are not overloaded to the logical
@@ -55,40 +90,72 @@ class WCPSExpr:
         Scalar operands such as 1, 4.9 or "test" are automatically wrapped in a :class:`Scalar` object.
     """
 
-    def __init__(self, operands: Optional[OperandType | list[OperandType]] = None):
-        self.parent: Optional[WCPSExpr] = None
+    # subclasses declare the attributes they add in __slots__ as well, so that
+    # expression objects do not carry a __dict__
+    __slots__ = ('parent', 'operands', '_str_cache', '_str_revision', '_prelude_cache',
+                 '_prelude_revision', '_datacubes_cache', '_datacubes_revision')
+
+    _revision = 0
+    """
+    Incremented whenever an expression that is an operand of another expression is
+    modified, which invalidates all cached strings (see :meth:`_invalidate`).
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _WCPS_CLASSES.add(cls)
+
+    def __init__(self, operands: OperandType | list[OperandType] | None = None):
+        self.parent: WCPSExpr | None = None
         """
         A :class:`WCPSExpr` of which this expression is an operand; ``None`` if this is the root expression.
         E.g. in if this expression is the :class:`Datacube` object in ``Datacube("test") * 5``,
         then the ``parent`` is the :class:`Mul` object.
         """
-        self.operands: list[WCPSExpr] = []
+        self.operands: list[WCPSExpr] | tuple[WCPSExpr, ...] = []
         """
         A list of :class:`WCPSExpr` operands of this expressions. E.g. in ``Datacube("test") * 5``, this
         expression is a :class:`Mul`, with :class:`Datacube` and :class:`Scalar` operands.
-        """
+        Expressions with a fixed number of operands, e.g. unary operators and functions, store them in a tuple.
+        """
+        self._str_cache: str | None = None
+        self._str_revision = -1
+        self._prelude_cache: str | None = None
+        self._prelude_revision = -1
+        self._datacubes_cache: list[Datacube] | None = None
+        self._datacubes_revision = -1
         if operands is not None:
             if not isinstance(operands, list):
-                operands = [operands]
+                operands = (operands,)
+            # a new expression has nothing cached yet, so there is no need
+            # to invalidate it as in add_operand
+            append = self.operands.append
+            to_operand = self._to_operand
             for op in operands:
-                self.add_operand(op)
+                if op is not None:
+                    append(to_operand(op))
 
     def get_datacube_operands(self) -> list[Datacube]:
         """
         :return: all unique :class:`Datacube` objects contained within the expression tree
             starting from this :class:`WCPSExpr`, sorted alphabetically by datacube name.
+            The list is cached until the expression tree is modified; a copy is returned.
         """
-        operands = deque(self.operands)
-        datacubes = set()
+        if self._datacubes_cache is not None and self._datacubes_revision == WCPSExpr._revision:
+            return list(self._datacubes_cache)
+        # the result is sorted, so the tree can be walked in any order
+        operands = list(self.operands)
+        datacubes: dict[str, Datacube] = {}
 
         while operands:
-            op = operands.popleft()
+            op = operands.pop()
             if isinstance(op, Datacube):
-                datacubes.add(op)
-            for c in op.operands:
-                operands.append(c)
+                datacubes.setdefault(op.name, op)
+            operands.extend(op.operands)
 
-        return sorted(list(datacubes), key=lambda datacube: datacube.name)
+        self._datacubes_cache = [datacubes[name] for name in sorted(datacubes)]
+        self._datacubes_revision = WCPSExpr._revision
+        return list(self._datacubes_cache)
 
     def add_operand(self, op: OperandType):
         """
@@ -96,35 +163,138 @@ class WCPSExpr:
         "test" are automatically wrapped in a :class:`Scalar` object.
         :param op: an operand to be added to the list of this expression's operands;
         if ``op`` is ``None`` it will be ignored.
+        :raise: :class:`WCPSClientException` if this expression has a fixed number of operands,
+            e.g. a unary operator.
         """
+        self._check_operands_extensible()
         if op is not None:
-            if isinstance(op, WCPSExpr):
-                self.operands.append(op)
-            elif isinstance(op, ScalarType):
-                self.operands.append(Scalar(op))
-            else:
-                raise WCPSClientException(f"Invalid operand type {type(op)}, "
-                                          f"expected a WCPSExpr or a scalar value.")
-            self.operands[-1].parent = self
+            self.operands.append(self._to_operand(op))
+        self._invalidate()
+
+    def add_operands(self, ops: Iterable[OperandType]):
+        """
+        Add several operands to the list of operands at once, like calling
+        :meth:`add_operand` for each of them, but discarding the cached strings only once.
+        :param ops: operands to be added to the list of this expression's operands;
+        ``None`` operands are ignored.
+        :raise: :class:`WCPSClientException` if this expression has a fixed number of operands,
+            e.g. a unary operator.
+        """
+        self._check_operands_extensible()
+        to_operand = self._to_operand
+        self.operands.extend([to_operand(op) for op in ops if op is not None])
+        self._invalidate()
+
+    def _check_operands_extensible(self):
+        # unary operators and functions, and Axis, keep their fixed operands in a tuple
+        if isinstance(self.operands, tuple):
+            raise WCPSClientException(f"Cannot add operands to {type(self).__name__}, "
+                                      f"it has a fixed number of operands.")
+
+    def _to_operand(self, op: OperandType) -> WCPSExpr:
+        """
+        Prepare ``op`` to become an operand of this expression: wrap it in a :class:`Scalar`
+        if needed, and set this expression as its parent.
+        :param op: a non-``None`` operand.
+        :return: the operand to be added to :attr:`operands`.
+        """
+        op_type = type(op)
+        if op_type in _WCPS_CLASSES:
+            op.parent = self
+            return op
+        # isinstance also accepts e.g. StrEnum values as scalars
+        if op_type in _SCALAR_TYPES_SET or isinstance(op, _SCALAR_TYPES):
+            # common constants are shared and have no parent, see _SCALAR_INTERN
+            scalar = _SCALAR_INTERN.get((op_type, op))
+            # -0.0 is equal to 0.0, but must keep its sign
+            if scalar is None or op_type is float and math.copysign(1.0, op) < 0:
+                scalar = Scalar(op)
+                scalar.parent = self
+            return scalar
+        raise WCPSClientException(f"Invalid operand type {type(op)}, "
+                                  f"expected a WCPSExpr or a scalar value.")
+
+    def _invalidate(self):
+        """
+        Discard the cached strings of this expression; must be called by any method
+        which modifies the expression after it was created. Assigning the public attributes
+        that are rendered (see :class:`_RenderedAttribute`) calls it automatically. If this expression is
+        an operand of another expression, then the strings cached in all expressions
+        are discarded, as any of them may contain this expression.
+        """
+        self._str_cache = None
+        self._prelude_cache = None
+        self._datacubes_cache = None
+        if self.parent is not None:
+            WCPSExpr._revision += 1
 
     def __str__(self):
         """
         :return: A WCPS query string corresponding to this expression.
         """
-        if self.parent is not None:
-            return ''
+        prelude = self._get_prelude() if self.parent is None else ''
+        if self._str_cache is None or self._str_revision != WCPSExpr._revision:
+            out = []
+            self._emit(out)
+            self._str_cache = ''.join(out)
+            self._str_revision = WCPSExpr._revision
+        return prelude + self._str_cache
+
+    def _parts(self) -> Iterable[str | WCPSExpr]:
+        """
+        :return: the parts making up the WCPS query string of this expression, without the
+            ``for .. return`` prelude: strings, operands and other values, which are
+            rendered in order; to be overridden by subclasses.
+        """
+        return ()
+
+    def _emit(self, out: list[str]):
+        """
+        Append the strings forming the WCPS query string of this expression
+        (without the ``for .. return`` prelude) to ``out``, reusing the cached
+        string of this expression if it is still valid.
+        """
+        append = out.append
+        if self._str_cache is not None and self._str_revision == WCPSExpr._revision:
+            append(self._str_cache)
+            return
+        # the tree is walked with an explicit stack of the parts still to be emitted
+        # for each level, so that deeply nested expressions do not hit the recursion limit
+        stack = [iter(self._parts())]
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, WCPSExpr) and type(part).__str__ is WCPSExpr.__str__:
+                    if part._str_cache is not None and part._str_revision == WCPSExpr._revision:
+                        append(part._str_cache)
+                    else:
+                        stack.append(iter(part._parts()))
+                        break
+                else:
+                    # plain values, and expressions which implement __str__ directly
+                    append(str(part))
+            else:
+                stack.pop()
 
+    def _get_prelude(self) -> str:
+        """
+        :return: the ``for $c in (c), ... return`` prelude of a root expression;
+            it is cached until the expression tree is modified.
+        :raise: :class:`WCPSClientException` if the expression contains no datacubes.
+        """
+        if self._prelude_cache is not None and self._prelude_revision == WCPSExpr._revision:
+            return self._prelude_cache
         datacubes = self.get_datacube_operands()
         if len(datacubes) == 0:
             raise WCPSClientException("No datacubes have been specified.")
-        datacubes = [f'{d} in ({d.name})' for d in datacubes]
-        datacubes_str = ', '.join(datacubes)
-        ret = f'for {datacubes_str}\nreturn\n  '
-        return ret
+        # $name is what Datacube.__str__ returns, built here without the call
+        datacubes_str = ', '.join([f'${d.name} in ({d.name})' for d in datacubes])
+        self._prelude_cache = f'for {datacubes_str}\nreturn\n  '
+        self._prelude_revision = WCPSExpr._revision
+        return self._prelude_cache
 
     # arithmetic
 
-    def add(self, other: OperandType) -> Add:
+    def add(self, other: OperandType) -> Add | Scalar:
         """
         Adds the current operand to another operand.
 
@@ -135,24 +305,14 @@ class WCPSExpr:
 
         - ``Datacube("test1").add(Datacube("test2"))``
         - ``Datacube("test1").add(5)``
-        """
-        return Add(self, other)
-
-    def __add__(self, other: OperandType) -> Add:
-        """
-        Allows the use of the '+' operator to add two operands.
-
-        :param other: The operand to add to the current operand.
-        :return: An instance of the :class:`Add` class representing the addition operation.
-
-        Examples:
-
         - ``Datacube("test1") + Datacube("test2")``
         - ``Datacube("test1") + 5``
         """
-        return Add(self, other)
+        return _fold_constants(Add, operator.add, self, other)
 
-    def __radd__(self, other: OperandType) -> Add:
+    __add__ = add
+
+    def __radd__(self, other: OperandType) -> Add | Scalar:
         """
         Allows the use of the '+' operator with the current operand on the right side.
 
@@ -164,9 +324,9 @@ class WCPSExpr:
         - ``Datacube("test2") + Datacube("test1")``
         - ``5 + Datacube("test1")``
         """
-        return Add(other, self)
+        return _fold_constants(Add, operator.add, other, self)
 
-    def sub(self, other: OperandType) -> Sub:
+    def sub(self, other: OperandType) -> Sub | Scalar:
         """
         Subtracts another operand from the current operand.
 
@@ -177,24 +337,14 @@ class WCPSExpr:
 
         - ``Datacube("test1").sub(Datacube("test2"))``
         - ``Datacube("test1").sub(5)``
-        """
-        return Sub(self, other)
-
-    def __sub__(self, other: OperandType) -> Sub:
-        """
-        Allows the use of the '-' operator to subtract one operand from another.
-
-        :param other: The operand to subtract from the current operand.
-        :return: An instance of the `Sub` class representing the subtraction operation.
-
-        Examples:
-
         - ``Datacube("test1") - Datacube("test2")``
         - ``Datacube("test1") - 5``
         """
-        return Sub(self, other)
+        return _fold_constants(Sub, operator.sub, self, other)
 
-    def __rsub__(self, other: OperandType) -> Sub:
+    __sub__ = sub
+
+    def __rsub__(self, other: OperandType) -> Sub | Scalar:
         """
         Allows the use of the '-' operator with the current operand on the right side.
 
@@ -206,9 +356,9 @@ class WCPSExpr:
         - ``Datacube("test2") - Datacube("test1")``
         - ``5 - Datacube("test1")``
         """
-        return Sub(other, self)
+        return _fold_constants(Sub, operator.sub, other, self)
 
-    def mul(self, other: OperandType) -> Mul:
+    def mul(self, other: OperandType) -> Mul | Scalar:
         """
         Multiplies the current operand by another operand.
 
@@ -219,24 +369,14 @@ class WCPSExpr:
 
         - ``Datacube("test1").mul(Datacube("test2"))``
         - ``Datacube("test1").mul(5)``
-        """
-        return Mul(self, other)
-
-    def __mul__(self, other: OperandType) -> Mul:
-        """
-        Allows the use of the '*' operator to multiply two operands.
-
-        :param other: The operand to multiply with the current operand.
-        :return: An instance of the :class:`Mul` class representing the multiplication operation.
-
-        Examples:
-
         - ``Datacube("test1") * Datacube("test2")``
         - ``Datacube("test1") * 5``
         """
-        return Mul(self, other)
+        return _fold_constants(Mul, operator.mul, self, other)
 
-    def __rmul__(self, other: OperandType) -> Mul:
+    __mul__ = mul
+
+    def __rmul__(self, other: OperandType) -> Mul | Scalar:
         """
         Allows the use of the '*' operator with the current operand on the right side.
 
@@ -248,9 +388,9 @@ class WCPSExpr:
         - ``Datacube("test1") * Datacube("test2")``
         - ``5 * Datacube("test1")``
         """
-        return Mul(other, self)
+        return _fold_constants(Mul, operator.mul, other, self)
 
-    def div(self, other: OperandType) -> Div:
+    def div(self, other: OperandType) -> Div | Scalar:
         """
         Divides the current operand by another operand.
 
@@ -261,24 +401,14 @@ class WCPSExpr:
 
         - ``Datacube("test1").div(Datacube("test2"))``
         - ``Datacube("test1").div(5)``
-        """
-        return Div(self, other)
-
-    def __div__(self, other: OperandType) -> Div:
-        """
-        Allows the use of the '/' operator to divide one operand by another.
-
-        :param other: The operand to divide the current operand by.
-        :return: An instance of the :class:`Div` class representing the division operation.
-
-        Examples:
-
         - ``Datacube("test1") / Datacube("test2")``
         - ``Datacube("test1") / 5``
         """
-        return Div(self, other)
+        return _fold_constants(Div, operator.truediv, self, other)
+
+    __div__ = div
 
-    def __rdiv__(self, other: OperandType) -> Div:
+    def __rdiv__(self, other: OperandType) -> Div | Scalar:
         """
         Allows the use of the '/' operator with the current operand on the right side.
 
@@ -290,23 +420,11 @@ class WCPSExpr:
         - ``Datacube("test2") / Datacube("test1")``
         - ``5 / Datacube("test1")``
         """
-        return Div(other, self)
-
-    def __truediv__(self, other: OperandType) -> Div:
-        """
-        Allows the use of the '//' operator to perform true division.
-
-        :param other: The operand to divide the current operand by.
-        :return: An instance of the :class:`Div` class representing the division operation.
-
-        Examples:
+        return _fold_constants(Div, operator.truediv, other, self)
 
-        - ``Datacube("test1") / Datacube("test2")``
-        - ``Datacube("test1") / 5``
-        """
-        return Div(self, other)
+    __truediv__ = div
 
-    def __rtruediv__(self, other: OperandType) -> Div:
+    def __rtruediv__(self, other: OperandType) -> Div | Scalar:
         """
         Allows the use of the '//' operator with the current operand on the right side.
 
@@ -318,9 +436,9 @@ class WCPSExpr:
         - ``Datacube("test2") / Datacube("test1")``
         - ``5 / Datacube("test1")``
         """
-        return Div(other, self)
+        return _fold_constants(Div, operator.truediv, other, self)
 
-    def mod(self, other: OperandType) -> Mod:
+    def mod(self, other: OperandType) -> Mod | Scalar:
         """
         Computes the modulus (remainder of the division) of the current operand by another operand.
 
@@ -331,24 +449,14 @@ class WCPSExpr:
 
         - ``Datacube("test1").mod(Datacube("test2"))``
         - ``Datacube("test1").mod(5)``
-        """
-        return Mod(self, other)
-
-    def __mod__(self, other: OperandType) -> Mod:
-        """
-        Allows the use of the '%' operator to compute the modulus of two operands.
-
-        :param other: The operand to use as the divisor.
-        :return: An instance of the :class:`Mod` class representing the modulus operation.
-
-        Examples:
-
         - ``Datacube("test1") % Datacube("test2")``
         - ``Datacube("test1") % 5``
         """
-        return Mod(self, other)
+        return _fold_constants(Mod, _constant_mod, self, other)
 
-    def __rmod__(self, other: OperandType) -> Mod:
+    __mod__ = mod
+
+    def __rmod__(self, other: OperandType) -> Mod | Scalar:
         """
         Allows the use of the '%' operator with the current operand on the right side.
 
@@ -360,7 +468,7 @@ class WCPSExpr:
         - ``Datacube("test2") % Datacube("test1")``
         - ``5 % Datacube("test1")``
         """
-        return Mod(other, self)
+        return _fold_constants(Mod, _constant_mod, other, self)
 
     def abs(self) -> Abs:
         """
@@ -371,21 +479,12 @@ class WCPSExpr:
         Examples:
 
         - ``Datacube("test1").abs()``
-        """
-        return Abs(self)
-
-    def __abs__(self) -> Abs:
-        """
-        Allows the use of the ``abs()`` function to compute the absolute value of the operand.
-
-        :return: An instance of the :class:`Abs` class representing the absolute value operation.
-
-        Examples:
-
         - ``abs(Datacube("test1"))``
         """
         return Abs(self)
 
+    __abs__ = abs
+
     def round(self) -> Round:
         """
         Rounds the current operand to the nearest integer.
@@ -395,21 +494,12 @@ class WCPSExpr:
         Examples:
 
         - ``Datacube("test1").round()``
-        """
-        return Round(self)
-
-    def __round__(self) -> Round:
-        """
-        Allows the use of the ``round()`` function to round the operand to the nearest integer.
-
-        :return: An instance of the :class:`Round` class representing the rounding operation.
-
-        Examples:
-
         - ``round(Datacube("test1"))``
         """
         return Round(self)
 
+    __round__ = round
+
     def floor(self) -> Floor:
         """
         Computes the floor of the current operand (rounds down to the nearest integer).
@@ -419,21 +509,12 @@ class WCPSExpr:
         Examples:
 
         - ``Datacube("test1").floor()``
-        """
-        return Floor(self)
-
-    def __floor__(self) -> Floor:
-        """
-        Allows the use of the :func:`math.floor` function to compute the floor of the operand.
-
-        :return: An instance of the :class:`Floor` class representing the floor operation.
-
-        Examples:
-
         - ``math.floor(Datacube("test1"))``
         """
         return Floor(self)
 
+    __floor__ = floor
+
     def ceil(self) -> Ceil:
         """
         Computes the ceiling of the current operand (rounds up to the nearest integer).
@@ -443,21 +524,12 @@ class WCPSExpr:
         Examples:
 
         - ``Datacube("test1").ceil()``
-        """
-        return Ceil(self)
-
-    def __ceil__(self) -> Ceil:
-        """
-        Allows the use of the :func:`math.ceil` function to compute the ceiling of the operand.
-
-        :return: An instance of the :class:`Ceil` class representing the ceiling operation.
-
-        Examples:
-
         - ``math.ceil(Datacube("test1"))``
         """
         return Ceil(self)
 
+    __ceil__ = ceil
+
     # exponential
 
     def exp(self) -> Exp:
@@ -508,7 +580,7 @@ class WCPSExpr:
         """
         return Sqrt(self)
 
-    def pow(self, other: OperandType) -> Pow:
+    def pow(self, other: OperandType) -> Pow | Scalar:
         """
         Raises the current operand to the power of another operand.
 
@@ -519,24 +591,14 @@ class WCPSExpr:
 
         - ``Datacube("test1").pow(Datacube("test2"))``
         - ``Datacube("test1").pow(5)``
-        """
-        return Pow(self, other)
-
-    def __pow__(self, other: OperandType) -> Pow:
-        """
-        Allows the use of the '**' operator to raise one operand to the power of another.
-
-        :param other: The exponent to raise the current operand to.
-        :return: An instance of the :class:`Pow` class representing the power operation.
-
-        Examples:
-
         - ``Datacube("test1") ** Datacube("test2")``
         - ``Datacube("test1") ** 5``
         """
-        return Pow(self, other)
+        return _fold_constants(Pow, _constant_pow, self, other)
+
+    __pow__ = pow
 
-    def __rpow__(self, other: OperandType) -> Pow:
+    def __rpow__(self, other: OperandType) -> Pow | Scalar:
         """
         Allows the use of the '**' operator to raise one operand to the power of another.
 
@@ -548,7 +610,7 @@ class WCPSExpr:
         - ``Datacube("test1") ** Datacube("test2")``
         - ``5 ** Datacube("test1")``
         """
-        return Pow(other, self)
+        return _fold_constants(Pow, _constant_pow, other, self)
 
     # trigonometric
 
@@ -685,23 +747,13 @@ class WCPSExpr:
 
         - ``Datacube("test1").gt(Datacube("test2"))``
         - ``Datacube("test1").gt(10)``
-        """
-        return Gt(self, other)
-
-    def __gt__(self, other: OperandType) -> Gt:
-        """
-        Allows the use of the '>' operator to compare two operands.
-
-        :param other: The operand to compare against.
-        :return: An instance of the :class:`Gt` class representing the greater-than comparison.
-
-        Examples:
-
         - ``Datacube("test1") > Datacube("test2")``
         - ``Datacube("test1") > 10``
         """
         return Gt(self, other)
 
+    __gt__ = gt
+
     def lt(self, other: OperandType) -> Lt:
         """
         Checks if the current operand is less than another operand.
@@ -713,23 +765,13 @@ class WCPSExpr:
 
         - ``Datacube("test1").lt(Datacube("test2"))``
         - ``Datacube("test1").lt(10)``
-        """
-        return Lt(self, other)
-
-    def __lt__(self, other: OperandType) -> Lt:
-        """
-        Allows the use of the '<' operator to compare two operands.
-
-        :param other: The operand to compare against.
-        :return: An instance of the :class:`Lt` class representing the less-than comparison.
-
-        Examples:
-
         - ``Datacube("test1") < Datacube("test2")``
         - ``Datacube("test1") < 10``
         """
         return Lt(self, other)
 
+    __lt__ = lt
+
     def ge(self, other: OperandType) -> Ge:
         """
         Checks if the current operand is greater than or equal to another operand.
@@ -741,23 +783,13 @@ class WCPSExpr:
 
         - ``Datacube("test1").ge(Datacube("test2"))``
         - ``Datacube("test1").ge(10)``
-        """
-        return Ge(self, other)
-
-    def __ge__(self, other: OperandType) -> Ge:
-        """
-        Allows the use of the '>=' operator to compare two operands.
-
-        :param other: The operand to compare against.
-        :return: An instance of the :class:`Ge` class representing the greater-than-or-equal-to comparison.
-
-        Examples:
-
         - ``Datacube("test1") >= Datacube("test2")``
         - ``Datacube("test1") >= 10``
         """
         return Ge(self, other)
 
+    __ge__ = ge
+
     def le(self, other: OperandType) -> Le:
         """
         Checks if the current operand is less than or equal to another operand.
@@ -769,23 +801,13 @@ class WCPSExpr:
 
         - ``Datacube("test1").le(Datacube("test2"))``
         - ``Datacube("test1").le(10)``
-        """
-        return Le(self, other)
-
-    def __le__(self, other: OperandType) -> Le:
-        """
-        Allows the use of the '<=' operator to compare two operands.
-
-        :param other: The operand to compare against.
-        :return: An instance of the :class:`Le` class representing the less-than-or-equal-to comparison.
-
-        Examples:
-
         - ``Datacube("test1") <= Datacube("test2")``
         - ``Datacube("test1") <= 10``
         """
         return Le(self, other)
 
+    __le__ = le
+
     def eq(self, other: OperandType) -> Eq:
         """
         Checks if the current operand is equal to another operand.
@@ -797,23 +819,13 @@ class WCPSExpr:
 
         - ``Datacube("test1").eq(Datacube("test2"))``
         - ``Datacube("test1").eq(10)``
-        """
-        return Eq(self, other)
-
-    def __eq__(self, other: OperandType) -> Eq:
-        """
-        Allows the use of the '==' operator to compare two operands.
-
-        :param other: The operand to compare against.
-        :return: An instance of the :class:`Eq` class representing the equality comparison.
-
-        Examples:
-
         - ``Datacube("test1") == Datacube("test2")``
         - ``Datacube("test1") == 10``
         """
         return Eq(self, other)
 
+    __eq__ = eq
+
     def ne(self, other: OperandType) -> Ne:
         """
         Checks if the current operand is not equal to another operand.
@@ -825,21 +837,12 @@ class WCPSExpr:
 
         - ``Datacube("test1").ne(Datacube("test2"))``
         - ``Datacube("test1").ne(10)``
+        - ``Datacube("test1") != Datacube("test2")``
+        - ``Datacube("test1") != 10``
         """
         return Ne(self, other)
 
-    def __ne__(self, other: OperandType) -> Ne:
-        """
-        Allows the use of the '!=' operator to compare two operands.
-
-        :param other: The operand to compare against.
-        :return: An instance of the :class:`Ne` class representing the inequality comparison.
-
-        Examples:
-        - Datacube("test1") != Datacube("test2")
-        - Datacube("test1") != 10
-        """
-        return Ne(self, other)
+    __ne__ = ne
 
     # logical
 
@@ -955,7 +958,16 @@ class WCPSExpr:
 
         - ``Datacube("rgb").red``
         - ``Datacube("rgb").0``
+
+        Names starting with ``_`` are not treated as bands, so that Python protocol
+        lookups such as ``__deepcopy__`` fail as usual; the same applies to the names in
+        :data:`_NON_BAND_ATTRIBUTES`, which array libraries probe for. Such bands can be
+        extracted with :meth:`band` instead, e.g. ``Datacube("rgb").band("_red")``.
+
+        :raise AttributeError: if ``band_name`` starts with ``_`` or is a non-band attribute.
         """
+        if band_name.startswith('_') or band_name in _NON_BAND_ATTRIBUTES:
+            raise AttributeError(band_name)
         return Band(self, band_name)
 
     # subsetting, extend, scale
@@ -1062,8 +1074,8 @@ class WCPSExpr:
         3. ``cov.scale(0.5)`` - downscale by 2x
         4. ``cov.scale([0.5, 2])`` - downscale the first axis by 2x, and upscale the second axis by 2x
         """
-        nones = sum(1 for item in [grid_axes, another_coverage, single_factor, axis_factors]
-                    if item is None)
+        nones = ((grid_axes is None) + (another_coverage is None) +
+                 (single_factor is None) + (axis_factors is None))
         if nones != 3:
             raise WCPSClientException(f"scale expects exactly 1 parameter to be specified, "
                                       f"but {4 - nones} were specified.")
@@ -1101,14 +1113,9 @@ class WCPSExpr:
         4. ``cov.reproject("EPSG:4326", axis_subsets=[("Lat", 30.5, 60.5), ("Lon", 50.5, 70.5)])``
         5. ``cov.reproject("EPSG:4326", axis_resolutions=[0.5, 1.5], domain_of_coverage=Datacube("cov2"))``
         """
-        ret = Reproject(self, target_crs, interpolation_method=interpolation_method)
-        if axis_resolutions is not None:
-            ret = ret.to_axis_resolutions(axis_resolutions)
-        if axis_subsets is not None:
-            ret = ret.subset_by_axes(axis_subsets)
-        elif domain_of_coverage is not None:
-            ret = ret.subset_by_coverage_domain(domain_of_coverage)
-        return ret
+        return Reproject(self, target_crs, interpolation_method=interpolation_method,
+                         axis_resolutions=axis_resolutions, axis_subsets=axis_subsets,
+                         subset_domain=domain_of_coverage)
 
     # casting
 
@@ -1231,13 +1238,27 @@ class WCPSExpr:
 
 # ----------------------------------------------------------------------------------
 
-BoundType = Union[int, float, str, WCPSExpr]
+BoundType = int | float | str | WCPSExpr
 """A type representing axis bounds (in subsetting, extend, scale, etc)."""
-ScalarType = Union[int, float, str, bool]
+ScalarType = int | float | str | bool
 """Scalar values can be of one of these types."""
-OperandType = Union[WCPSExpr, ScalarType]
+_SCALAR_TYPES = (int, float, str, bool)
+"""The types in :data:`ScalarType` as a tuple, which is faster to check with ``isinstance``."""
+_SCALAR_TYPES_SET = frozenset(_SCALAR_TYPES)
+"""The types in :data:`ScalarType` as a set, for an exact type check which is faster than ``isinstance``."""
+_NON_BAND_ATTRIBUTES = frozenset({'shape', 'dtype', 'ndim'})
+"""
+Attributes which are not interpreted as band names by :meth:`WCPSExpr.__getattr__`, as
+libraries such as numpy or pandas look them up to check whether an object is array-like.
+"""
+_WCPS_CLASSES: set[type] = {WCPSExpr}
+"""
+:class:`WCPSExpr` and all its subclasses, registered in :meth:`WCPSExpr.__init_subclass__`;
+checking if the type of an operand is in this set is faster than ``isinstance``.
+"""
+OperandType = WCPSExpr | ScalarType
 """Type of operands of WCPS expressions."""
-AxisTuple = Union[tuple[str, BoundType], tuple[str, BoundType, BoundType], tuple[str, BoundType, BoundType, str]]
+AxisTuple = tuple[str, BoundType] | tuple[str, BoundType, BoundType] | tuple[str, BoundType, BoundType, str]
 """Axis tuple types: (name, low), (name, low, high), or (name, low, high, crs)"""
 
 
@@ -1248,6 +1269,8 @@ class Datacube(WCPSExpr):
     Example: ``Datacube("mycoverage")``.
     """
 
+    __slots__ = ('_name', '_str')
+
     def __init__(self, name: str):
         """
         :param name: the datacube (coverage) name.
@@ -1255,11 +1278,23 @@ class Datacube(WCPSExpr):
         super().__init__()
         self.name = name
 
+    @property
+    def name(self) -> str:
+        """The datacube (coverage) name."""
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        # the string of the datacube is precomputed whenever the name is set
+        self._name = _intern(name)
+        self._str = f'${name}'
+        self._invalidate()
+
     def __str__(self):
-        return f'${self.name}'
+        return self._str
 
     def __hash__(self):
-        return hash(self.name)
+        return hash(self._name)
 
 
 class Scalar(WCPSExpr):
@@ -1267,65 +1302,177 @@ class Scalar(WCPSExpr):
     A wrapper for scalar values, e.g. ``5``, ``3.14``, ``"PNG"``.
     """
 
+    __slots__ = ('_op', '_formatted')
+
     def __init__(self, op: ScalarType):
         super().__init__()
-        self.op = op
+        self._op = op
+        # the type of op is fixed, so it is formatted only once
+        self._formatted = f'"{op}"' if isinstance(op, str) else str(op)
+
+    @property
+    def op(self) -> ScalarType:
+        """
+        The wrapped value. It is read-only, as the :class:`Scalar` objects of common
+        constants are shared by many expressions (see :data:`_SCALAR_INTERN`).
+        """
+        return self._op
 
     def __str__(self):
-        op_str = f'"{self.op}"' if isinstance(self.op, str) else str(self.op)
-        return f'{super().__str__()}{op_str}'
+        # a scalar contains no datacubes, so it never has a for..return prelude;
+        # this way it does not depend on the parent, see _SCALAR_INTERN
+        return self._formatted
+
 
+_SCALAR_INTERN: dict[tuple[type, ScalarType], Scalar] = {
+    (type(value), value): Scalar(value) for value in (0, 1, -1, 2, 0.0, 1.0, True, False, '')
+}
+"""
+Shared :class:`Scalar` objects for common constants, used when a plain value such as
+the ``0`` in ``Datacube("cube") > 0`` is added as an operand. As they are operands of
+many expressions, their :attr:`WCPSExpr.parent` is left ``None``.
+"""
 
 class UnaryOp(WCPSExpr):
     """
     A base class for unary operators, e.g. logical NOT.
+
+    :param op: the operand
+    :param operator: the operator; by default the ``_default_operator`` class attribute
+        of subclasses for specific operators.
     """
 
-    def __init__(self, op: WCPSExpr, operator: str):
-        super().__init__(operands=[op])
-        self.operator = operator
+    __slots__ = ('_operator',)
 
-    def __str__(self):
-        return f'{super().__str__()}({self.operator} {self.operands[0]})'
+    operator = _RenderedAttribute()
+    """The operator, e.g. ``+``."""
+
+    _default_operator: str | None = None
+    """The operator, set by the subclasses for a specific operator."""
+
+    def __init__(self, op: WCPSExpr, operator: str | None = None):
+        super().__init__()
+        self.operands = (self._to_operand(op),)
+        # a new expression has nothing cached, so the slot is set directly
+        self._operator = _intern(operator) if operator is not None else self._default_operator
+        if self._operator is None:
+            raise WCPSClientException(f"No operator specified for {type(self).__name__}.")
+
+    def _parts(self):
+        return '(', self.operator, ' ', self.operands[0], ')'
 
 
 class BinaryOp(WCPSExpr):
     """
     A base class for binary operators, e.g. logical AND.
+
+    Chains of an associative operator are flattened into a single expression with
+    more than two operands, e.g. ``Add(Add(a, b), c)`` is rendered as ``(a + b + c)``.
+    Only the left operand is flattened, which preserves the evaluation order of the
+    left-associative WCPS operators.
+
+    :param op1: the first operand
+    :param op2: the second operand
+    :param operator: the operator; by default the ``_default_operator`` class attribute
+        of subclasses for specific operators.
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr, operator: str):
-        super().__init__(operands=[op1, op2])
-        self.operator = operator
+    __slots__ = ('_operator',)
 
-    def __str__(self):
-        return f'{super().__str__()}({self.operands[0]} {self.operator} {self.operands[1]})'
+    operator = _RenderedAttribute()
+    """The operator, e.g. ``+``."""
+
+    _default_operator: str | None = None
+    """The operator, set by the subclasses for a specific operator."""
+
+    _associative = False
+    """Whether chains of this operator are flattened; set by the associative subclasses."""
+
+    def __init__(self, op1: WCPSExpr, op2: WCPSExpr, operator: str | None = None):
+        super().__init__(operands=[op1, op2])
+        # a new expression has nothing cached, so the slot is set directly
+        self._operator = _intern(operator) if operator is not None else self._default_operator
+        if self._operator is None:
+            raise WCPSClientException(f"No operator specified for {type(self).__name__}.")
+        left = self.operands[0]
+        if (self._associative and type(left) is type(self) and  # pylint: disable=unidiomatic-typecheck
+                left.operator == self._operator):
+            for op in left.operands:
+                if op.parent is left:
+                    op.parent = self
+            self.operands[0:1] = left.operands
+
+    def _parts(self):
+        return '(', *_join_parts(self.operands, f' {self.operator} '), ')'
 
 
 class UnaryFunc(WCPSExpr):
     """
     A base class for unary functions, e.g. :class:`Abs`.
+
+    :param op: the operand
+    :param func: the function name; by default the ``_default_func`` class attribute
+        of subclasses for specific functions.
     """
 
-    def __init__(self, op: WCPSExpr, func: str):
-        super().__init__(operands=[op])
-        self.func = func
+    __slots__ = ('_func',)
 
-    def __str__(self):
-        return f'{super().__str__()}{self.func}({self.operands[0]})'
+    func = _RenderedAttribute()
+    """The function name, e.g. ``sum``."""
+
+    _default_func: str | None = None
+    """The function name, set by the subclasses for a specific function."""
+
+    _func_open: str | None = None
+    """The function name followed by ``(``, precomputed from ``_default_func`` for each subclass."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._default_func is not None:
+            cls._func_open = sys.intern(f'{cls._default_func}(')
+
+    def __init__(self, op: WCPSExpr, func: str | None = None):
+        super().__init__()
+        self.operands = (self._to_operand(op),)
+        # a new expression has nothing cached, so the slot is set directly
+        self._func = _intern(func) if func is not None else self._default_func
+        if self._func is None:
+            raise WCPSClientException(f"No func specified for {type(self).__name__}.")
+
+    def _parts(self):
+        func = self._func
+        if func is self._default_func:
+            return self._func_open, self.operands[0], ')'
+        return func, '(', self.operands[0], ')'
 
 
 class BinaryFunc(WCPSExpr):
     """
     A base class for binary functions, e.g. :class:`Pow`.
+
+    :param op1: the first operand
+    :param op2: the second operand
+    :param func: the function name; by default the ``_default_func`` class attribute
+        of subclasses for specific functions.
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr, func: str):
+    __slots__ = ('_func',)
+
+    func = _RenderedAttribute()
+    """The function name, e.g. ``sum``."""
+
+    _default_func: str | None = None
+    """The function name, set by the subclasses for a specific function."""
+
+    def __init__(self, op1: WCPSExpr, op2: WCPSExpr, func: str | None = None):
         super().__init__(operands=[op1, op2])
-        self.func = func
+        # a new expression has nothing cached, so the slot is set directly
+        self._func = _intern(func) if func is not None else self._default_func
+        if self._func is None:
+            raise WCPSClientException(f"No func specified for {type(self).__name__}.")
 
-    def __str__(self):
-        return f'{super().__str__()}{self.func}({self.operands[0]}, {self.operands[1]})'
+    def _parts(self):
+        return self.func, '(', self.operands[0], ', ', self.operands[1], ')'
 
 
 # ---------------------------------------------------------------------------------
@@ -1342,8 +1489,10 @@ class Add(BinaryOp):
     - ``Add(5, Datacube("test1"))``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '+')
+    __slots__ = ()
+
+    _default_operator = '+'
+    _associative = True
 
 
 class Sub(BinaryOp):
@@ -1357,8 +1506,9 @@ class Sub(BinaryOp):
     - ``Sub(5, Datacube("test1"))``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '-')
+    __slots__ = ()
+
+    _default_operator = '-'
 
 
 class Mul(BinaryOp):
@@ -1372,8 +1522,10 @@ class Mul(BinaryOp):
     - ``Mul(5, Datacube("test1"))``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '*')
+    __slots__ = ()
+
+    _default_operator = '*'
+    _associative = True
 
 
 class Div(BinaryOp):
@@ -1387,8 +1539,9 @@ class Div(BinaryOp):
     - ``Div(5, Datacube("test1"))``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '/')
+    __slots__ = ()
+
+    _default_operator = '/'
 
 
 class Mod(BinaryFunc):
@@ -1402,8 +1555,9 @@ class Mod(BinaryFunc):
     - ``Mod(5, Datacube("test1"))``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, 'mod')
+    __slots__ = ()
+
+    _default_func = 'mod'
 
 
 class Abs(UnaryFunc):
@@ -1416,8 +1570,9 @@ class Abs(UnaryFunc):
     - ``Abs(-5)``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'abs')
+    __slots__ = ()
+
+    _default_func = 'abs'
 
 
 class Round(UnaryFunc):
@@ -1430,8 +1585,9 @@ class Round(UnaryFunc):
     - ``Round(-5.4)``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'round')
+    __slots__ = ()
+
+    _default_func = 'round'
 
 
 class Floor(UnaryFunc):
@@ -1444,8 +1600,9 @@ class Floor(UnaryFunc):
     - ``Floor(-5.4)``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'floor')
+    __slots__ = ()
+
+    _default_func = 'floor'
 
 
 class Ceil(UnaryFunc):
@@ -1458,8 +1615,9 @@ class Ceil(UnaryFunc):
     - ``Ceil(-5.4)``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'ceil')
+    __slots__ = ()
+
+    _default_func = 'ceil'
 
 
 # ---------------------------------------------------------------------------------
@@ -1474,8 +1632,9 @@ class Exp(UnaryFunc):
     - ``Exp(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'exp')
+    __slots__ = ()
+
+    _default_func = 'exp'
 
 
 class Log(UnaryFunc):
@@ -1487,8 +1646,9 @@ class Log(UnaryFunc):
     - ``Log(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'log')
+    __slots__ = ()
+
+    _default_func = 'log'
 
 
 class Ln(UnaryFunc):
@@ -1500,8 +1660,9 @@ class Ln(UnaryFunc):
     - ``Ln(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'ln')
+    __slots__ = ()
+
+    _default_func = 'ln'
 
 
 class Sqrt(UnaryFunc):
@@ -1513,8 +1674,9 @@ class Sqrt(UnaryFunc):
     - ``Sqrt(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'sqrt')
+    __slots__ = ()
+
+    _default_func = 'sqrt'
 
 
 class Pow(BinaryFunc):
@@ -1527,8 +1689,9 @@ class Pow(BinaryFunc):
     - ``Pow(Datacube("test1"), 5)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, 'pow')
+    __slots__ = ()
+
+    _default_func = 'pow'
 
 
 # ---------------------------------------------------------------------------------
@@ -1543,8 +1706,9 @@ class Sin(UnaryFunc):
     - ``Sin(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'sin')
+    __slots__ = ()
+
+    _default_func = 'sin'
 
 
 class Cos(UnaryFunc):
@@ -1556,8 +1720,9 @@ class Cos(UnaryFunc):
     - ``Cos(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'cos')
+    __slots__ = ()
+
+    _default_func = 'cos'
 
 
 class Tan(UnaryFunc):
@@ -1569,8 +1734,9 @@ class Tan(UnaryFunc):
     - ``Tan(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'tan')
+    __slots__ = ()
+
+    _default_func = 'tan'
 
 
 class Sinh(UnaryFunc):
@@ -1582,8 +1748,9 @@ class Sinh(UnaryFunc):
     - ``Sinh(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'sinh')
+    __slots__ = ()
+
+    _default_func = 'sinh'
 
 
 class Cosh(UnaryFunc):
@@ -1595,8 +1762,9 @@ class Cosh(UnaryFunc):
     - ``Cosh(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'cosh')
+    __slots__ = ()
+
+    _default_func = 'cosh'
 
 
 class Tanh(UnaryFunc):
@@ -1608,8 +1776,9 @@ class Tanh(UnaryFunc):
     - ``Tanh(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'tanh')
+    __slots__ = ()
+
+    _default_func = 'tanh'
 
 
 class ArcSin(UnaryFunc):
@@ -1621,8 +1790,9 @@ class ArcSin(UnaryFunc):
     - ``ArcSin(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'arcsin')
+    __slots__ = ()
+
+    _default_func = 'arcsin'
 
 
 class ArcCos(UnaryFunc):
@@ -1634,8 +1804,9 @@ class ArcCos(UnaryFunc):
     - ``ArcCos(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'arccos')
+    __slots__ = ()
+
+    _default_func = 'arccos'
 
 
 class ArcTan(UnaryFunc):
@@ -1647,8 +1818,9 @@ class ArcTan(UnaryFunc):
     - ``ArcTan(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'arctan')
+    __slots__ = ()
+
+    _default_func = 'arctan'
 
 
 class ArcTan2(UnaryFunc):
@@ -1660,8 +1832,9 @@ class ArcTan2(UnaryFunc):
     - ``ArcTan2(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'arctan2')
+    __slots__ = ()
+
+    _default_func = 'arctan2'
 
 
 # ---------------------------------------------------------------------------------
@@ -1677,8 +1850,9 @@ class Gt(BinaryOp):
     - ``Gt(Datacube("test1"), 10)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '>')
+    __slots__ = ()
+
+    _default_operator = '>'
 
 
 class Lt(BinaryOp):
@@ -1691,8 +1865,9 @@ class Lt(BinaryOp):
     - ``Lt(Datacube("test1"), 10)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '<')
+    __slots__ = ()
+
+    _default_operator = '<'
 
 
 class Ge(BinaryOp):
@@ -1705,8 +1880,9 @@ class Ge(BinaryOp):
     - ``Ge(Datacube("test1"), 10)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '>=')
+    __slots__ = ()
+
+    _default_operator = '>='
 
 
 class Le(BinaryOp):
@@ -1719,8 +1895,9 @@ class Le(BinaryOp):
     - ``Le(Datacube("test1"), 10)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '<=')
+    __slots__ = ()
+
+    _default_operator = '<='
 
 
 class Eq(BinaryOp):
@@ -1733,8 +1910,9 @@ class Eq(BinaryOp):
     - ``Eq(Datacube("test1"), 10)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '=')
+    __slots__ = ()
+
+    _default_operator = '='
 
 
 class Ne(BinaryOp):
@@ -1747,8 +1925,9 @@ class Ne(BinaryOp):
     - ``Ne(Datacube("test1"), 10)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, '!=')
+    __slots__ = ()
+
+    _default_operator = '!='
 
 
 # ---------------------------------------------------------------------------------
@@ -1764,8 +1943,10 @@ class And(BinaryOp):
     - ``And(Datacube("test1"), True)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, 'and')
+    __slots__ = ()
+
+    _default_operator = 'and'
+    _associative = True
 
 
 class Or(BinaryOp):
@@ -1778,8 +1959,10 @@ class Or(BinaryOp):
     - ``Or(Datacube("test1"), False)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, 'or')
+    __slots__ = ()
+
+    _default_operator = 'or'
+    _associative = True
 
 
 class Xor(BinaryOp):
@@ -1792,8 +1975,10 @@ class Xor(BinaryOp):
     - ``Xor(Datacube("test1"), True)``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, 'xor')
+    __slots__ = ()
+
+    _default_operator = 'xor'
+    _associative = True
 
 
 class Not(UnaryOp):
@@ -1806,8 +1991,9 @@ class Not(UnaryOp):
     - ``Not(True)``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'not')
+    __slots__ = ()
+
+    _default_operator = 'not'
 
 
 class Overlay(BinaryOp):
@@ -1822,8 +2008,10 @@ class Overlay(BinaryOp):
     - ``Overlay(Datacube("test1"), Datacube("test2"))``
     """
 
-    def __init__(self, op1: WCPSExpr, op2: WCPSExpr):
-        super().__init__(op1, op2, 'overlay')
+    __slots__ = ()
+
+    _default_operator = 'overlay'
+    _associative = True
 
 
 class Bit(BinaryFunc):
@@ -1839,6 +2027,8 @@ class Bit(BinaryFunc):
     - ``Bit(Datacube("test1", 5)``
     """
 
+    __slots__ = ()
+
     def __init__(self, op: WCPSExpr, pos: WCPSExpr):
         super().__init__(op, pos, 'bit')
 
@@ -1851,12 +2041,16 @@ class Band(WCPSExpr):
     Select a field (band, channel) from a multiband operand.
     """
 
+    __slots__ = ('_field',)
+
+    field = _RenderedAttribute()
+
     def __init__(self, op: WCPSExpr, field: [str | int]):
         super().__init__(operands=[op])
         self.field = field
 
-    def __str__(self):
-        return f'{super().__str__()}{self.operands[0]}.{self.field}'
+    def _parts(self):
+        return self.operands[0], f'.{self.field}'
 
 
 class MultiBand(WCPSExpr):
@@ -1865,13 +2059,23 @@ class MultiBand(WCPSExpr):
     :param bands: a dictionary of (band name, value), e.g. {"red": cov1, "blue": 2}
     """
 
+    __slots__ = ('_bands',)
+
+    bands = _RenderedAttribute()
+
     def __init__(self, bands: dict):
         super().__init__(operands=list(bands.values()))
         self.bands = bands
 
-    def __str__(self):
-        bands = [f'{k}: {v}' for k, v in self.bands.items()]
-        return f'{super().__str__()}{{{"; ".join(bands)}}}'
+    def _parts(self):
+        # the separator is emitted together with the band name of all but the first band
+        parts = ['{']
+        sep = ''
+        for k, v in self.bands.items():
+            parts += (f'{sep}{k}: ', v)
+            sep = '; '
+        parts.append('}')
+        return parts
 
 
 def rgb(r: OperandType, g: OperandType, b: OperandType) -> MultiBand:
@@ -1943,30 +2147,61 @@ class Axis(WCPSExpr):
     :raises WCPSClientException: If the axis name is empty.
     """
 
+    __slots__ = ('_axis_name', '_low', '_high', '_crs')
+
+    axis_name = _RenderedAttribute()
+    crs = _RenderedAttribute()
+
     MIN = '*'
     MAX = '*'
 
     def __init__(self, axis_name: str, low: BoundType, high: BoundType = None, crs: str = None):
-        super().__init__(operands=[low, high])
+        super().__init__()
+        self._low = low
+        self._high = high
+        self._update_bounds()
         if not axis_name:
             raise WCPSClientException("Axis name must not be empty.")
-        self.axis_name = axis_name
-        self.low = low
-        self.high = high
-        self.crs = crs
+        self.axis_name = _intern(axis_name)
+        self.crs = _intern(crs)
+
+    @property
+    def low(self) -> BoundType:
+        """The lower bound, or the slice point if :attr:`high` is ``None``."""
+        return self._low
+
+    @low.setter
+    def low(self, low: BoundType):
+        self._low = low
+        self._update_bounds()
+
+    @property
+    def high(self) -> BoundType | None:
+        """The upper bound; ``None`` for a slice."""
+        return self._high
+
+    @high.setter
+    def high(self, high: BoundType | None):
+        self._high = high
+        self._update_bounds()
+
+    def _update_bounds(self):
+        # the bounds are stored in a tuple, without the None high bound of a slice
+        self.operands = tuple([self._to_operand(op) for op in (self._low, self._high) if op is not None])
+        self._invalidate()
 
     def __str__(self):
-        ret = self.axis_name
+        # MIN / MAX bounds are rendered without quotes
+        # pylint: disable=unidiomatic-typecheck
+        bounds = ':'.join(['*' if type(op) is Scalar and op.op == '*' else str(op)
+                           for op in self.operands])
         if self.crs is not None:
-            ret += f':"{self.crs}"'
-        operands = [str(op) for op in self.operands]
-        operands = [op if op != '"*"' else '*' for op in operands]
-        ret += f'({":".join(operands)})'
-        return ret
+            return f'{self.axis_name}:"{self.crs}"({bounds})'
+        return f'{self.axis_name}({bounds})'
 
     @staticmethod
-    def get_axis_list(axes: Union[Axis, slice, tuple[Axis], AxisTuple, tuple[AxisTuple],
-    tuple[slice], list[Axis], list[AxisTuple]]) -> list[Axis]:
+    def get_axis_list(axes: Axis | slice | tuple[Axis] | AxisTuple | tuple[AxisTuple] |
+                      tuple[slice] | list[Axis] | list[AxisTuple]) -> list[Axis]:
         """
         Normalizes ``axes`` into a list of Axis objects.
         :param axes: may be:
@@ -1986,40 +2221,49 @@ class Axis(WCPSExpr):
             # $c[Axis(..)]
             return [axes]
         if isinstance(axes, slice):
-            return [Axis(axis_name=axes.start, low=axes.stop, high=axes.step)]
-        if isinstance(axes, tuple):
-            if isinstance(axes[0], Axis):
+            return [Axis._from_slice(axes)]
+        if isinstance(axes, (tuple, list)) and axes:
+            first = axes[0]
+            if isinstance(first, Axis):
                 # $c[Axis(..), Axis(..), ..]
-                Axis._validate_all_same_type(axes, Axis, "Axis")
-                return list(axes)
-            if isinstance(axes[0], str):
-                # $c[("X", ..)]
-                return [Axis(*axes)]
-            if isinstance(axes[0], tuple):
+                if all(type(axis) is Axis for axis in axes):  # pylint: disable=unidiomatic-typecheck
+                    # common case of exactly Axis objects, no conversion needed
+                    return list(axes)
+                return Axis._convert_all(axes, Axis, "Axis", None)
+            if isinstance(first, tuple):
                 # $c[("X", ..), ("Y", ..), ..]
-                Axis._validate_all_same_type(axes, tuple, "tuple")
-                return [Axis(*axis) for axis in axes]
-            if isinstance(axes[0], slice):
-                Axis._validate_all_same_type(axes, slice, "slice")
-                return [Axis(axis_name=s.start, low=s.stop, high=s.step) for s in axes]
-        if isinstance(axes, list):
-            if isinstance(axes[0], Axis):
-                # $c[Axis(..), Axis(..), ..]
-                Axis._validate_all_same_type(axes, Axis, "Axis")
-                return axes
-            if isinstance(axes[0], tuple):
-                # $c[("X", ..), ("Y", ..), ..]
-                Axis._validate_all_same_type(axes, tuple, "tuple")
-                return [Axis(*axis) for axis in axes]
+                return Axis._convert_all(axes, tuple, "tuple", lambda axis: Axis(*axis))
+            if isinstance(axes, tuple):
+                if isinstance(first, str):
+                    # $c[("X", ..)]
+                    return [Axis(*axes)]
+                if isinstance(first, slice):
+                    # $c["X":.., "Y":..]
+                    return Axis._convert_all(axes, slice, "slice", Axis._from_slice)
 
         raise WCPSClientException("Invalid subsetting operation, expected one or more Axis objects, "
                                   "or tuples of the shape: (axis_name, low, high, crs)")
 
     @staticmethod
-    def _validate_all_same_type(axes, axis_type, axis_type_str):
-        if not all(isinstance(a, axis_type) for a in axes):
-            raise WCPSClientException(f"Mixed types of axis specifications provided,"
-                                      f"expected all objects to be of type {axis_type_str}.")
+    def _convert_all(axes, axis_type, axis_type_str, convert) -> list[Axis]:
+        """
+        Convert each item of ``axes`` to an :class:`Axis` with ``convert`` (or keep it as is if
+        ``convert`` is ``None``), checking in the same pass that all items are of ``axis_type``.
+        """
+        ret = []
+        for axis in axes:
+            if not isinstance(axis, axis_type):
+                raise WCPSClientException(f"Mixed types of axis specifications provided,"
+                                          f"expected all objects to be of type {axis_type_str}.")
+            ret.append(axis if convert is None else convert(axis))
+        return ret
+
+    @staticmethod
+    def _from_slice(axis: slice) -> Axis:
+        """
+        :return: an :class:`Axis` for a slice such as ``"X":1`` or ``"X":1:15.3``.
+        """
+        return Axis(axis_name=axis.start, low=axis.stop, high=axis.step)
 
 
 class Subset(WCPSExpr):
@@ -2027,12 +2271,13 @@ class Subset(WCPSExpr):
     Select a spatio-temporal area from a coverage operand.
     """
 
+    __slots__ = ()
+
     def __init__(self, op: WCPSExpr, axes):
-        super().__init__(operands=[op] + Axis.get_axis_list(axes))
+        super().__init__(operands=[op, *Axis.get_axis_list(axes)])
 
-    def __str__(self):
-        axis_subsets_str = _list_to_str(self.operands[1:], ', ')
-        return f'{super().__str__()}{self.operands[0]}[{axis_subsets_str}]'
+    def _parts(self):
+        return self.operands[0], '[', *_join_parts(self.operands[1:], ', '), ']'
 
 
 class Extend(WCPSExpr):
@@ -2040,12 +2285,13 @@ class Extend(WCPSExpr):
     Enlarge a coverage with new areas set to null values.
     """
 
+    __slots__ = ()
+
     def __init__(self, op: WCPSExpr, axes):
-        super().__init__(operands=[op] + Axis.get_axis_list(axes))
+        super().__init__(operands=[op, *Axis.get_axis_list(axes)])
 
-    def __str__(self):
-        axis_subsets_str = _list_to_str(self.operands[1:], ', ')
-        return f'{super().__str__()}extend({self.operands[0]}, {{ {axis_subsets_str} }})'
+    def _parts(self):
+        return 'extend(', self.operands[0], ', { ', *_join_parts(self.operands[1:], ', '), ' })'
 
 
 class Scale(WCPSExpr):
@@ -2070,30 +2316,41 @@ class Scale(WCPSExpr):
             Scale(cov).by_factor_per_axis([0.5, 2])
     """
 
+    __slots__ = ('_axis_subsets', '_another_coverage', '_scale_factor', '_scale_factors', '_mode')
+
+    axis_subsets = _RenderedAttribute()
+    another_coverage = _RenderedAttribute()
+    scale_factor = _RenderedAttribute()
+    scale_factors = _RenderedAttribute()
+
+    # bits of _mode, one for each kind of scale target
+    _MODE_GRID_DOMAIN = 1
+    _MODE_GRID_DOMAIN_OF = 2
+    _MODE_FACTOR = 4
+    _MODE_FACTOR_PER_AXIS = 8
+
     def __init__(self, op: WCPSExpr):
         super().__init__(operands=[op])
         self.axis_subsets = None
         self.another_coverage = None
         self.scale_factor = None
         self.scale_factors = None
+        self._mode = 0
 
-    def __str__(self):
-        ret = f'{super().__str__()}scale({self.operands[0]}, {{ '
-
+    def _parts(self):
         if self.axis_subsets is not None:
-            ret += _list_to_str(self.operands[1:], ', ')
+            target = _join_parts(self.operands[1:], ', ')
         elif self.another_coverage is not None:
-            ret += f'imageCrsDomain({self.another_coverage})'
+            target = ['imageCrsDomain(', self.another_coverage, ')']
         elif self.scale_factor is not None:
-            return f'{super().__str__()}scale({self.operands[0]}, {self.scale_factor})'
+            return 'scale(', self.operands[0], f', {self.scale_factor})'
         elif self.scale_factors is not None:
-            ret += _list_to_str(self.operands[1:], ', ')
+            target = _join_parts(self.operands[1:], ', ')
         else:
             raise WCPSClientException("No scale target specified, exactly one of to_explicit_grid_domain, "
                                       "to_grid_domain_of, by_factor, or by_factor_per_axis must be executed.")
 
-        ret += ' })'
-        return ret
+        return 'scale(', self.operands[0], ', { ', *target, ' })'
 
     def to_explicit_grid_domain(self, grid_axes):
         """
@@ -2101,10 +2358,9 @@ class Scale(WCPSExpr):
 
         :param grid_axes: a list of :class:`Axis`
         """
+        self._validate_exclusive(self._MODE_GRID_DOMAIN)
         self.axis_subsets = Axis.get_axis_list(grid_axes)
-        for axis in self.axis_subsets:
-            self.add_operand(axis)
-        self._validate_exclusive()
+        self.add_operands(self.axis_subsets)
         return self
 
     def to_grid_domain_of(self, another_coverage: WCPSExpr):
@@ -2113,35 +2369,37 @@ class Scale(WCPSExpr):
 
         :param another_coverage: a coverage expression
         """
+        self._validate_exclusive(self._MODE_GRID_DOMAIN_OF)
         self.another_coverage = another_coverage
         self.add_operand(another_coverage)
-        self._validate_exclusive()
         return self
 
-    def by_factor(self, scale_factor: Union[int, float]):
+    def by_factor(self, scale_factor: int | float):
         """
         :param scale_factor: factor > 1 for scaling up, 0 < factor < 1 for scaling down
         """
         self._validate_scale_factor(scale_factor)
+        self._validate_exclusive(self._MODE_FACTOR)
         self.scale_factor = scale_factor
         self.add_operand(self.scale_factor)
-        self._validate_exclusive()
         return self
 
     def by_factor_per_axis(self, scale_factors):
         """
         :param scale_factors: a list of Axis(name, factor)
         """
-        self.scale_factors = Axis.get_axis_list(scale_factors)
-        for axis in self.scale_factors:
-            self.add_operand(axis)
+        axes = Axis.get_axis_list(scale_factors)
+        # all axes are validated before modifying this expression
+        for axis in axes:
             if axis.high is not None:
                 raise WCPSClientException("When scaling by axis factors only a single factor "
                                           "per axis should be specified.")
             if axis.crs is not None:
                 raise WCPSClientException("When scaling by axis factors a CRS must not be specified.")
             self._validate_scale_factor(axis.low)
-        self._validate_exclusive()
+        self._validate_exclusive(self._MODE_FACTOR_PER_AXIS)
+        self.scale_factors = axes
+        self.add_operands(axes)
         return self
 
     def _validate_scale_factor(self, scale_factor):
@@ -2151,21 +2409,25 @@ class Scale(WCPSExpr):
         :raises WCPSClientException: if the scale factor is invalid type of <= 0.
         :meta private:
         """
-        if not isinstance(scale_factor, (float, int)):
+        factor_type = type(scale_factor)
+        if factor_type is not float and factor_type is not int and not isinstance(scale_factor, (float, int)):
             raise WCPSClientException(f"Expected a number scale factor, got {type(scale_factor)}.")
         if scale_factor <= 0:
             raise WCPSClientException("Scale factor must be greater than zero.")
 
-    def _validate_exclusive(self):
+    def _validate_exclusive(self, mode: int):
         """
-        Check that only one scale target is specified.
+        Check that only one scale target is specified, including the new one ``mode``.
+        :param mode: one of the ``_MODE_*`` bits, for the scale target to be set.
         :raises WCPSClientException: if multiple scale targets were specified.
         """
-        values = [self.axis_subsets, self.another_coverage, self.scale_factor, self.scale_factors]
-        if sum(1 for x in values if x is not None) > 1:
+        mode |= self._mode
+        # more than one bit set
+        if mode & (mode - 1):
             raise WCPSClientException("Cannot set multiple scale specifications, exactly one of "
                                       "to_explicit_grid_domain, to_grid_domain_of, by_factor, or "
                                       "by_factor_per_axis must be executed.")
+        self._mode = mode
 
 # ---------------------------------------------------------------------------------
 # reprojection
@@ -2190,7 +2452,13 @@ class ResampleAlg(StrEnum):
     @classmethod
     def list(cls):
         """:return: a list of the Enum values."""
-        return list(map(lambda c: c.value, cls))
+        return [c.value for c in cls]
+
+
+_RESAMPLE_ALG_VALUES = frozenset(ResampleAlg.list())
+"""The :class:`ResampleAlg` values, for constant-time validation of string arguments."""
+_RESAMPLE_ALG_VALUES_STR = ', '.join(ResampleAlg.list())
+"""The :class:`ResampleAlg` values listed in validation error messages."""
 
 
 class Reproject(WCPSExpr):
@@ -2206,34 +2474,60 @@ class Reproject(WCPSExpr):
 
     :param interpolation_method: one of the :class:`ResampleAlg` constants,
         e.g. :const:`ResampleAlg.BILINEAR`.
+    :param axis_resolutions: optional target axis resolutions, see :meth:`to_axis_resolutions`
+    :param axis_subsets: optional axis subsets to crop the result, see :meth:`subset_by_axes`
+    :param subset_domain: optional coverage expression to crop the result to its domain,
+        see :meth:`subset_by_coverage_domain`; it cannot be specified together with ``axis_subsets``.
+
+    If ``op`` is already reprojected to the same CRS as ``target_crs`` (in any of the formats
+    above), and no axis resolutions or subsets are specified, the reprojection is an identity
+    and only ``op`` is rendered in the query.
     """
 
+    __slots__ = ('_target_crs', '_interpolation_method', '_axis_resolutions', '_axis_subsets', '_subset_domain')
+
+    target_crs = _RenderedAttribute()
+    interpolation_method = _RenderedAttribute()
+    axis_resolutions = _RenderedAttribute()
+    axis_subsets = _RenderedAttribute()
+    subset_domain = _RenderedAttribute()
+
     def __init__(self, op: WCPSExpr, target_crs: str,
-                 interpolation_method: ResampleAlg = None):
+                 interpolation_method: ResampleAlg = None,
+                 axis_resolutions=None, axis_subsets=None, subset_domain: WCPSExpr = None):
         super().__init__(operands=[op])
         self.target_crs: str = self._validate_crs(target_crs)
         self.interpolation_method = self._validate_interpolation_method(interpolation_method)
-        self.axis_resolutions: Optional[list[Axis]] = None
-        self.axis_subsets: Optional[list[Axis]] = None
-        self.subset_domain: Optional[WCPSExpr] = None
+        self.axis_resolutions: list[Axis] | None = None
+        self.axis_subsets: list[Axis] | None = None
+        self.subset_domain: WCPSExpr | None = None
+        if axis_subsets is not None and subset_domain is not None:
+            raise WCPSClientException("Reproject accepts either axis_subsets or subset_domain, not both.")
+        if axis_resolutions is not None:
+            self.to_axis_resolutions(axis_resolutions)
+        if axis_subsets is not None:
+            self.subset_by_axes(axis_subsets)
+        elif subset_domain is not None:
+            self.subset_by_coverage_domain(subset_domain)
 
-    def __str__(self):
-        ret = f'{super().__str__()}crsTransform({self.operands[0]}, "{self.target_crs}"'
+    def _parts(self):
+        if (self.axis_resolutions is None and self.axis_subsets is None and
+                self.subset_domain is None and self._is_identity()):
+            return (self.operands[0],)
+        parts = ['crsTransform(', self.operands[0], f', "{self.target_crs}"']
 
         if self.interpolation_method is not None:
-            ret += ', { ' + str(self.interpolation_method) + ' }'
+            parts += (', { ', self.interpolation_method, ' }')
         if self.axis_resolutions is not None:
-            axis_subsets = [f'{axis.axis_name}:{axis.low}' for axis in self.axis_resolutions]
-            axis_subsets_str = ', '.join(axis_subsets)
-            ret += f', {{ {axis_subsets_str} }}'
+            resolutions = ', '.join(f'{axis.axis_name}:{axis.low}' for axis in self.axis_resolutions)
+            parts.append(f', {{ {resolutions} }}')
         if self.axis_subsets is not None:
-            axis_subsets_str = _list_to_str(self.axis_subsets, ', ')
-            ret += f', {{ {axis_subsets_str} }}'
+            parts += (', { ', *_join_parts(self.axis_subsets, ', '), ' }')
         elif self.subset_domain is not None:
-            ret += f', {{ domain({self.subset_domain}) }}'
+            parts += (', { domain(', self.subset_domain, ') }')
 
-        ret += ')'
-        return ret
+        parts.append(')')
+        return parts
 
     def to_axis_resolutions(self, axis_resolutions) -> Reproject:
         """
@@ -2250,14 +2544,16 @@ class Reproject(WCPSExpr):
             Reproject(cov1, "EPSG:4326", ResampleAlg.AVERAGE)
                 .to_axis_resolutions([("X", 1.5), ("Y", 2)])
         """
-        self.axis_resolutions = Axis.get_axis_list(axis_resolutions)
-        for axis in self.axis_resolutions:
-            self.add_operand(axis)
+        axes = Axis.get_axis_list(axis_resolutions)
+        # all axes are validated before modifying this expression
+        for axis in axes:
             if axis.high is not None:
                 raise WCPSClientException("When reprojecting to axis resolutions only a single "
                                           "resolution per axis should be specified.")
             if axis.crs is not None:
                 raise WCPSClientException("When reprojecting to axis resolutions a CRS must not be specified.")
+        self.axis_resolutions = axes
+        self.add_operands(axes)
         return self
 
     def subset_by_axes(self, axis_subsets) -> Reproject:
@@ -2275,14 +2571,16 @@ class Reproject(WCPSExpr):
             Reproject(cov1, "EPSG:4326")
                 .subset_by_axes([("X", 1.5, 2.5), ("Y", 2, 4)])
         """
-        self.axis_subsets = Axis.get_axis_list(axis_subsets)
-        for axis in self.axis_subsets:
-            self.add_operand(axis)
+        axes = Axis.get_axis_list(axis_subsets)
+        # all axes are validated before modifying this expression
+        for axis in axes:
             if axis.high is None:
                 raise WCPSClientException("When reprojecting, an axis subset must include "
                                           "both lower and upper bounds.")
             if axis.crs is not None:
                 raise WCPSClientException("When reprojecting, an axis subset must not include a CRS.")
+        self.axis_subsets = axes
+        self.add_operands(axes)
         return self
 
     def subset_by_coverage_domain(self, subset_domain) -> Reproject:
@@ -2305,30 +2603,44 @@ class Reproject(WCPSExpr):
         self.add_operand(self.subset_domain)
         return self
 
+    def _is_identity(self) -> bool:
+        """
+        :return: True if op is a reprojection to the same CRS as the current target_crs.
+        """
+        source = self.operands[0]
+        if not isinstance(source, Reproject):
+            return False
+        if source.target_crs is self.target_crs:
+            return True
+        crs = _canonical_crs(self.target_crs)
+        return crs is not None and crs == _canonical_crs(source.target_crs)
+
     def _validate_crs(self, crs: str) -> str:
         """
         Validate the CRS string format.
+
+        :return: the interned CRS string, shared by all reprojections to the same CRS.
         """
         if not crs:
             raise WCPSClientException("Reproject target_crs cannot be empty.")
-        return crs
+        return _intern(crs)
 
-    def _validate_interpolation_method(self, method: Union[ResampleAlg, str]) -> Union[ResampleAlg, str, None]:
+    def _validate_interpolation_method(self, method: ResampleAlg | str) -> ResampleAlg | str | None:
         """
         Validate and convert the interpolation method to a ResampleAlg enum.
         :param method: The interpolation method to validate.
-        :return: The validated ResampleAlg enum or None if validation fails.
+        :return: The validated interpolation method as a plain string (the value of a
+            ResampleAlg enum), or None if no method is given.
         :raise: :class:`WCPSClientException` if the interpolation method is invalid.
         :meta private:
         """
         if method is None:
             return None
         if isinstance(method, str):
-            method = method.strip()
-            allowed_methods = ResampleAlg.list()
-            if method not in allowed_methods:
+            method = _intern(method.strip())
+            if method not in _RESAMPLE_ALG_VALUES:
                 raise WCPSClientException(f"Invalid interpolation method '{method}', "
-                                          f"expected one of: {', '.join(allowed_methods)}.")
+                                          f"expected one of: {_RESAMPLE_ALG_VALUES_STR}.")
             return method
         if isinstance(method, ResampleAlg):
             return method
@@ -2362,7 +2674,13 @@ class CastType(StrEnum):
     @classmethod
     def list(cls):
         """:return: a list of the Enum values."""
-        return list(map(lambda c: c.value, cls))
+        return [c.value for c in cls]
+
+
+_CAST_TYPE_VALUES = frozenset(CastType.list())
+"""The :class:`CastType` values, for constant-time validation of string arguments."""
+_CAST_TYPE_VALUES_STR = ', '.join(CastType.list())
+"""The :class:`CastType` values listed in validation error messages."""
 
 
 class Cast(WCPSExpr):
@@ -2377,43 +2695,47 @@ class Cast(WCPSExpr):
     - ``Cast(Datacube("test"), CastType.CHAR)``
     """
 
-    def __init__(self, op: OperandType, target_type: Union[CastType, str] = None):
+    __slots__ = ('_target_type',)
+
+    target_type = _RenderedAttribute()
+
+    def __init__(self, op: OperandType, target_type: CastType | str = None):
         super().__init__(operands=[op])
         self.target_type = self._validate_target_type(target_type)
 
-    def __str__(self):
+    def _parts(self):
         """
-        :return: A WCPS query string corresponding to this expression.
+        :return: the parts of the WCPS query string corresponding to this expression.
         :raise: :class:`WCPSClientException` if no :attr:`target_type` has been set.
         """
         if self.target_type is None:
             raise WCPSClientException("No target type to which to cast the operand was provided.")
-        return f'{super().__str__()}(({self.target_type}) {self.operands[0]})'
+        return '((', self.target_type, ') ', self.operands[0], ')'
 
-    def to(self, target_type: Union[CastType, str]) -> Cast:
+    def to(self, target_type: CastType | str) -> Cast:
         """
         Specify the type to which to cast this operand.
         :param target_type: must be one of the :class:`CastType` constants, e.g. :const:`CastType.CHAR`.
         """
-        self.target_type = target_type
+        self.target_type = self._validate_target_type(target_type)
         return self
 
-    def _validate_target_type(self, target_type: Union[CastType, str]) -> Union[CastType, str, None]:
+    def _validate_target_type(self, target_type: CastType | str) -> CastType | str | None:
         """
         Validates and converts the target type to a CastType enum.
         :param target_type: The target type to be validated.
-        :return: The validated CastType enum or None if validation fails.
+        :return: The validated cast type as a plain string (the value of a CastType enum),
+            or None if no target type is given.
         :raise: :class:`WCPSClientException` if the target type is invalid.
         :meta private:
         """
         if target_type is None:
             return None
         if isinstance(target_type, str):
-            target_type = target_type.strip()
-            allowed_types = CastType.list()
-            if target_type not in allowed_types:
+            target_type = _intern(target_type.strip())
+            if target_type not in _CAST_TYPE_VALUES:
                 raise WCPSClientException(f"Invalid target cast type '{target_type}', "
-                                          f"expected one of: {', '.join(allowed_types)}.")
+                                          f"expected one of: {_CAST_TYPE_VALUES_STR}.")
             return target_type
         if isinstance(target_type, CastType):
             return target_type
@@ -2432,8 +2754,9 @@ class Sum(UnaryFunc):
     - ``Sum(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'sum')
+    __slots__ = ()
+
+    _default_func = 'sum'
 
 
 class Count(UnaryFunc):
@@ -2445,8 +2768,9 @@ class Count(UnaryFunc):
     - ``Count(Datacube("test1") > 5)``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'count')
+    __slots__ = ()
+
+    _default_func = 'count'
 
 
 class Avg(UnaryFunc):
@@ -2458,8 +2782,9 @@ class Avg(UnaryFunc):
     - ``Avg(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'avg')
+    __slots__ = ()
+
+    _default_func = 'avg'
 
 
 class Min(UnaryFunc):
@@ -2471,8 +2796,9 @@ class Min(UnaryFunc):
     - ``Min(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'min')
+    __slots__ = ()
+
+    _default_func = 'min'
 
 
 class Max(UnaryFunc):
@@ -2484,8 +2810,9 @@ class Max(UnaryFunc):
     - ``Max(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'max')
+    __slots__ = ()
+
+    _default_func = 'max'
 
 
 class All(UnaryFunc):
@@ -2497,8 +2824,9 @@ class All(UnaryFunc):
     - ``All(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'all')
+    __slots__ = ()
+
+    _default_func = 'all'
 
 
 class Some(UnaryFunc):
@@ -2510,8 +2838,9 @@ class Some(UnaryFunc):
     - ``Some(Datacube("test1"))``
     """
 
-    def __init__(self, op: WCPSExpr):
-        super().__init__(op, 'some')
+    __slots__ = ()
+
+    _default_func = 'some'
 
 
 class AxisIter(WCPSExpr):
@@ -2534,17 +2863,24 @@ class AxisIter(WCPSExpr):
     - ``AxisIter('$plat', 'Lat').of_geo_axis(Datacube("cov"))``
     """
 
+    __slots__ = ('_var_name', '_axis_name', '_low', '_high', '_grid_axis', '_geo_axis')
+
+    var_name = _RenderedAttribute()
+    axis_name = _RenderedAttribute()
+    low = _RenderedAttribute()
+    high = _RenderedAttribute()
+    grid_axis = _RenderedAttribute()
+    geo_axis = _RenderedAttribute()
+
     def __init__(self, var_name: str, axis_name: str):
         super().__init__()
         if not var_name or var_name == '':
             raise WCPSClientException("AxisIter var_name cannot be empty.")
-        if not var_name.startswith('$'):
-            var_name = '$' + var_name
-        self.var_name = var_name
+        self.var_name = _intern(var_name if var_name[0] == '$' else '$' + var_name)
         """unique iterator variable name"""
         if not axis_name or axis_name == '':
             raise WCPSClientException("AxisIter axis_name cannot be empty.")
-        self.axis_name = axis_name
+        self.axis_name = _intern(axis_name)
         """an axis over which it iterates"""
         self.low = None
         """optional lower iteration bound"""
@@ -2623,6 +2959,10 @@ class AxisIterRef(WCPSExpr):
         :meth:`Condense.where`, :meth:`Condense.using`, or :meth:`Coverage.values` methods.
     """
 
+    __slots__ = ('_iter_var',)
+
+    iter_var = _RenderedAttribute()
+
     def __init__(self, axis_iter: AxisIter):
         super().__init__()
         self.iter_var = axis_iter
@@ -2648,7 +2988,13 @@ class CondenseOp(StrEnum):
     @classmethod
     def list(cls):
         """:return: a list of the Enum values."""
-        return list(map(lambda c: c.value, cls))
+        return [c.value for c in cls]
+
+
+_CONDENSE_OP_VALUES = frozenset(CondenseOp.list())
+"""The :class:`CondenseOp` values, for constant-time validation of string arguments."""
+_CONDENSE_OP_VALUES_STR = ', '.join(CondenseOp.list())
+"""The :class:`CondenseOp` values listed in validation error messages."""
 
 
 class Condense(WCPSExpr):
@@ -2686,23 +3032,26 @@ class Condense(WCPSExpr):
             .using(cov1[('time', pt_ref)])
     """
 
+    __slots__ = ('_condense_op', '_iter_vars', '_using_clause', '_where_clause', '_iter_var_names')
+
+    condense_op = _RenderedAttribute()
+    using_clause = _RenderedAttribute()
+    where_clause = _RenderedAttribute()
+
     def __init__(self, condense_op: CondenseOp, over: list[AxisIter] = None,
                  using: WCPSExpr = None, where: WCPSExpr = None):
         operands = [where, using]
         if over is not None:
-            operands += over
+            operands.extend(over if isinstance(over, list) else (over,))
         super().__init__(operands=operands)
         self.condense_op = self._validate_condense_op(condense_op)
         """
         One of the :class:`CondenseOp` constants, e.g. :const:`CondenseOp.PLUS`
         """
         self.iter_vars = []
-        """
-        A list of :class:`AxisIter` forming the iteration domain for aggregation.
-        """
         if over is not None:
             if isinstance(over, list):
-                self.iter_vars = over
+                self.iter_vars = list(over)
             elif isinstance(over, AxisIter):
                 self.iter_vars = [over]
             else:
@@ -2710,18 +3059,29 @@ class Condense(WCPSExpr):
         self.using_clause = using
         self.where_clause = where
 
-    def __str__(self):
+    @property
+    def iter_vars(self) -> list[AxisIter]:
+        """A list of :class:`AxisIter` forming the iteration domain for aggregation."""
+        return self._iter_vars
+
+    @iter_vars.setter
+    def iter_vars(self, iter_vars: list[AxisIter]):
+        self._iter_vars = iter_vars
+        # names of the iter_vars, to check for duplicates in constant time in over()
+        self._iter_var_names = {v.var_name for v in iter_vars if isinstance(v, AxisIter)}
+        self._invalidate()
+
+    def _parts(self):
         """
-        :return: A WCPS query string corresponding to this expression.
+        :return: the parts of the WCPS query string corresponding to this expression.
         :raise: :class:`WCPSClientException` if no iterator variables or a using expression have been set.
         """
         self._validate()
-        over = _list_to_str(self.iter_vars, ', ')
-        ret = f'{super().__str__()}(condense {self.condense_op} over {over}'
+        parts = ['(condense ', self.condense_op, ' over ', *_join_parts(self.iter_vars, ', ')]
         if self.where_clause is not None:
-            ret += f' where {self.where_clause}'
-        ret += f' using {self.using_clause})'
-        return ret
+            parts += (' where ', self.where_clause)
+        parts += (' using ', self.using_clause, ')')
+        return parts
 
     def _validate(self):
         """
@@ -2735,25 +3095,24 @@ class Condense(WCPSExpr):
             if not isinstance(v, AxisIter):
                 raise WCPSClientException(f"Expected an AxisIter object in OVER clause, got {type(v)} instead.")
 
-    def _validate_condense_op(self, op: Union[CondenseOp, str]) -> Union[CondenseOp, str]:
+    def _validate_condense_op(self, op: CondenseOp | str) -> CondenseOp | str:
         """
         Validate that the condense_op is a valid CondenseOp member.
         """
         if op is None:
             raise WCPSClientException("No condense operation provided.")
         if isinstance(op, str):
-            op = op.strip()
-            allowed_ops = CondenseOp.list()
-            if op not in allowed_ops:
+            op = _intern(op.strip())
+            if op not in _CONDENSE_OP_VALUES:
                 raise WCPSClientException(f"Invalid condense operation '{op}', "
-                                          f"expected one of: {', '.join(allowed_ops)}.")
+                                          f"expected one of: {_CONDENSE_OP_VALUES_STR}.")
             return op
         if isinstance(op, CondenseOp):
             return op
         raise WCPSClientException(f"Invalid condense operation type '{type(op)}', "
                                   f"expected a CondenseOp or a string.")
 
-    def over(self, iter_var: Union[AxisIter, list[AxisIter]]) -> Condense:
+    def over(self, iter_var: AxisIter | list[AxisIter]) -> Condense:
         """
         Add an iterator variable to a `Condense` or a `Coverage` operand.
         Calling this method on another object type will raise a `WCPSClientException`.
@@ -2770,13 +3129,17 @@ class Condense(WCPSExpr):
         """
         if not isinstance(iter_var, list):
             iter_var = [iter_var]
+        # the names are added only if all iter_var are valid
+        names = set()
         for v in iter_var:
             if not isinstance(v, AxisIter):
                 raise WCPSClientException(f"Expected an AxisIter object in OVER clause, got {type(v)} instead.")
-            if any(v.var_name == e.var_name for e in self.iter_vars):
+            if v.var_name in self._iter_var_names or v.var_name in names:
                 raise WCPSClientException(f"Duplicate iterator variable name: {v.var_name}")
-            self.iter_vars.append(v)
-            self.add_operand(v)
+            names.add(v.var_name)
+        self._iter_var_names |= names
+        self.iter_vars.extend(iter_var)
+        self.add_operands(iter_var)
         return self
 
     def using(self, using: OperandType) -> Condense:
@@ -2836,18 +3199,25 @@ class Coverage(WCPSExpr):
                          ('Lon', plon_var.ref())]))
     """
 
+    __slots__ = ('_name', '_iter_vars', '_values_clause', '_value_list_clause')
+
+    name = _RenderedAttribute()
+    iter_vars = _RenderedAttribute()
+    values_clause = _RenderedAttribute()
+    value_list_clause = _RenderedAttribute()
+
     def __init__(self, name: str, over: list = None,
                  values_clause: OperandType = None,
                  value_list_clause: list[ScalarType] = None):
         operands = [values_clause]
         if over is not None:
-            operands += over
+            operands.extend(over)
         super().__init__(operands=operands)
         self.name = name
         """
         Name of the created coverage (datacube).
         """
-        self.iter_vars = over if over is not None else []
+        self.iter_vars = list(over) if over is not None else []
         """
         A list of :class:`AxisIter` forming the created coverage domain.
         """
@@ -2862,20 +3232,17 @@ class Coverage(WCPSExpr):
         if self.value_list_clause is not None and self.values_clause is not None:
             raise WCPSClientException("Cannot specify both a values_clause and a values_list in a Coverage expression.")
 
-    def __str__(self):
+    def _parts(self):
         """
-        :return: A WCPS query string corresponding to this expression.
+        :return: the parts of the WCPS query string corresponding to this expression.
         :raise: :class:`WCPSClientException` if no iterator variables or a values expression have been set.
         """
         self._validate()
-        ret = super().__str__()
-        over = _list_to_str(self.iter_vars, ', ')
+        over = _join_parts(self.iter_vars, ', ')
         if self.values_clause is not None:
-            ret += f'(coverage {self.name} over {over} values {self.values_clause})'
-        else:
-            values_list_clause = _list_to_str(self.value_list_clause, "; ")
-            ret += f'(coverage {self.name} over {over} value list < {values_list_clause} >)'
-        return ret
+            return f'(coverage {self.name} over ', *over, ' values ', self.values_clause, ')'
+        values_list_clause = _list_to_str(self.value_list_clause, "; ")
+        return f'(coverage {self.name} over ', *over, f' value list < {values_list_clause} >)'
 
     def _validate(self):
         """
@@ -2887,7 +3254,7 @@ class Coverage(WCPSExpr):
             raise WCPSClientException("A VALUES or VALUE LIST clause is mandatory "
                                       "in a COVERAGE operation, none was specified.")
 
-    def over(self, iter_var: Union[AxisIter, list[AxisIter]]) -> Coverage:
+    def over(self, iter_var: AxisIter | list[AxisIter]) -> Coverage:
         """
         Add an iterator variable to the coverage constructor.
 
@@ -2903,9 +3270,8 @@ class Coverage(WCPSExpr):
         """
         if not isinstance(iter_var, list):
             iter_var = [iter_var]
-        for v in iter_var:
-            self.iter_vars.append(v)
-            self.add_operand(v)
+        self.iter_vars.extend(iter_var)
+        self.add_operands(iter_var)
         return self
 
     def values(self, values_clause: OperandType) -> Coverage:
@@ -2953,38 +3319,52 @@ class Switch(WCPSExpr):
         Switch().case(cov1 > 5).then(cov2).default(cov1)
     """
 
+    __slots__ = ('_case_expr', '_then_expr', '_default_expr', '_phase')
+
+    case_expr = _RenderedAttribute()
+    then_expr = _RenderedAttribute()
+    default_expr = _RenderedAttribute()
+
+    # values of _phase, the next expected builder call
+    _EXPECT_CASE = 0
+    _EXPECT_THEN = 1
+    _DONE = 2
+
     def __init__(self):
         super().__init__()
         self.case_expr: list[WCPSExpr] = []
         self.then_expr: list[WCPSExpr] = []
         self.default_expr = None
+        self._phase = self._EXPECT_CASE
 
-    def __str__(self):
+    def _parts(self):
         """
-        :return: A WCPS query string corresponding to this expression.
+        :return: the parts of the WCPS query string corresponding to this expression.
         :raise: :class:`WCPSClientException` if no case or default expressions have been specified.
         """
         if len(self.then_expr) == 0:
             raise WCPSClientException("No case expressions have been specified for the switch expression.")
         if self.default_expr is None:
             raise WCPSClientException("No default expression has been specified for the switch expression.")
-        ret = f'{super().__str__()}(switch'
+        parts = ['(switch']
         for case_expr, then_expr in zip(self.case_expr, self.then_expr):
-            ret += f' case {case_expr} return {then_expr}'
-        ret += f' default return {self.default_expr})'
-        return ret
+            parts += (' case ', case_expr, ' return ', then_expr)
+        parts += (' default return ', self.default_expr, ')')
+        return parts
 
     def case(self, case_expr: WCPSExpr) -> Switch:
         """
         Specify a condition expression.
         :param case_expr: the boolean case expression.
-        :raise: :class:`WCPSClientException` if there is a mismatch between the number of case/then expressions.
+        :raise: :class:`WCPSClientException` if there is a mismatch between the number of case/then expressions,
+            or if a default expression has already been set.
         """
-        if len(self.case_expr) != len(self.then_expr):
+        if self._phase != self._EXPECT_CASE:
             raise WCPSClientException("A switch consists of alternating if_case/then expressions, "
                                       "finalized with a default expression.")
         self.add_operand(case_expr)
         self.case_expr.append(case_expr)
+        self._phase = self._EXPECT_THEN
         return self
 
     def then(self, then_expr: WCPSExpr) -> Switch:
@@ -2996,11 +3376,12 @@ class Switch(WCPSExpr):
         :raise: :class:`WCPSClientException` if there is a mismatch between
             the number of case/then expressions.
         """
-        if len(self.case_expr) - 1 != len(self.then_expr):
+        if self._phase != self._EXPECT_THEN:
             raise WCPSClientException("A switch consists of alternating if_case/then expressions, "
                                       "finalized with a default expression.")
         self.add_operand(then_expr)
         self.then_expr.append(then_expr)
+        self._phase = self._EXPECT_CASE
         return self
 
     def default(self, default_expr: WCPSExpr) -> Switch:
@@ -3009,17 +3390,18 @@ class Switch(WCPSExpr):
 
         :param default_expr: the default expression.
 
-        :raise: :class:`WCPSClientException` if no case expressions have been specified,
-            or if a default expression has already been set.
+        :raise: :class:`WCPSClientException` if no case/then expressions have been specified,
+            the last case expression has no then expression, or if a default expression has already been set.
         """
-        if len(self.then_expr) == 0:
+        if self._phase != self._EXPECT_CASE or not self.then_expr:
+            if self._phase == self._DONE:
+                raise WCPSClientException("A default expression has already been specified for this "
+                                          "switch expression.")
             raise WCPSClientException("In a switch first the if_case/then expressions must be specified, "
                                       "followed by the default expression.")
-        if self.default_expr is not None:
-            raise WCPSClientException("A default expression has already been specified for this "
-                                      "switch expression.")
         self.default_expr = default_expr
         self.add_operand(default_expr)
+        self._phase = self._DONE
         return self
 
 
@@ -3062,21 +3444,27 @@ class Clip(WCPSExpr):
     :param op: coverage expression to clip
     :param wkt: a WKT string describing the geometry for clipping
     """
+
+    __slots__ = ('_wkt',)
+
+    wkt = _RenderedAttribute()
+
     VALID_GEOMETRIES = ['LineString', 'Polygon', 'MultiLineString',
                         'MultiPolygon', 'Curtain', 'Corridor']
+    _VALID_GEOMETRIES_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, VALID_GEOMETRIES)) + r')\b',
+                                      re.IGNORECASE)
 
     def __init__(self, op: WCPSExpr, wkt: str):
         super().__init__(operands=[op])
         self.wkt = str(wkt)
         self._validate_wkt()
 
-    def __str__(self):
-        return f'{super().__str__()}clip({self.operands[0]}, {self.wkt})'
+    def _parts(self):
+        return 'clip(', self.operands[0], f', {self.wkt})'
 
     def _validate_wkt(self):
         """Check that the WKT contains a valid geometry type."""
-        if not any(re.search(r'\b' + re.escape(geom) + r'\b', self.wkt, re.IGNORECASE)
-                   for geom in self.VALID_GEOMETRIES):
+        if self._VALID_GEOMETRIES_RE.search(self.wkt) is None:
             raise WCPSClientException(f"The given WKT does not contain a valid geometry type."
                                       f"Expected one of: {', '.join(self.VALID_GEOMETRIES)}")
 
@@ -3097,16 +3485,16 @@ class Udf(WCPSExpr):
         stretch = Udf('stretch', Datacube('cov1'))
     """
 
+    __slots__ = ('_function_name',)
+
+    function_name = _RenderedAttribute()
+
     def __init__(self, function_name: str, operands: list[OperandType]):
         super().__init__(operands=operands)
         self.function_name = function_name
 
-    def __str__(self):
-        ret = super().__str__()
-        ret += f'{self.function_name}('
-        ret += _list_to_str(self.operands, ', ')
-        ret += ')'
-        return ret
+    def _parts(self):
+        return f'{self.function_name}(', *_join_parts(self.operands, ', '), ')'
 
 
 # ---------------------------------------------------------------------------------
@@ -3129,6 +3517,12 @@ class Encode(WCPSExpr):
     - ``Encode(Datacube("test"), "GTiff", "...")``
     """
 
+    __slots__ = ('_data_format', '_format_params', '_format_params_str')
+
+    data_format = _RenderedAttribute()
+
+    _UNESCAPED_DOUBLE_QUOTE_RE = re.compile(r'(?<!\\)"')
+
     def __init__(self, op: WCPSExpr, data_format: str = None, format_params: str = None):
         super().__init__(operands=[op])
         self.data_format = data_format
@@ -3152,22 +3546,35 @@ class Encode(WCPSExpr):
         self.format_params = format_params
         return self
 
-    def __str__(self):
+    @property
+    def format_params(self) -> str | None:
+        """Additional format parameters that influence the encoding."""
+        return self._format_params
+
+    @format_params.setter
+    def format_params(self, format_params: str | None):
+        # the escaped format parameters argument is precomputed whenever they are set
+        self._format_params = format_params
+        self._format_params_str = ('' if format_params is None else
+                                   f', "{self._escape_double_quotes(format_params)}"')
+        self._invalidate()
+
+    def _parts(self):
         if self.data_format is None:
             raise WCPSClientException("No target format to which to encode the operand was provided.")
-        ret = f'{super().__str__()}encode({self.operands[0]}, "{self.data_format}"'
-        if self.format_params is not None:
-            format_params = self._escape_double_quotes(self.format_params)
-            ret += f', "{format_params}"'
-        ret += ')'
-        return ret
+        return 'encode(', self.operands[0], f', "{self.data_format}"', self._format_params_str, ')'
 
     def _escape_double_quotes(self, text: str) -> str:
         """
         Escape double quotes in a string by prefixing them with a backslash,
         but only if they are not already escaped.
         """
-        return re.sub(r'(?<!\\)"', r'\\"', text)
+        if '"' not in text:
+            return text
+        if '\\"' not in text:
+            # no escaped double quotes, so all of them can be escaped without the regex
+            return text.replace('"', '\\"')
+        return self._UNESCAPED_DOUBLE_QUOTE_RE.sub(r'\\"', text)
 
 
 class WCPSClientException(Exception):
@@ -3176,6 +3583,127 @@ class WCPSClientException(Exception):
     """
 
 
+def _intern(name):
+    """
+    Intern a name string such as a datacube or axis name, so that the many
+    dict lookups and comparisons of the same names are cheap; values which
+    are not exactly ``str`` are returned unchanged.
+    """
+    return sys.intern(name) if type(name) is str else name  # pylint: disable=unidiomatic-typecheck
+
+
+def _fold_constants(expr_class: type, func, op1: OperandType, op2: OperandType) -> WCPSExpr:
+    """
+    Evaluate ``func(op1, op2)`` if both operands are numeric constants (numbers
+    or :class:`Scalar` objects wrapping numbers), so that e.g. ``Scalar(2) * 3``
+    becomes ``Scalar(6)`` rather than a :class:`Mul` expression. Similarly, an integer
+    ``op2`` is folded into the integer constant ending an associative ``op1`` chain,
+    e.g. ``cube * 2 * 3`` becomes ``cube * 6``; floating-point constants are not
+    folded in this case, as that would change the rounding of the result.
+
+    :return: a :class:`Scalar` with the result, a copy of the ``op1`` chain ending in
+        the folded constant, or ``expr_class(op1, op2)`` if the operands are not constants,
+        or the result is not a valid WCPS constant.
+    """
+    value1 = _constant_value(op1)
+    value2 = _constant_value(op2)
+    # pylint: disable=unidiomatic-typecheck,protected-access
+    if (value1 is None and type(value2) is int and func in (operator.add, operator.mul) and
+            type(op1) is expr_class and op1.operator == expr_class._default_operator and
+            type(_constant_value(op1.operands[-1])) is int):
+        folded = _fold_constants(expr_class, func, op1.operands[-1], op2)
+        if type(folded) is Scalar:
+            expr = op1.operands[0]
+            for op in op1.operands[1:-1]:
+                expr = expr_class(expr, op)
+            return expr_class(expr, folded)
+    if value1 is not None and value2 is not None:
+        try:
+            result = func(value1, value2)
+        except (ArithmeticError, ValueError):
+            result = None
+        if (isinstance(result, float) and math.isfinite(result) or
+                type(result) is int and -2**63 <= result < 2**63):
+            return Scalar(result)
+    return expr_class(op1, op2)
+
+
+def _constant_value(op: OperandType) -> int | float | None:
+    """
+    :return: the value of ``op`` if it is an int or float, possibly wrapped
+        in a :class:`Scalar`; ``None`` otherwise (e.g. for bool or str values).
+    """
+    if type(op) is Scalar:  # pylint: disable=unidiomatic-typecheck
+        op = op.op
+    return op if type(op) in (int, float) else None
+
+
+def _constant_mod(value1: int | float, value2: int | float) -> int:
+    """
+    Constant folding of :class:`Mod`; only non-negative integers are folded,
+    for which the result does not depend on the sign convention of the modulo.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    if type(value1) is not int or type(value2) is not int or value1 < 0 or value2 <= 0:
+        raise ValueError("not folded")
+    return value1 % value2
+
+
+def _constant_pow(value1: int | float, value2: int | float) -> float:
+    """
+    Constant folding of :class:`Pow`, which results in a floating-point value
+    in WCPS; raises an ArithmeticError or ValueError if the result is not a real number.
+    """
+    return math.pow(value1, value2)
+
+
+# AUTH:CODE, e.g. EPSG:4326
+_CRS_CODE_RE = re.compile(r'([A-Za-z][\w.-]*):(\w+)')
+# AUTH/VERSION/CODE, optionally prefixed by the URL of a CRS resolver, e.g.
+# http://localhost:8080/rasdaman/def/crs/EPSG/0/4326; no query string (as in compound CRSs) is allowed.
+_CRS_URL_RE = re.compile(r'(?:[A-Za-z][\w+.-]*://[^/?#]+(?:/[^/?#]+)*/def/crs/)?'
+                         r'([A-Za-z][\w.-]*)/[\w.-]+/(\w+)/?')
+
+
+@lru_cache(maxsize=256)
+def _canonical_crs(crs: str) -> tuple[str, str] | None:
+    """
+    Parse a single CRS in one of the formats accepted by :class:`Reproject` into an
+    (authority, code) tuple, so that e.g. ``EPSG:4326``, ``EPSG/0/4326`` and
+    ``http://localhost:8080/rasdaman/def/crs/EPSG/0/4326`` compare equal.
+
+    :param crs: the CRS string
+    :return: the (uppercase authority, code) tuple, or None if the format is not recognized,
+        e.g. for compound CRS URLs or URLs with a query string.
+    """
+    crs = crs.strip()
+    match = _CRS_CODE_RE.fullmatch(crs)
+    if match is None:
+        match = _CRS_URL_RE.fullmatch(crs)
+        if match is None or crs.count('/def/crs/') > 1:
+            return None
+    authority, code = match.groups()
+    return authority.upper(), code
+
+
+def _join_parts(lst: list, sep: str) -> list:
+    """
+    Interleave the items of a list with a separator, e.g. ``[a, ', ', b, ', ', c]``
+    for ``[a, b, c]``; used to build the parts of an expression in ``_parts``.
+
+    :param lst: The list of items, e.g. operands of an expression.
+    :param sep: The separator to insert between each two items.
+
+    :return: A new list containing the items and separators.
+    """
+    ret = []
+    for item in lst:
+        if ret:
+            ret.append(sep)
+        ret.append(item)
+    return ret
+
+
 def _list_to_str(lst: list, sep: str) -> str:
     """
     Convert a list of items into a single string. Each item is converted to a string
@@ -3188,4 +3716,4 @@ def _list_to_str(lst: list, sep: str) -> str:
     :return: A single string containing all items from the list, separated by the
              specified separator.
     """
-    return sep.join([str(item) for item in lst])
+    return sep.join(map(str, lst))
@@ -1,19 +1,24 @@
 """
 Execute a WCPS query on a WCPS server, and save/return the result.
+
+numpy, Pillow and netCDF4 are imported only when a result is converted to a
+numpy array or shown, so that importing this module stays fast.
 """
 from __future__ import annotations
 
 import io
+import shutil
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Union
 
-import netCDF4 as nc
-import numpy as np
 import requests
-from PIL import Image
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 from wcps.model import WCPSExpr, WCPSClientException, StrEnum
 
@@ -21,6 +26,15 @@ DEFAULT_CONN_TIMEOUT = 10
 """Default timeout to establish a connection to the WCPS service: 10 seconds."""
 DEFAULT_READ_TIMEOUT = 10 * 60
 """Default timeout to wait for a query to execute: 10 minutes."""
+DOWNLOAD_BUFFER_SIZE = 64 * 1024
+"""Size of the chunks in which :meth:`Service.download` writes the response to a file: 64 KB."""
+DEFAULT_MAX_WORKERS = 8
+"""Default maximum number of queries executed concurrently by :meth:`Service.execute_many`."""
+DEFAULT_RETRY = Retry(total=3, read=0, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+"""
+Default retry strategy for failed connections and temporary server errors (502, 503, 504);
+read errors are not retried, as the query may be evaluated by the server already.
+"""
 
 
 class WCPSResultType(StrEnum):
@@ -56,6 +70,11 @@ class Service:
     """
     Establish a connection to a WCPS service, send queries and retrieve results.
 
+    All requests are sent through a single :class:`requests.Session`, so that
+    connections to the server are kept alive and reused across queries. The
+    session can be closed with :meth:`close`, or by using the service as a
+    context manager.
+
     :param endpoint: the WCPS server endpoint URL, e.g. https://ows.rasdaman.org/rasdaman/ows
     :param username: optional username for basic authentication to the WCPS server
     :param password: optional password for basic authentication to the WCPS server
@@ -69,12 +88,33 @@ class Service:
         service.query(query, output_file='output.png')
         # or get the response object back
         response = service.query(query)
+
+        # close the connections to the server when done
+        with Service("https://ows.rasdaman.org/rasdaman/ows") as service:
+            service.execute(query)
     """
 
     def __init__(self, endpoint, username=None, password=None):
         self.endpoint = endpoint
         self.endpoint_wcps = endpoint + '?service=WCS&version=2.0.1&request=ProcessCoverages&query='
         self.auth = HTTPBasicAuth(username, password) if username and password else None
+        self.session = requests.Session()
+        """The session through which all requests to the server are sent."""
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=DEFAULT_RETRY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        """
+        Close the connections to the server kept open by this service.
+        """
+        self.session.close()
+
+    def __enter__(self) -> Service:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def execute(self,
                 wcps_query: Union[str, WCPSExpr],
@@ -102,6 +142,35 @@ class Service:
         response = self.execute_raw(wcps_query, conn_timeout, read_timeout)
         return self.response_to_wcps_result(response, convert_to_numpy=convert_to_numpy)
 
+    def execute_many(self,
+                     wcps_queries: list[Union[str, WCPSExpr]],
+                     convert_to_numpy: bool = False,
+                     max_workers: int = DEFAULT_MAX_WORKERS,
+                     conn_timeout: int = DEFAULT_CONN_TIMEOUT,
+                     read_timeout: int = DEFAULT_READ_TIMEOUT) -> list[WCPSResult]:
+        """
+        Sends multiple independent WCPS queries to the service concurrently, and
+        returns their results in the same order as the queries; see :meth:`execute`
+        for details on the result of each query.
+
+        :param wcps_queries: the WCPS queries to be executed on the server.
+        :param convert_to_numpy: if True an *array* result encoded to a data format
+            will be automatically converted to a numpy array.
+        :param max_workers: maximum number of queries executed at the same time.
+        :param conn_timeout: how long (seconds) to wait for the connection to be established
+        :param read_timeout: how long (seconds) to wait for each query to execute
+        :return: a list of results, one for each query in ``wcps_queries``.
+
+        :raise: :exc:`wcps.model.WCPSClientException` if the server returns an error
+            status code for any of the queries.
+        """
+        # serialize the query expressions before handing them over to other threads
+        wcps_queries = [str(q) for q in wcps_queries]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda query: self.execute(query, convert_to_numpy, conn_timeout, read_timeout),
+                wcps_queries))
+
     def download(self,
                  wcps_query: Union[str, WCPSExpr],
                  output_file: str,
@@ -118,10 +187,11 @@ class Service:
 
         :raise: :exc:`wcps.model.WCPSClientException` if the server returns an error status code.
         """
-        with open(output_file, 'wb') as file:
-            response = self.execute_raw(wcps_query, conn_timeout, read_timeout, stream=True)
-            for chunk in response.iter_content(chunk_size=8192):
-                file.write(chunk)
+        response = self.execute_raw(wcps_query, conn_timeout, read_timeout, stream=True)
+        with response, open(output_file, 'wb') as file:
+            # decode any Content-Encoding (e.g. gzip) while copying the raw stream
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, file, length=DOWNLOAD_BUFFER_SIZE)
 
     def show(self,
              query_or_result: Union[str, WCPSExpr, WCPSResult],
@@ -161,8 +231,10 @@ class Service:
         elif result.type == WCPSResultType.MULTIBAND_SCALAR:
             print(str(data).replace('[', '{').replace(']', '}'))
         elif result.type == WCPSResultType.IMAGE:
+            from PIL import Image  # pylint: disable=import-outside-toplevel
             Image.open(io.BytesIO(data)).show()
         elif result.type == WCPSResultType.NETCDF:
+            import netCDF4 as nc  # pylint: disable=import-outside-toplevel
             with nc.Dataset("memory", mode="r", memory=data) as dataset:
                 print(dataset)
         elif result.type == WCPSResultType.NUMPY:
@@ -196,10 +268,10 @@ class Service:
         url = self.endpoint_wcps + wcps_query
 
         # make request
-        response = requests.get(url,
-                                auth=self.auth,
-                                timeout=(conn_timeout, read_timeout),
-                                stream=stream)
+        response = self.session.get(url,
+                                    auth=self.auth,
+                                    timeout=(conn_timeout, read_timeout),
+                                    stream=stream)
 
         # check for errors from the server
         try:
@@ -225,13 +297,14 @@ class Service:
             response type, and the :attr:`WCPSResult.value` set to the response value.
         """
         content_type = response.headers.get('Content-Type', '')
+        res_type = _get_result_type(content_type)
 
         # json array
-        if 'application/json' in content_type:
+        if res_type == WCPSResultType.JSON:
             return WCPSResult(value=response.json(), type=WCPSResultType.JSON)
 
         # single or multiband scalar
-        if content_type == '' or 'text/plain' in content_type:
+        if res_type == WCPSResultType.SCALAR:
             content = response.text
 
             # single band
@@ -247,35 +320,13 @@ class Service:
             return WCPSResult(value=scalars[0], type=WCPSResultType.SCALAR)
 
         # array result
-        if 'image' in content_type:
-            res_type = WCPSResultType.IMAGE
-        elif 'netcdf' in content_type:
-            res_type = WCPSResultType.NETCDF
-        else:
-            res_type = WCPSResultType.ARRAY
-
         if convert_to_numpy:
-            # 2D image formats
-            if res_type == WCPSResultType.IMAGE:
-                image = Image.open(io.BytesIO(response.content))
-                return WCPSResult(value=np.array(image), type=WCPSResultType.NUMPY)
-            # netcdf
-            if res_type == WCPSResultType.NETCDF:
-                with nc.Dataset("memory", mode="r", memory=response.content) as dataset:
-
-                    data_arrays = []
-                    for var_name, variable in dataset.variables.items():
-                        if var_name in dataset.dimensions:
-                            continue
-                        ndim = variable.ndim
-                        data_arrays.append(variable[:])
-
-                    # Stack all arrays along a new dimension
-                    return WCPSResult(value=np.stack(data_arrays, axis=ndim),
-                                      type=WCPSResultType.NUMPY)
-            # unsupported format
-            raise WCPSClientException(f"Cannot convert content-type {content_type} "
-                                      f"to a numpy array object.")
+            converter = _NUMPY_CONVERTERS.get(res_type)
+            if converter is None:
+                # unsupported format
+                raise WCPSClientException(f"Cannot convert content-type {content_type} "
+                                          f"to a numpy array object.")
+            return WCPSResult(value=converter(response.content), type=WCPSResultType.NUMPY)
 
         # no conversion to numpy
         return WCPSResult(value=response.content, type=res_type)
@@ -335,3 +386,63 @@ class Service:
             return '\n'.join(ret)
         except ET.ParseError:
             return xml_str
+
+
+@lru_cache(maxsize=64)
+def _get_result_type(content_type: str) -> WCPSResultType:
+    """
+    Determine the type of result from the Content-Type of a response; as servers
+    return only a handful of distinct content types, the result is cached.
+
+    :param content_type: the Content-Type header value, e.g. ``image/png``
+    :return: :const:`WCPSResultType.JSON`, :const:`WCPSResultType.SCALAR` for single
+        or multiband scalars, or the type of an array result
+    :meta private:
+    """
+    if 'application/json' in content_type:
+        return WCPSResultType.JSON
+    if content_type == '' or 'text/plain' in content_type:
+        return WCPSResultType.SCALAR
+    if 'image' in content_type:
+        return WCPSResultType.IMAGE
+    if 'netcdf' in content_type:
+        return WCPSResultType.NETCDF
+    return WCPSResultType.ARRAY
+
+
+def _image_to_numpy(content: bytes):
+    """
+    Convert a 2D image encoded in a format such as PNG to a numpy array.
+    :meta private:
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+    image = Image.open(io.BytesIO(content))
+    return np.array(image)
+
+
+def _netcdf_to_numpy(content: bytes):
+    """
+    Convert netCDF data to a numpy array, stacking the data variables along a new dimension.
+    :meta private:
+    """
+    import netCDF4 as nc  # pylint: disable=import-outside-toplevel
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    with nc.Dataset("memory", mode="r", memory=content) as dataset:
+
+        data_arrays = []
+        for var_name, variable in dataset.variables.items():
+            if var_name in dataset.dimensions:
+                continue
+            ndim = variable.ndim
+            data_arrays.append(variable[:])
+
+        # Stack all arrays along a new dimension
+        return np.stack(data_arrays, axis=ndim)
+
+
+_NUMPY_CONVERTERS = {
+    WCPSResultType.IMAGE: _image_to_numpy,
+    WCPSResultType.NETCDF: _netcdf_to_numpy,
+}
+"""Functions converting array results of a given type to a numpy array."""
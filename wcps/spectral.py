@@ -21,6 +21,7 @@ from wcps.model import WCPSExpr, OperandType
 
 class AFRI1600(WCPSExpr):
   """Aerosol Free Vegetation Index (1600 nm)"""
+  __slots__ = ('N', 'S1')
   short_name = "AFRI1600"
   long_name = "Aerosol Free Vegetation Index (1600 nm)"
   bands = ['N', 'S1']
@@ -30,16 +31,17 @@ class AFRI1600(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1})])
+    super().__init__(operands=[(N - 0.66 * S1) / (N + 0.66 * S1)])
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class AFRI2100(WCPSExpr):
   """Aerosol Free Vegetation Index (2100 nm)"""
+  __slots__ = ('N', 'S2')
   short_name = "AFRI2100"
   long_name = "Aerosol Free Vegetation Index (2100 nm)"
   bands = ['N', 'S2']
@@ -49,16 +51,17 @@ class AFRI2100(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2})])
+    super().__init__(operands=[(N - 0.5 * S2) / (N + 0.5 * S2)])
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ANDWI(WCPSExpr):
   """Augmented Normalized Difference Water Index"""
+  __slots__ = ('B', 'G', 'R', 'N', 'S1', 'S2')
   short_name = "ANDWI"
   long_name = "Augmented Normalized Difference Water Index"
   bands = ['B', 'G', 'R', 'N', 'S1', 'S2']
@@ -68,7 +71,7 @@ class ANDWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, G: OperandType, R: OperandType, N: OperandType, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "G": G, "R": R, "N": N, "S1": S1, "S2": S2})])
+    super().__init__(operands=[(B + G + R - N - S1 - S2) / (B + G + R + N + S1 + S2)])
     self.B = B
     self.G = G
     self.R = R
@@ -76,12 +79,13 @@ class ANDWI(WCPSExpr):
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ARI(WCPSExpr):
   """Anthocyanin Reflectance Index"""
+  __slots__ = ('G', 'RE1')
   short_name = "ARI"
   long_name = "Anthocyanin Reflectance Index"
   bands = ['G', 'RE1']
@@ -91,16 +95,17 @@ class ARI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "RE1": RE1})])
+    super().__init__(operands=[1 / G - 1 / RE1])
     self.G = G
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ARI2(WCPSExpr):
   """Anthocyanin Reflectance Index 2"""
+  __slots__ = ('N', 'G', 'RE1')
   short_name = "ARI2"
   long_name = "Anthocyanin Reflectance Index 2"
   bands = ['N', 'G', 'RE1']
@@ -110,17 +115,18 @@ class ARI2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "RE1": RE1})])
+    super().__init__(operands=[N * (1 / G - 1 / RE1)])
     self.N = N
     self.G = G
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ARVI(WCPSExpr):
   """Atmospherically Resistant Vegetation Index"""
+  __slots__ = ('N', 'R', 'gamma', 'B')
   short_name = "ARVI"
   long_name = "Atmospherically Resistant Vegetation Index"
   bands = ['N', 'R', 'gamma', 'B']
@@ -130,18 +136,19 @@ class ARVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, gamma: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "gamma": gamma, "B": B})])
+    super().__init__(operands=[(N - (R - gamma * (R - B))) / (N + (R - gamma * (R - B)))])
     self.N = N
     self.R = R
     self.gamma = gamma
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ATSAVI(WCPSExpr):
   """Adjusted Transformed Soil-Adjusted Vegetation Index"""
+  __slots__ = ('sla', 'N', 'R', 'slb')
   short_name = "ATSAVI"
   long_name = "Adjusted Transformed Soil-Adjusted Vegetation Index"
   bands = ['sla', 'N', 'R', 'slb']
@@ -151,18 +158,19 @@ class ATSAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, sla: OperandType, N: OperandType, R: OperandType, slb: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"sla": sla, "N": N, "R": R, "slb": slb})])
+    super().__init__(operands=[sla * (N - sla * R - slb) / (sla * N + R - sla * slb + 0.08 * (1 + sla ** 2.0))])
     self.sla = sla
     self.N = N
     self.R = R
     self.slb = slb
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class AVI(WCPSExpr):
   """Advanced Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "AVI"
   long_name = "Advanced Vegetation Index"
   bands = ['N', 'R']
@@ -172,16 +180,17 @@ class AVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[(N * (1.0 - R) * (N - R)) ** (1 / 3)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class AWEInsh(WCPSExpr):
   """Automated Water Extraction Index"""
+  __slots__ = ('G', 'S1', 'N', 'S2')
   short_name = "AWEInsh"
   long_name = "Automated Water Extraction Index"
   bands = ['G', 'S1', 'N', 'S2']
@@ -191,18 +200,19 @@ class AWEInsh(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, S1: OperandType, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "S1": S1, "N": N, "S2": S2})])
+    super().__init__(operands=[4.0 * (G - S1) - 0.25 * N + 2.75 * S2])
     self.G = G
     self.S1 = S1
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class AWEIsh(WCPSExpr):
   """Automated Water Extraction Index with Shadows Elimination"""
+  __slots__ = ('B', 'G', 'N', 'S1', 'S2')
   short_name = "AWEIsh"
   long_name = "Automated Water Extraction Index with Shadows Elimination"
   bands = ['B', 'G', 'N', 'S1', 'S2']
@@ -212,19 +222,20 @@ class AWEIsh(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, G: OperandType, N: OperandType, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "G": G, "N": N, "S1": S1, "S2": S2})])
+    super().__init__(operands=[B + 2.5 * G - 1.5 * (N + S1) - 0.25 * S2])
     self.B = B
     self.G = G
     self.N = N
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BAI(WCPSExpr):
   """Burned Area Index"""
+  __slots__ = ('R', 'N')
   short_name = "BAI"
   long_name = "Burned Area Index"
   bands = ['R', 'N']
@@ -234,16 +245,17 @@ class BAI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "N": N})])
+    super().__init__(operands=[1.0 / ((0.1 - R) ** 2.0 + (0.06 - N) ** 2.0)])
     self.R = R
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BAIM(WCPSExpr):
   """Burned Area Index adapted to MODIS"""
+  __slots__ = ('N', 'S2')
   short_name = "BAIM"
   long_name = "Burned Area Index adapted to MODIS"
   bands = ['N', 'S2']
@@ -253,16 +265,17 @@ class BAIM(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2})])
+    super().__init__(operands=[1.0 / (0.05 - N) ** 2.0 + (0.2 - S2) ** 2.0])
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BAIS2(WCPSExpr):
   """Burned Area Index for Sentinel 2"""
+  __slots__ = ('RE2', 'RE3', 'N2', 'R', 'S2')
   short_name = "BAIS2"
   long_name = "Burned Area Index for Sentinel 2"
   bands = ['RE2', 'RE3', 'N2', 'R', 'S2']
@@ -272,19 +285,20 @@ class BAIS2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE3: OperandType, N2: OperandType, R: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE3": RE3, "N2": N2, "R": R, "S2": S2})])
+    super().__init__(operands=[(1.0 - (RE2 * RE3 * N2 / R) ** 0.5) * ((S2 - N2) / (S2 + N2) ** 0.5 + 1.0)])
     self.RE2 = RE2
     self.RE3 = RE3
     self.N2 = N2
     self.R = R
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BCC(WCPSExpr):
   """Blue Chromatic Coordinate"""
+  __slots__ = ('B', 'R', 'G')
   short_name = "BCC"
   long_name = "Blue Chromatic Coordinate"
   bands = ['B', 'R', 'G']
@@ -294,17 +308,18 @@ class BCC(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "R": R, "G": G})])
+    super().__init__(operands=[B / (R + G + B)])
     self.B = B
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BI(WCPSExpr):
   """Bare Soil Index"""
+  __slots__ = ('S1', 'R', 'N', 'B')
   short_name = "BI"
   long_name = "Bare Soil Index"
   bands = ['S1', 'R', 'N', 'B']
@@ -314,18 +329,19 @@ class BI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, R: OperandType, N: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "R": R, "N": N, "B": B})])
+    super().__init__(operands=[(S1 + R - (N + B)) / (S1 + R + (N + B))])
     self.S1 = S1
     self.R = R
     self.N = N
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BITM(WCPSExpr):
   """Landsat TM-based Brightness Index"""
+  __slots__ = ('B', 'G', 'R')
   short_name = "BITM"
   long_name = "Landsat TM-based Brightness Index"
   bands = ['B', 'G', 'R']
@@ -335,17 +351,18 @@ class BITM(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "G": G, "R": R})])
+    super().__init__(operands=[((B ** 2.0 + G ** 2.0 + R ** 2.0) / 3.0) ** 0.5])
     self.B = B
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BIXS(WCPSExpr):
   """SPOT HRV XS-based Brightness Index"""
+  __slots__ = ('G', 'R')
   short_name = "BIXS"
   long_name = "SPOT HRV XS-based Brightness Index"
   bands = ['G', 'R']
@@ -355,16 +372,17 @@ class BIXS(WCPSExpr):
   contributor = "https://github.com/remi-braun"
 
   def __init__(self, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R})])
+    super().__init__(operands=[((G ** 2.0 + R ** 2.0) / 2.0) ** 0.5])
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BLFEI(WCPSExpr):
   """Built-Up Land Features Extraction Index"""
+  __slots__ = ('G', 'R', 'S2', 'S1')
   short_name = "BLFEI"
   long_name = "Built-Up Land Features Extraction Index"
   bands = ['G', 'R', 'S2', 'S1']
@@ -374,18 +392,19 @@ class BLFEI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType, S2: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "S2": S2, "S1": S1})])
+    super().__init__(operands=[((G + R + S2) / 3.0 - S1) / ((G + R + S2) / 3.0 + S1)])
     self.G = G
     self.R = R
     self.S2 = S2
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BNDVI(WCPSExpr):
   """Blue Normalized Difference Vegetation Index"""
+  __slots__ = ('N', 'B')
   short_name = "BNDVI"
   long_name = "Blue Normalized Difference Vegetation Index"
   bands = ['N', 'B']
@@ -395,16 +414,17 @@ class BNDVI(WCPSExpr):
   contributor = "https://github.com/MATRIX4284"
 
   def __init__(self, N: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "B": B})])
+    super().__init__(operands=[(N - B) / (N + B)])
     self.N = N
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BRBA(WCPSExpr):
   """Band Ratio for Built-up Area"""
+  __slots__ = ('R', 'S1')
   short_name = "BRBA"
   long_name = "Band Ratio for Built-up Area"
   bands = ['R', 'S1']
@@ -414,16 +434,17 @@ class BRBA(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "S1": S1})])
+    super().__init__(operands=[R / S1])
     self.R = R
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BWDRVI(WCPSExpr):
   """Blue Wide Dynamic Range Vegetation Index"""
+  __slots__ = ('alpha', 'N', 'B')
   short_name = "BWDRVI"
   long_name = "Blue Wide Dynamic Range Vegetation Index"
   bands = ['alpha', 'N', 'B']
@@ -433,17 +454,18 @@ class BWDRVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, alpha: OperandType, N: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"alpha": alpha, "N": N, "B": B})])
+    super().__init__(operands=[(alpha * N - B) / (alpha * N + B)])
     self.alpha = alpha
     self.N = N
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class BaI(WCPSExpr):
   """Bareness Index"""
+  __slots__ = ('R', 'S1', 'N')
   short_name = "BaI"
   long_name = "Bareness Index"
   bands = ['R', 'S1', 'N']
@@ -453,17 +475,18 @@ class BaI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, S1: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "S1": S1, "N": N})])
+    super().__init__(operands=[R + S1 - N])
     self.R = R
     self.S1 = S1
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class CCI(WCPSExpr):
   """Chlorophyll Carotenoid Index"""
+  __slots__ = ('G1', 'R')
   short_name = "CCI"
   long_name = "Chlorophyll Carotenoid Index"
   bands = ['G1', 'R']
@@ -473,16 +496,17 @@ class CCI(WCPSExpr):
   contributor = "https://github.com/joanvlasschaert"
 
   def __init__(self, G1: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G1": G1, "R": R})])
+    super().__init__(operands=[(G1 - R) / (G1 + R)])
     self.G1 = G1
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class CIG(WCPSExpr):
   """Chlorophyll Index Green"""
+  __slots__ = ('N', 'G')
   short_name = "CIG"
   long_name = "Chlorophyll Index Green"
   bands = ['N', 'G']
@@ -492,16 +516,17 @@ class CIG(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G})])
+    super().__init__(operands=[N / G - 1.0])
     self.N = N
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class CIRE(WCPSExpr):
   """Chlorophyll Index Red Edge"""
+  __slots__ = ('N', 'RE1')
   short_name = "CIRE"
   long_name = "Chlorophyll Index Red Edge"
   bands = ['N', 'RE1']
@@ -511,16 +536,17 @@ class CIRE(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "RE1": RE1})])
+    super().__init__(operands=[N / RE1 - 1])
     self.N = N
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class CRI550(WCPSExpr):
   """Carotenoid Reflectance Index using 550 nm"""
+  __slots__ = ('B', 'G')
   short_name = "CRI550"
   long_name = "Carotenoid Reflectance Index using 550 nm"
   bands = ['B', 'G']
@@ -530,16 +556,17 @@ class CRI550(WCPSExpr):
   contributor = "https://github.com/eomasters-repos"
 
   def __init__(self, B: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "G": G})])
+    super().__init__(operands=[1.0 / B - 1.0 / G])
     self.B = B
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class CRI700(WCPSExpr):
   """Carotenoid Reflectance Index using 700 nm"""
+  __slots__ = ('B', 'RE1')
   short_name = "CRI700"
   long_name = "Carotenoid Reflectance Index using 700 nm"
   bands = ['B', 'RE1']
@@ -549,16 +576,17 @@ class CRI700(WCPSExpr):
   contributor = "https://github.com/eomasters-repos"
 
   def __init__(self, B: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "RE1": RE1})])
+    super().__init__(operands=[1.0 / B - 1.0 / RE1])
     self.B = B
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class CSI(WCPSExpr):
   """Char Soil Index"""
+  __slots__ = ('N', 'S2')
   short_name = "CSI"
   long_name = "Char Soil Index"
   bands = ['N', 'S2']
@@ -568,16 +596,17 @@ class CSI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2})])
+    super().__init__(operands=[N / S2])
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class CSIT(WCPSExpr):
   """Char Soil Index Thermal"""
+  __slots__ = ('N', 'S2', 'T')
   short_name = "CSIT"
   long_name = "Char Soil Index Thermal"
   bands = ['N', 'S2', 'T']
@@ -587,17 +616,18 @@ class CSIT(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2, "T": T})])
+    super().__init__(operands=[N / (S2 * T / 10000.0)])
     self.N = N
     self.S2 = S2
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class CVI(WCPSExpr):
   """Chlorophyll Vegetation Index"""
+  __slots__ = ('N', 'R', 'G')
   short_name = "CVI"
   long_name = "Chlorophyll Vegetation Index"
   bands = ['N', 'R', 'G']
@@ -607,17 +637,18 @@ class CVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "G": G})])
+    super().__init__(operands=[N * R / G ** 2.0])
     self.N = N
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DBI(WCPSExpr):
   """Dry Built-Up Index"""
+  __slots__ = ('B', 'T1', 'N', 'R')
   short_name = "DBI"
   long_name = "Dry Built-Up Index"
   bands = ['B', 'T1', 'N', 'R']
@@ -627,18 +658,19 @@ class DBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, T1: OperandType, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "T1": T1, "N": N, "R": R})])
+    super().__init__(operands=[(B - T1) / (B + T1) - (N - R) / (N + R)])
     self.B = B
     self.T1 = T1
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DBSI(WCPSExpr):
   """Dry Bareness Index"""
+  __slots__ = ('S1', 'G', 'N', 'R')
   short_name = "DBSI"
   long_name = "Dry Bareness Index"
   bands = ['S1', 'G', 'N', 'R']
@@ -648,18 +680,19 @@ class DBSI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, G: OperandType, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "G": G, "N": N, "R": R})])
+    super().__init__(operands=[(S1 - G) / (S1 + G) - (N - R) / (N + R)])
     self.S1 = S1
     self.G = G
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DPDD(WCPSExpr):
   """Dual-Pol Diagonal Distance"""
+  __slots__ = ('VV', 'VH')
   short_name = "DPDD"
   long_name = "Dual-Pol Diagonal Distance"
   bands = ['VV', 'VH']
@@ -669,16 +702,17 @@ class DPDD(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VV: OperandType, VH: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VV": VV, "VH": VH})])
+    super().__init__(operands=[(VV + VH) / 2.0 ** 0.5])
     self.VV = VV
     self.VH = VH
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DSI(WCPSExpr):
   """Drought Stress Index"""
+  __slots__ = ('S1', 'N')
   short_name = "DSI"
   long_name = "Drought Stress Index"
   bands = ['S1', 'N']
@@ -688,16 +722,17 @@ class DSI(WCPSExpr):
   contributor = "https://github.com/remi-braun"
 
   def __init__(self, S1: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "N": N})])
+    super().__init__(operands=[S1 / N])
     self.S1 = S1
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DSWI1(WCPSExpr):
   """Disease-Water Stress Index 1"""
+  __slots__ = ('N', 'S1')
   short_name = "DSWI1"
   long_name = "Disease-Water Stress Index 1"
   bands = ['N', 'S1']
@@ -707,16 +742,17 @@ class DSWI1(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1})])
+    super().__init__(operands=[N / S1])
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DSWI2(WCPSExpr):
   """Disease-Water Stress Index 2"""
+  __slots__ = ('S1', 'G')
   short_name = "DSWI2"
   long_name = "Disease-Water Stress Index 2"
   bands = ['S1', 'G']
@@ -726,16 +762,17 @@ class DSWI2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "G": G})])
+    super().__init__(operands=[S1 / G])
     self.S1 = S1
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DSWI3(WCPSExpr):
   """Disease-Water Stress Index 3"""
+  __slots__ = ('S1', 'R')
   short_name = "DSWI3"
   long_name = "Disease-Water Stress Index 3"
   bands = ['S1', 'R']
@@ -745,16 +782,17 @@ class DSWI3(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "R": R})])
+    super().__init__(operands=[S1 / R])
     self.S1 = S1
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DSWI4(WCPSExpr):
   """Disease-Water Stress Index 4"""
+  __slots__ = ('G', 'R')
   short_name = "DSWI4"
   long_name = "Disease-Water Stress Index 4"
   bands = ['G', 'R']
@@ -764,16 +802,17 @@ class DSWI4(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R})])
+    super().__init__(operands=[G / R])
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DSWI5(WCPSExpr):
   """Disease-Water Stress Index 5"""
+  __slots__ = ('N', 'G', 'S1', 'R')
   short_name = "DSWI5"
   long_name = "Disease-Water Stress Index 5"
   bands = ['N', 'G', 'S1', 'R']
@@ -783,18 +822,19 @@ class DSWI5(WCPSExpr):
   contributor = "https://github.com/remi-braun"
 
   def __init__(self, N: OperandType, G: OperandType, S1: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "S1": S1, "R": R})])
+    super().__init__(operands=[(N + G) / (S1 + R)])
     self.N = N
     self.G = G
     self.S1 = S1
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DVI(WCPSExpr):
   """Difference Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "DVI"
   long_name = "Difference Vegetation Index"
   bands = ['N', 'R']
@@ -804,16 +844,17 @@ class DVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[N - R])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DVIplus(WCPSExpr):
   """Difference Vegetation Index Plus"""
+  __slots__ = ('lambdaN', 'lambdaR', 'lambdaG', 'G', 'N', 'R')
   short_name = "DVIplus"
   long_name = "Difference Vegetation Index Plus"
   bands = ['lambdaN', 'lambdaR', 'lambdaG', 'G', 'N', 'R']
@@ -823,7 +864,7 @@ class DVIplus(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, lambdaN: OperandType, lambdaR: OperandType, lambdaG: OperandType, G: OperandType, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"lambdaN": lambdaN, "lambdaR": lambdaR, "lambdaG": lambdaG, "G": G, "N": N, "R": R})])
+    super().__init__(operands=[(lambdaN - lambdaR) / (lambdaN - lambdaG) * G + (1.0 - (lambdaN - lambdaR) / (lambdaN - lambdaG)) * N - R])
     self.lambdaN = lambdaN
     self.lambdaR = lambdaR
     self.lambdaG = lambdaG
@@ -831,12 +872,13 @@ class DVIplus(WCPSExpr):
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DpRVIHH(WCPSExpr):
   """Dual-Polarized Radar Vegetation Index HH"""
+  __slots__ = ('HV', 'HH')
   short_name = "DpRVIHH"
   long_name = "Dual-Polarized Radar Vegetation Index HH"
   bands = ['HV', 'HH']
@@ -846,16 +888,17 @@ class DpRVIHH(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, HV: OperandType, HH: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"HV": HV, "HH": HH})])
+    super().__init__(operands=[4.0 * HV / (HH + HV)])
     self.HV = HV
     self.HH = HH
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class DpRVIVV(WCPSExpr):
   """Dual-Polarized Radar Vegetation Index VV"""
+  __slots__ = ('VH', 'VV')
   short_name = "DpRVIVV"
   long_name = "Dual-Polarized Radar Vegetation Index VV"
   bands = ['VH', 'VV']
@@ -865,16 +908,17 @@ class DpRVIVV(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VH: OperandType, VV: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VH": VH, "VV": VV})])
+    super().__init__(operands=[4.0 * VH / (VV + VH)])
     self.VH = VH
     self.VV = VV
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class EBBI(WCPSExpr):
   """Enhanced Built-Up and Bareness Index"""
+  __slots__ = ('S1', 'N', 'T')
   short_name = "EBBI"
   long_name = "Enhanced Built-Up and Bareness Index"
   bands = ['S1', 'N', 'T']
@@ -884,17 +928,18 @@ class EBBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, N: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "N": N, "T": T})])
+    super().__init__(operands=[(S1 - N) / (10.0 * (S1 + T) ** 0.5)])
     self.S1 = S1
     self.N = N
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class EBI(WCPSExpr):
   """Enhanced Bloom Index"""
+  __slots__ = ('R', 'G', 'B', 'epsilon')
   short_name = "EBI"
   long_name = "Enhanced Bloom Index"
   bands = ['R', 'G', 'B', 'epsilon']
@@ -904,18 +949,19 @@ class EBI(WCPSExpr):
   contributor = "https://github.com/geoSanjeeb"
 
   def __init__(self, R: OperandType, G: OperandType, B: OperandType, epsilon: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "G": G, "B": B, "epsilon": epsilon})])
+    super().__init__(operands=[(R + G + B) / (G / B * (R - B + epsilon))])
     self.R = R
     self.G = G
     self.B = B
     self.epsilon = epsilon
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class EMBI(WCPSExpr):
   """Enhanced Modified Bare Soil Index"""
+  __slots__ = ('S1', 'S2', 'N', 'G')
   short_name = "EMBI"
   long_name = "Enhanced Modified Bare Soil Index"
   bands = ['S1', 'S2', 'N', 'G']
@@ -925,18 +971,19 @@ class EMBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, S2: OperandType, N: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "S2": S2, "N": N, "G": G})])
+    super().__init__(operands=[((S1 - S2 - N) / (S1 + S2 + N) + 0.5 - (G - S1) / (G + S1) - 0.5) / ((S1 - S2 - N) / (S1 + S2 + N) + 0.5 + (G - S1) / (G + S1) + 1.5)])
     self.S1 = S1
     self.S2 = S2
     self.N = N
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ENDVI(WCPSExpr):
   """Enhanced Normalized Difference Vegetation Index"""
+  __slots__ = ('N', 'G', 'B')
   short_name = "ENDVI"
   long_name = "Enhanced Normalized Difference Vegetation Index"
   bands = ['N', 'G', 'B']
@@ -946,17 +993,18 @@ class ENDVI(WCPSExpr):
   contributor = "https://github.com/gagev"
 
   def __init__(self, N: OperandType, G: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "B": B})])
+    super().__init__(operands=[(N + G - 2 * B) / (N + G + 2 * B)])
     self.N = N
     self.G = G
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class EVI(WCPSExpr):
   """Enhanced Vegetation Index"""
+  __slots__ = ('g', 'N', 'R', 'C1', 'C2', 'B', 'L')
   short_name = "EVI"
   long_name = "Enhanced Vegetation Index"
   bands = ['g', 'N', 'R', 'C1', 'C2', 'B', 'L']
@@ -966,7 +1014,7 @@ class EVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, g: OperandType, N: OperandType, R: OperandType, C1: OperandType, C2: OperandType, B: OperandType, L: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"g": g, "N": N, "R": R, "C1": C1, "C2": C2, "B": B, "L": L})])
+    super().__init__(operands=[g * (N - R) / (N + C1 * R - C2 * B + L)])
     self.g = g
     self.N = N
     self.R = R
@@ -975,12 +1023,13 @@ class EVI(WCPSExpr):
     self.B = B
     self.L = L
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class EVI2(WCPSExpr):
   """Two-Band Enhanced Vegetation Index"""
+  __slots__ = ('g', 'N', 'R', 'L')
   short_name = "EVI2"
   long_name = "Two-Band Enhanced Vegetation Index"
   bands = ['g', 'N', 'R', 'L']
@@ -990,18 +1039,19 @@ class EVI2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, g: OperandType, N: OperandType, R: OperandType, L: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"g": g, "N": N, "R": R, "L": L})])
+    super().__init__(operands=[g * (N - R) / (N + 2.4 * R + L)])
     self.g = g
     self.N = N
     self.R = R
     self.L = L
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class EVIv(WCPSExpr):
   """Enhanced Vegetation Index of Vegetation"""
+  __slots__ = ('N', 'R', 'B')
   short_name = "EVIv"
   long_name = "Enhanced Vegetation Index of Vegetation"
   bands = ['N', 'R', 'B']
@@ -1011,17 +1061,18 @@ class EVIv(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "B": B})])
+    super().__init__(operands=[2.5 * ((N - R) / (N + 6 * R - 7.5 * B + 1.0)) * N])
     self.N = N
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ExG(WCPSExpr):
   """Excess Green Index"""
+  __slots__ = ('G', 'R', 'B')
   short_name = "ExG"
   long_name = "Excess Green Index"
   bands = ['G', 'R', 'B']
@@ -1031,17 +1082,18 @@ class ExG(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "B": B})])
+    super().__init__(operands=[2 * G - R - B])
     self.G = G
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ExGR(WCPSExpr):
   """ExG - ExR Vegetation Index"""
+  __slots__ = ('G', 'R', 'B')
   short_name = "ExGR"
   long_name = "ExG - ExR Vegetation Index"
   bands = ['G', 'R', 'B']
@@ -1051,17 +1103,18 @@ class ExGR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "B": B})])
+    super().__init__(operands=[2.0 * G - R - B - (1.3 * R - G)])
     self.G = G
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ExR(WCPSExpr):
   """Excess Red Index"""
+  __slots__ = ('R', 'G')
   short_name = "ExR"
   long_name = "Excess Red Index"
   bands = ['R', 'G']
@@ -1071,16 +1124,17 @@ class ExR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "G": G})])
+    super().__init__(operands=[1.3 * R - G])
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class FAI(WCPSExpr):
   """Floating Algae Index"""
+  __slots__ = ('N', 'R', 'S1', 'lambdaN', 'lambdaR', 'lambdaS1')
   short_name = "FAI"
   long_name = "Floating Algae Index"
   bands = ['N', 'R', 'S1', 'lambdaN', 'lambdaR', 'lambdaS1']
@@ -1090,7 +1144,7 @@ class FAI(WCPSExpr):
   contributor = "https://github.com/emanuelcastanho"
 
   def __init__(self, N: OperandType, R: OperandType, S1: OperandType, lambdaN: OperandType, lambdaR: OperandType, lambdaS1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "S1": S1, "lambdaN": lambdaN, "lambdaR": lambdaR, "lambdaS1": lambdaS1})])
+    super().__init__(operands=[N - (R + (S1 - R) * ((lambdaN - lambdaR) / (lambdaS1 - lambdaR)))])
     self.N = N
     self.R = R
     self.S1 = S1
@@ -1098,12 +1152,13 @@ class FAI(WCPSExpr):
     self.lambdaR = lambdaR
     self.lambdaS1 = lambdaS1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class FCVI(WCPSExpr):
   """Fluorescence Correction Vegetation Index"""
+  __slots__ = ('N', 'R', 'G', 'B')
   short_name = "FCVI"
   long_name = "Fluorescence Correction Vegetation Index"
   bands = ['N', 'R', 'G', 'B']
@@ -1113,18 +1168,19 @@ class FCVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, G: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "G": G, "B": B})])
+    super().__init__(operands=[N - (R + G + B) / 3.0])
     self.N = N
     self.R = R
     self.G = G
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GARI(WCPSExpr):
   """Green Atmospherically Resistant Vegetation Index"""
+  __slots__ = ('N', 'G', 'B', 'R')
   short_name = "GARI"
   long_name = "Green Atmospherically Resistant Vegetation Index"
   bands = ['N', 'G', 'B', 'R']
@@ -1134,18 +1190,19 @@ class GARI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, B: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "B": B, "R": R})])
+    super().__init__(operands=[(N - (G - (B - R))) / (N - (G + (B - R)))])
     self.N = N
     self.G = G
     self.B = B
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GBNDVI(WCPSExpr):
   """Green-Blue Normalized Difference Vegetation Index"""
+  __slots__ = ('N', 'G', 'B')
   short_name = "GBNDVI"
   long_name = "Green-Blue Normalized Difference Vegetation Index"
   bands = ['N', 'G', 'B']
@@ -1155,17 +1212,18 @@ class GBNDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "B": B})])
+    super().__init__(operands=[(N - (G + B)) / (N + (G + B))])
     self.N = N
     self.G = G
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GCC(WCPSExpr):
   """Green Chromatic Coordinate"""
+  __slots__ = ('G', 'R', 'B')
   short_name = "GCC"
   long_name = "Green Chromatic Coordinate"
   bands = ['G', 'R', 'B']
@@ -1175,17 +1233,18 @@ class GCC(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "B": B})])
+    super().__init__(operands=[G / (R + G + B)])
     self.G = G
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GDVI(WCPSExpr):
   """Generalized Difference Vegetation Index"""
+  __slots__ = ('N', 'nexp', 'R')
   short_name = "GDVI"
   long_name = "Generalized Difference Vegetation Index"
   bands = ['N', 'nexp', 'R']
@@ -1195,17 +1254,18 @@ class GDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, nexp: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "nexp": nexp, "R": R})])
+    super().__init__(operands=[(N ** nexp - R ** nexp) / (N ** nexp + R ** nexp)])
     self.N = N
     self.nexp = nexp
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GEMI(WCPSExpr):
   """Global Environment Monitoring Index"""
+  __slots__ = ('N', 'R')
   short_name = "GEMI"
   long_name = "Global Environment Monitoring Index"
   bands = ['N', 'R']
@@ -1215,16 +1275,17 @@ class GEMI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[(2.0 * (N ** 2.0 - R ** 2.0) + 1.5 * N + 0.5 * R) / (N + R + 0.5) * (1.0 - 0.25 * ((2.0 * (N ** 2.0 - R ** 2) + 1.5 * N + 0.5 * R) / (N + R + 0.5))) - (R - 0.125) / (1 - R)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GLI(WCPSExpr):
   """Green Leaf Index"""
+  __slots__ = ('G', 'R', 'B')
   short_name = "GLI"
   long_name = "Green Leaf Index"
   bands = ['G', 'R', 'B']
@@ -1234,17 +1295,18 @@ class GLI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "B": B})])
+    super().__init__(operands=[(2.0 * G - R - B) / (2.0 * G + R + B)])
     self.G = G
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GM1(WCPSExpr):
   """Gitelson and Merzlyak Index 1"""
+  __slots__ = ('RE2', 'G')
   short_name = "GM1"
   long_name = "Gitelson and Merzlyak Index 1"
   bands = ['RE2', 'G']
@@ -1254,16 +1316,17 @@ class GM1(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "G": G})])
+    super().__init__(operands=[RE2 / G])
     self.RE2 = RE2
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GM2(WCPSExpr):
   """Gitelson and Merzlyak Index 2"""
+  __slots__ = ('RE2', 'RE1')
   short_name = "GM2"
   long_name = "Gitelson and Merzlyak Index 2"
   bands = ['RE2', 'RE1']
@@ -1273,16 +1336,17 @@ class GM2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1})])
+    super().__init__(operands=[RE2 / RE1])
     self.RE2 = RE2
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GNDVI(WCPSExpr):
   """Green Normalized Difference Vegetation Index"""
+  __slots__ = ('N', 'G')
   short_name = "GNDVI"
   long_name = "Green Normalized Difference Vegetation Index"
   bands = ['N', 'G']
@@ -1292,16 +1356,17 @@ class GNDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G})])
+    super().__init__(operands=[(N - G) / (N + G)])
     self.N = N
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GOSAVI(WCPSExpr):
   """Green Optimized Soil Adjusted Vegetation Index"""
+  __slots__ = ('N', 'G')
   short_name = "GOSAVI"
   long_name = "Green Optimized Soil Adjusted Vegetation Index"
   bands = ['N', 'G']
@@ -1311,16 +1376,17 @@ class GOSAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G})])
+    super().__init__(operands=[(N - G) / (N + G + 0.16)])
     self.N = N
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GRNDVI(WCPSExpr):
   """Green-Red Normalized Difference Vegetation Index"""
+  __slots__ = ('N', 'G', 'R')
   short_name = "GRNDVI"
   long_name = "Green-Red Normalized Difference Vegetation Index"
   bands = ['N', 'G', 'R']
@@ -1330,17 +1396,18 @@ class GRNDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "R": R})])
+    super().__init__(operands=[(N - (G + R)) / (N + (G + R))])
     self.N = N
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GRVI(WCPSExpr):
   """Green Ratio Vegetation Index"""
+  __slots__ = ('N', 'G')
   short_name = "GRVI"
   long_name = "Green Ratio Vegetation Index"
   bands = ['N', 'G']
@@ -1350,16 +1417,17 @@ class GRVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G})])
+    super().__init__(operands=[N / G])
     self.N = N
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GSAVI(WCPSExpr):
   """Green Soil Adjusted Vegetation Index"""
+  __slots__ = ('L', 'N', 'G')
   short_name = "GSAVI"
   long_name = "Green Soil Adjusted Vegetation Index"
   bands = ['L', 'N', 'G']
@@ -1369,17 +1437,18 @@ class GSAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, L: OperandType, N: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"L": L, "N": N, "G": G})])
+    super().__init__(operands=[(1.0 + L) * (N - G) / (N + G + L)])
     self.L = L
     self.N = N
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class GVMI(WCPSExpr):
   """Global Vegetation Moisture Index"""
+  __slots__ = ('N', 'S2')
   short_name = "GVMI"
   long_name = "Global Vegetation Moisture Index"
   bands = ['N', 'S2']
@@ -1389,16 +1458,17 @@ class GVMI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2})])
+    super().__init__(operands=[(N + 0.1 - (S2 + 0.02)) / (N + 0.1 + (S2 + 0.02))])
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class IAVI(WCPSExpr):
   """New Atmospherically Resistant Vegetation Index"""
+  __slots__ = ('N', 'R', 'gamma', 'B')
   short_name = "IAVI"
   long_name = "New Atmospherically Resistant Vegetation Index"
   bands = ['N', 'R', 'gamma', 'B']
@@ -1408,18 +1478,19 @@ class IAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, gamma: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "gamma": gamma, "B": B})])
+    super().__init__(operands=[(N - (R - gamma * (B - R))) / (N + (R - gamma * (B - R)))])
     self.N = N
     self.R = R
     self.gamma = gamma
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class IBI(WCPSExpr):
   """Index-Based Built-Up Index"""
+  __slots__ = ('S1', 'N', 'R', 'L', 'G')
   short_name = "IBI"
   long_name = "Index-Based Built-Up Index"
   bands = ['S1', 'N', 'R', 'L', 'G']
@@ -1429,19 +1500,20 @@ class IBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, N: OperandType, R: OperandType, L: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "N": N, "R": R, "L": L, "G": G})])
+    super().__init__(operands=[((S1 - N) / (S1 + N) - ((N - R) * (1.0 + L) / (N + R + L) + (G - S1) / (G + S1)) / 2.0) / ((S1 - N) / (S1 + N) + ((N - R) * (1.0 + L) / (N + R + L) + (G - S1) / (G + S1)) / 2.0)])
     self.S1 = S1
     self.N = N
     self.R = R
     self.L = L
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class IKAW(WCPSExpr):
   """Kawashima Index"""
+  __slots__ = ('R', 'B')
   short_name = "IKAW"
   long_name = "Kawashima Index"
   bands = ['R', 'B']
@@ -1451,16 +1523,17 @@ class IKAW(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "B": B})])
+    super().__init__(operands=[(R - B) / (R + B)])
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class IPVI(WCPSExpr):
   """Infrared Percentage Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "IPVI"
   long_name = "Infrared Percentage Vegetation Index"
   bands = ['N', 'R']
@@ -1470,16 +1543,17 @@ class IPVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[N / (N + R)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class IRECI(WCPSExpr):
   """Inverted Red-Edge Chlorophyll Index"""
+  __slots__ = ('RE3', 'R', 'RE1', 'RE2')
   short_name = "IRECI"
   long_name = "Inverted Red-Edge Chlorophyll Index"
   bands = ['RE3', 'R', 'RE1', 'RE2']
@@ -1489,18 +1563,19 @@ class IRECI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE3: OperandType, R: OperandType, RE1: OperandType, RE2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE3": RE3, "R": R, "RE1": RE1, "RE2": RE2})])
+    super().__init__(operands=[(RE3 - R) / (RE1 / RE2)])
     self.RE3 = RE3
     self.R = R
     self.RE1 = RE1
     self.RE2 = RE2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class LSWI(WCPSExpr):
   """Land Surface Water Index"""
+  __slots__ = ('N', 'S1')
   short_name = "LSWI"
   long_name = "Land Surface Water Index"
   bands = ['N', 'S1']
@@ -1510,16 +1585,17 @@ class LSWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1})])
+    super().__init__(operands=[(N - S1) / (N + S1)])
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MBI(WCPSExpr):
   """Modified Bare Soil Index"""
+  __slots__ = ('S1', 'S2', 'N')
   short_name = "MBI"
   long_name = "Modified Bare Soil Index"
   bands = ['S1', 'S2', 'N']
@@ -1529,17 +1605,18 @@ class MBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, S2: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "S2": S2, "N": N})])
+    super().__init__(operands=[(S1 - S2 - N) / (S1 + S2 + N) + 0.5])
     self.S1 = S1
     self.S2 = S2
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MBWI(WCPSExpr):
   """Multi-Band Water Index"""
+  __slots__ = ('omega', 'G', 'R', 'N', 'S1', 'S2')
   short_name = "MBWI"
   long_name = "Multi-Band Water Index"
   bands = ['omega', 'G', 'R', 'N', 'S1', 'S2']
@@ -1549,7 +1626,7 @@ class MBWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, omega: OperandType, G: OperandType, R: OperandType, N: OperandType, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"omega": omega, "G": G, "R": R, "N": N, "S1": S1, "S2": S2})])
+    super().__init__(operands=[omega * G - R - N - S1 - S2])
     self.omega = omega
     self.G = G
     self.R = R
@@ -1557,12 +1634,13 @@ class MBWI(WCPSExpr):
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MCARI(WCPSExpr):
   """Modified Chlorophyll Absorption in Reflectance Index"""
+  __slots__ = ('RE1', 'R', 'G')
   short_name = "MCARI"
   long_name = "Modified Chlorophyll Absorption in Reflectance Index"
   bands = ['RE1', 'R', 'G']
@@ -1572,17 +1650,18 @@ class MCARI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE1: OperandType, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "R": R, "G": G})])
+    super().__init__(operands=[(RE1 - R - 0.2 * (RE1 - G)) * (RE1 / R)])
     self.RE1 = RE1
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MCARI1(WCPSExpr):
   """Modified Chlorophyll Absorption in Reflectance Index 1"""
+  __slots__ = ('N', 'R', 'G')
   short_name = "MCARI1"
   long_name = "Modified Chlorophyll Absorption in Reflectance Index 1"
   bands = ['N', 'R', 'G']
@@ -1592,17 +1671,18 @@ class MCARI1(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "G": G})])
+    super().__init__(operands=[1.2 * (2.5 * (N - R) - 1.3 * (N - G))])
     self.N = N
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MCARI2(WCPSExpr):
   """Modified Chlorophyll Absorption in Reflectance Index 2"""
+  __slots__ = ('N', 'R', 'G')
   short_name = "MCARI2"
   long_name = "Modified Chlorophyll Absorption in Reflectance Index 2"
   bands = ['N', 'R', 'G']
@@ -1612,17 +1692,18 @@ class MCARI2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "G": G})])
+    super().__init__(operands=[1.5 * (2.5 * (N - R) - 1.3 * (N - G)) / ((2.0 * N + 1) ** 2 - (6.0 * N - 5 * R ** 0.5) - 0.5) ** 0.5])
     self.N = N
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MCARI705(WCPSExpr):
   """Modified Chlorophyll Absorption in Reflectance Index (705 and 750 nm)"""
+  __slots__ = ('RE2', 'RE1', 'G')
   short_name = "MCARI705"
   long_name = "Modified Chlorophyll Absorption in Reflectance Index (705 and 750 nm)"
   bands = ['RE2', 'RE1', 'G']
@@ -1632,17 +1713,18 @@ class MCARI705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1, "G": G})])
+    super().__init__(operands=[(RE2 - RE1 - 0.2 * (RE2 - G)) * (RE2 / RE1)])
     self.RE2 = RE2
     self.RE1 = RE1
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MCARIOSAVI(WCPSExpr):
   """MCARI/OSAVI Ratio"""
+  __slots__ = ('RE1', 'R', 'G', 'N')
   short_name = "MCARIOSAVI"
   long_name = "MCARI/OSAVI Ratio"
   bands = ['RE1', 'R', 'G', 'N']
@@ -1652,18 +1734,19 @@ class MCARIOSAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE1: OperandType, R: OperandType, G: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "R": R, "G": G, "N": N})])
+    super().__init__(operands=[(RE1 - R - 0.2 * (RE1 - G)) * (RE1 / R) / (1.16 * (N - R) / (N + R + 0.16))])
     self.RE1 = RE1
     self.R = R
     self.G = G
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MCARIOSAVI705(WCPSExpr):
   """MCARI/OSAVI Ratio (705 and 750 nm)"""
+  __slots__ = ('RE2', 'RE1', 'G')
   short_name = "MCARIOSAVI705"
   long_name = "MCARI/OSAVI Ratio (705 and 750 nm)"
   bands = ['RE2', 'RE1', 'G']
@@ -1673,17 +1756,18 @@ class MCARIOSAVI705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1, "G": G})])
+    super().__init__(operands=[(RE2 - RE1 - 0.2 * (RE2 - G)) * (RE2 / RE1) / (1.16 * (RE2 - RE1) / (RE2 + RE1 + 0.16))])
     self.RE2 = RE2
     self.RE1 = RE1
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MGRVI(WCPSExpr):
   """Modified Green Red Vegetation Index"""
+  __slots__ = ('G', 'R')
   short_name = "MGRVI"
   long_name = "Modified Green Red Vegetation Index"
   bands = ['G', 'R']
@@ -1693,16 +1777,17 @@ class MGRVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R})])
+    super().__init__(operands=[(G ** 2.0 - R ** 2.0) / (G ** 2.0 + R ** 2.0)])
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MIRBI(WCPSExpr):
   """Mid-Infrared Burn Index"""
+  __slots__ = ('S2', 'S1')
   short_name = "MIRBI"
   long_name = "Mid-Infrared Burn Index"
   bands = ['S2', 'S1']
@@ -1712,16 +1797,17 @@ class MIRBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S2: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S2": S2, "S1": S1})])
+    super().__init__(operands=[10.0 * S2 - 9.8 * S1 + 2.0])
     self.S2 = S2
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MLSWI26(WCPSExpr):
   """Modified Land Surface Water Index (MODIS Bands 2 and 6)"""
+  __slots__ = ('N', 'S1')
   short_name = "MLSWI26"
   long_name = "Modified Land Surface Water Index (MODIS Bands 2 and 6)"
   bands = ['N', 'S1']
@@ -1731,16 +1817,17 @@ class MLSWI26(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1})])
+    super().__init__(operands=[(1.0 - N - S1) / (1.0 - N + S1)])
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MLSWI27(WCPSExpr):
   """Modified Land Surface Water Index (MODIS Bands 2 and 7)"""
+  __slots__ = ('N', 'S2')
   short_name = "MLSWI27"
   long_name = "Modified Land Surface Water Index (MODIS Bands 2 and 7)"
   bands = ['N', 'S2']
@@ -1750,16 +1837,17 @@ class MLSWI27(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2})])
+    super().__init__(operands=[(1.0 - N - S2) / (1.0 - N + S2)])
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MNDVI(WCPSExpr):
   """Modified Normalized Difference Vegetation Index"""
+  __slots__ = ('N', 'S2')
   short_name = "MNDVI"
   long_name = "Modified Normalized Difference Vegetation Index"
   bands = ['N', 'S2']
@@ -1769,16 +1857,17 @@ class MNDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2})])
+    super().__init__(operands=[(N - S2) / (N + S2)])
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MNDWI(WCPSExpr):
   """Modified Normalized Difference Water Index"""
+  __slots__ = ('G', 'S1')
   short_name = "MNDWI"
   long_name = "Modified Normalized Difference Water Index"
   bands = ['G', 'S1']
@@ -1788,16 +1877,17 @@ class MNDWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "S1": S1})])
+    super().__init__(operands=[(G - S1) / (G + S1)])
     self.G = G
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MNLI(WCPSExpr):
   """Modified Non-Linear Vegetation Index"""
+  __slots__ = ('L', 'N', 'R')
   short_name = "MNLI"
   long_name = "Modified Non-Linear Vegetation Index"
   bands = ['L', 'N', 'R']
@@ -1807,17 +1897,18 @@ class MNLI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, L: OperandType, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"L": L, "N": N, "R": R})])
+    super().__init__(operands=[(1 + L) * (N ** 2 - R) / (N ** 2 + R + L)])
     self.L = L
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MRBVI(WCPSExpr):
   """Modified Red Blue Vegetation Index"""
+  __slots__ = ('R', 'B')
   short_name = "MRBVI"
   long_name = "Modified Red Blue Vegetation Index"
   bands = ['R', 'B']
@@ -1827,16 +1918,17 @@ class MRBVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "B": B})])
+    super().__init__(operands=[(R ** 2.0 - B ** 2.0) / (R ** 2.0 + B ** 2.0)])
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MSAVI(WCPSExpr):
   """Modified Soil-Adjusted Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "MSAVI"
   long_name = "Modified Soil-Adjusted Vegetation Index"
   bands = ['N', 'R']
@@ -1846,16 +1938,17 @@ class MSAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[0.5 * (2.0 * N + 1 - ((2 * N + 1) ** 2 - 8 * (N - R)) ** 0.5)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MSI(WCPSExpr):
   """Moisture Stress Index"""
+  __slots__ = ('S1', 'N')
   short_name = "MSI"
   long_name = "Moisture Stress Index"
   bands = ['S1', 'N']
@@ -1865,16 +1958,17 @@ class MSI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "N": N})])
+    super().__init__(operands=[S1 / N])
     self.S1 = S1
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MSR(WCPSExpr):
   """Modified Simple Ratio"""
+  __slots__ = ('N', 'R')
   short_name = "MSR"
   long_name = "Modified Simple Ratio"
   bands = ['N', 'R']
@@ -1884,16 +1978,17 @@ class MSR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[(N / R - 1) / (N / R + 1) ** 0.5])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MSR705(WCPSExpr):
   """Modified Simple Ratio (705 and 750 nm)"""
+  __slots__ = ('RE2', 'RE1')
   short_name = "MSR705"
   long_name = "Modified Simple Ratio (705 and 750 nm)"
   bands = ['RE2', 'RE1']
@@ -1903,16 +1998,17 @@ class MSR705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1})])
+    super().__init__(operands=[(RE2 / RE1 - 1) / (RE2 / RE1 + 1) ** 0.5])
     self.RE2 = RE2
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MTCI(WCPSExpr):
   """MERIS Terrestrial Chlorophyll Index"""
+  __slots__ = ('RE2', 'RE1', 'R')
   short_name = "MTCI"
   long_name = "MERIS Terrestrial Chlorophyll Index"
   bands = ['RE2', 'RE1', 'R']
@@ -1922,17 +2018,18 @@ class MTCI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1, "R": R})])
+    super().__init__(operands=[(RE2 - RE1) / (RE1 - R)])
     self.RE2 = RE2
     self.RE1 = RE1
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MTVI1(WCPSExpr):
   """Modified Triangular Vegetation Index 1"""
+  __slots__ = ('N', 'G', 'R')
   short_name = "MTVI1"
   long_name = "Modified Triangular Vegetation Index 1"
   bands = ['N', 'G', 'R']
@@ -1942,17 +2039,18 @@ class MTVI1(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "R": R})])
+    super().__init__(operands=[1.2 * (1.2 * (N - G) - 2.5 * (R - G))])
     self.N = N
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MTVI2(WCPSExpr):
   """Modified Triangular Vegetation Index 2"""
+  __slots__ = ('N', 'G', 'R')
   short_name = "MTVI2"
   long_name = "Modified Triangular Vegetation Index 2"
   bands = ['N', 'G', 'R']
@@ -1962,17 +2060,18 @@ class MTVI2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "R": R})])
+    super().__init__(operands=[1.5 * (1.2 * (N - G) - 2.5 * (R - G)) / ((2.0 * N + 1) ** 2 - (6.0 * N - 5 * R ** 0.5) - 0.5) ** 0.5])
     self.N = N
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class MuWIR(WCPSExpr):
   """Revised Multi-Spectral Water Index"""
+  __slots__ = ('B', 'G', 'N', 'S2', 'S1')
   short_name = "MuWIR"
   long_name = "Revised Multi-Spectral Water Index"
   bands = ['B', 'G', 'N', 'S2', 'S1']
@@ -1982,19 +2081,20 @@ class MuWIR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, G: OperandType, N: OperandType, S2: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "G": G, "N": N, "S2": S2, "S1": S1})])
+    super().__init__(operands=[-4.0 * ((B - G) / (B + G)) + 2.0 * ((G - N) / (G + N)) + 2.0 * ((G - S2) / (G + S2)) - (G - S1) / (G + S1)])
     self.B = B
     self.G = G
     self.N = N
     self.S2 = S2
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBAI(WCPSExpr):
   """Normalized Built-up Area Index"""
+  __slots__ = ('S2', 'S1', 'G')
   short_name = "NBAI"
   long_name = "Normalized Built-up Area Index"
   bands = ['S2', 'S1', 'G']
@@ -2004,17 +2104,18 @@ class NBAI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S2: OperandType, S1: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S2": S2, "S1": S1, "G": G})])
+    super().__init__(operands=[(S2 - S1 / G) / (S2 + S1 / G)])
     self.S2 = S2
     self.S1 = S1
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBLI(WCPSExpr):
   """Normalized Difference Bare Land Index"""
+  __slots__ = ('R', 'T')
   short_name = "NBLI"
   long_name = "Normalized Difference Bare Land Index"
   bands = ['R', 'T']
@@ -2024,16 +2125,17 @@ class NBLI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "T": T})])
+    super().__init__(operands=[(R - T) / (R + T)])
     self.R = R
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBLIOLI(WCPSExpr):
   """Normalized Difference Bare Land Index for Landsat-OLI"""
+  __slots__ = ('R', 'T1')
   short_name = "NBLIOLI"
   long_name = "Normalized Difference Bare Land Index for Landsat-OLI"
   bands = ['R', 'T1']
@@ -2043,16 +2145,17 @@ class NBLIOLI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, T1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "T1": T1})])
+    super().__init__(operands=[(R - T1) / (R + T1)])
     self.R = R
     self.T1 = T1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBR(WCPSExpr):
   """Normalized Burn Ratio"""
+  __slots__ = ('N', 'S2')
   short_name = "NBR"
   long_name = "Normalized Burn Ratio"
   bands = ['N', 'S2']
@@ -2062,16 +2165,17 @@ class NBR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2})])
+    super().__init__(operands=[(N - S2) / (N + S2)])
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBR2(WCPSExpr):
   """Normalized Burn Ratio 2"""
+  __slots__ = ('S1', 'S2')
   short_name = "NBR2"
   long_name = "Normalized Burn Ratio 2"
   bands = ['S1', 'S2']
@@ -2081,16 +2185,17 @@ class NBR2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "S2": S2})])
+    super().__init__(operands=[(S1 - S2) / (S1 + S2)])
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBRSWIR(WCPSExpr):
   """Normalized Burn Ratio SWIR"""
+  __slots__ = ('S2', 'S1')
   short_name = "NBRSWIR"
   long_name = "Normalized Burn Ratio SWIR"
   bands = ['S2', 'S1']
@@ -2100,16 +2205,17 @@ class NBRSWIR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S2: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S2": S2, "S1": S1})])
+    super().__init__(operands=[(S2 - S1 - 0.02) / (S2 + S1 + 0.1)])
     self.S2 = S2
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBRT1(WCPSExpr):
   """Normalized Burn Ratio Thermal 1"""
+  __slots__ = ('N', 'S2', 'T')
   short_name = "NBRT1"
   long_name = "Normalized Burn Ratio Thermal 1"
   bands = ['N', 'S2', 'T']
@@ -2119,17 +2225,18 @@ class NBRT1(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2, "T": T})])
+    super().__init__(operands=[(N - S2 * T / 10000.0) / (N + S2 * T / 10000.0)])
     self.N = N
     self.S2 = S2
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBRT2(WCPSExpr):
   """Normalized Burn Ratio Thermal 2"""
+  __slots__ = ('N', 'T', 'S2')
   short_name = "NBRT2"
   long_name = "Normalized Burn Ratio Thermal 2"
   bands = ['N', 'T', 'S2']
@@ -2139,17 +2246,18 @@ class NBRT2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, T: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "T": T, "S2": S2})])
+    super().__init__(operands=[(N / (T / 10000.0) - S2) / (N / (T / 10000.0) + S2)])
     self.N = N
     self.T = T
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBRT3(WCPSExpr):
   """Normalized Burn Ratio Thermal 3"""
+  __slots__ = ('N', 'T', 'S2')
   short_name = "NBRT3"
   long_name = "Normalized Burn Ratio Thermal 3"
   bands = ['N', 'T', 'S2']
@@ -2159,17 +2267,18 @@ class NBRT3(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, T: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "T": T, "S2": S2})])
+    super().__init__(operands=[(N - T / 10000.0 - S2) / (N - T / 10000.0 + S2)])
     self.N = N
     self.T = T
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBRplus(WCPSExpr):
   """Normalized Burn Ratio Plus"""
+  __slots__ = ('S2', 'N2', 'G', 'B')
   short_name = "NBRplus"
   long_name = "Normalized Burn Ratio Plus"
   bands = ['S2', 'N2', 'G', 'B']
@@ -2179,18 +2288,19 @@ class NBRplus(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S2: OperandType, N2: OperandType, G: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S2": S2, "N2": N2, "G": G, "B": B})])
+    super().__init__(operands=[(S2 - N2 - G - B) / (S2 + N2 + G + B)])
     self.S2 = S2
     self.N2 = N2
     self.G = G
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBSIMS(WCPSExpr):
   """Non-Binary Snow Index for Multi-Component Surfaces"""
+  __slots__ = ('G', 'R', 'N', 'B', 'S2', 'S1')
   short_name = "NBSIMS"
   long_name = "Non-Binary Snow Index for Multi-Component Surfaces"
   bands = ['G', 'R', 'N', 'B', 'S2', 'S1']
@@ -2200,7 +2310,7 @@ class NBSIMS(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType, N: OperandType, B: OperandType, S2: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "N": N, "B": B, "S2": S2, "S1": S1})])
+    super().__init__(operands=[0.36 * (G + R + N) - ((B + S2) / G + S1)])
     self.G = G
     self.R = R
     self.N = N
@@ -2208,12 +2318,13 @@ class NBSIMS(WCPSExpr):
     self.S2 = S2
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NBUI(WCPSExpr):
   """New Built-Up Index"""
+  __slots__ = ('S1', 'N', 'T', 'R', 'L', 'G')
   short_name = "NBUI"
   long_name = "New Built-Up Index"
   bands = ['S1', 'N', 'T', 'R', 'L', 'G']
@@ -2223,7 +2334,7 @@ class NBUI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, N: OperandType, T: OperandType, R: OperandType, L: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "N": N, "T": T, "R": R, "L": L, "G": G})])
+    super().__init__(operands=[(S1 - N) / (10.0 * (T + S1) ** 0.5) - (N - R) * (1.0 + L) / (N - R + L) - (G - S1) / (G + S1)])
     self.S1 = S1
     self.N = N
     self.T = T
@@ -2231,12 +2342,13 @@ class NBUI(WCPSExpr):
     self.L = L
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class ND705(WCPSExpr):
   """Normalized Difference (705 and 750 nm)"""
+  __slots__ = ('RE2', 'RE1')
   short_name = "ND705"
   long_name = "Normalized Difference (705 and 750 nm)"
   bands = ['RE2', 'RE1']
@@ -2246,16 +2358,17 @@ class ND705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1})])
+    super().__init__(operands=[(RE2 - RE1) / (RE2 + RE1)])
     self.RE2 = RE2
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDBI(WCPSExpr):
   """Normalized Difference Built-Up Index"""
+  __slots__ = ('S1', 'N')
   short_name = "NDBI"
   long_name = "Normalized Difference Built-Up Index"
   bands = ['S1', 'N']
@@ -2265,16 +2378,17 @@ class NDBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "N": N})])
+    super().__init__(operands=[(S1 - N) / (S1 + N)])
     self.S1 = S1
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDBaI(WCPSExpr):
   """Normalized Difference Bareness Index"""
+  __slots__ = ('S1', 'T')
   short_name = "NDBaI"
   long_name = "Normalized Difference Bareness Index"
   bands = ['S1', 'T']
@@ -2284,16 +2398,17 @@ class NDBaI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "T": T})])
+    super().__init__(operands=[(S1 - T) / (S1 + T)])
     self.S1 = S1
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDCI(WCPSExpr):
   """Normalized Difference Chlorophyll Index"""
+  __slots__ = ('RE1', 'R')
   short_name = "NDCI"
   long_name = "Normalized Difference Chlorophyll Index"
   bands = ['RE1', 'R']
@@ -2303,16 +2418,17 @@ class NDCI(WCPSExpr):
   contributor = "https://github.com/kalab-oto"
 
   def __init__(self, RE1: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "R": R})])
+    super().__init__(operands=[(RE1 - R) / (RE1 + R)])
     self.RE1 = RE1
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDDI(WCPSExpr):
   """Normalized Difference Drought Index"""
+  __slots__ = ('N', 'R', 'G')
   short_name = "NDDI"
   long_name = "Normalized Difference Drought Index"
   bands = ['N', 'R', 'G']
@@ -2322,17 +2438,18 @@ class NDDI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "G": G})])
+    super().__init__(operands=[((N - R) / (N + R) - (G - N) / (G + N)) / ((N - R) / (N + R) + (G - N) / (G + N))])
     self.N = N
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDGI(WCPSExpr):
   """Normalized Difference Greenness Index"""
+  __slots__ = ('lambdaN', 'lambdaR', 'lambdaG', 'G', 'N', 'R')
   short_name = "NDGI"
   long_name = "Normalized Difference Greenness Index"
   bands = ['lambdaN', 'lambdaR', 'lambdaG', 'G', 'N', 'R']
@@ -2342,7 +2459,7 @@ class NDGI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, lambdaN: OperandType, lambdaR: OperandType, lambdaG: OperandType, G: OperandType, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"lambdaN": lambdaN, "lambdaR": lambdaR, "lambdaG": lambdaG, "G": G, "N": N, "R": R})])
+    super().__init__(operands=[((lambdaN - lambdaR) / (lambdaN - lambdaG) * G + (1.0 - (lambdaN - lambdaR) / (lambdaN - lambdaG)) * N - R) / ((lambdaN - lambdaR) / (lambdaN - lambdaG) * G + (1.0 - (lambdaN - lambdaR) / (lambdaN - lambdaG)) * N + R)])
     self.lambdaN = lambdaN
     self.lambdaR = lambdaR
     self.lambdaG = lambdaG
@@ -2350,12 +2467,13 @@ class NDGI(WCPSExpr):
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDGlaI(WCPSExpr):
   """Normalized Difference Glacier Index"""
+  __slots__ = ('G', 'R')
   short_name = "NDGlaI"
   long_name = "Normalized Difference Glacier Index"
   bands = ['G', 'R']
@@ -2365,16 +2483,17 @@ class NDGlaI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R})])
+    super().__init__(operands=[(G - R) / (G + R)])
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDII(WCPSExpr):
   """Normalized Difference Infrared Index"""
+  __slots__ = ('N', 'S1')
   short_name = "NDII"
   long_name = "Normalized Difference Infrared Index"
   bands = ['N', 'S1']
@@ -2384,16 +2503,17 @@ class NDII(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1})])
+    super().__init__(operands=[(N - S1) / (N + S1)])
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDISIb(WCPSExpr):
   """Normalized Difference Impervious Surface Index Blue"""
+  __slots__ = ('T', 'B', 'N', 'S1')
   short_name = "NDISIb"
   long_name = "Normalized Difference Impervious Surface Index Blue"
   bands = ['T', 'B', 'N', 'S1']
@@ -2403,18 +2523,19 @@ class NDISIb(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, T: OperandType, B: OperandType, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"T": T, "B": B, "N": N, "S1": S1})])
+    super().__init__(operands=[(T - (B + N + S1) / 3.0) / (T + (B + N + S1) / 3.0)])
     self.T = T
     self.B = B
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDISIg(WCPSExpr):
   """Normalized Difference Impervious Surface Index Green"""
+  __slots__ = ('T', 'G', 'N', 'S1')
   short_name = "NDISIg"
   long_name = "Normalized Difference Impervious Surface Index Green"
   bands = ['T', 'G', 'N', 'S1']
@@ -2424,18 +2545,19 @@ class NDISIg(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, T: OperandType, G: OperandType, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"T": T, "G": G, "N": N, "S1": S1})])
+    super().__init__(operands=[(T - (G + N + S1) / 3.0) / (T + (G + N + S1) / 3.0)])
     self.T = T
     self.G = G
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDISImndwi(WCPSExpr):
   """Normalized Difference Impervious Surface Index with MNDWI"""
+  __slots__ = ('T', 'G', 'S1', 'N')
   short_name = "NDISImndwi"
   long_name = "Normalized Difference Impervious Surface Index with MNDWI"
   bands = ['T', 'G', 'S1', 'N']
@@ -2445,18 +2567,19 @@ class NDISImndwi(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, T: OperandType, G: OperandType, S1: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"T": T, "G": G, "S1": S1, "N": N})])
+    super().__init__(operands=[(T - ((G - S1) / (G + S1) + N + S1) / 3.0) / (T + ((G - S1) / (G + S1) + N + S1) / 3.0)])
     self.T = T
     self.G = G
     self.S1 = S1
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDISIndwi(WCPSExpr):
   """Normalized Difference Impervious Surface Index with NDWI"""
+  __slots__ = ('T', 'G', 'N', 'S1')
   short_name = "NDISIndwi"
   long_name = "Normalized Difference Impervious Surface Index with NDWI"
   bands = ['T', 'G', 'N', 'S1']
@@ -2466,18 +2589,19 @@ class NDISIndwi(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, T: OperandType, G: OperandType, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"T": T, "G": G, "N": N, "S1": S1})])
+    super().__init__(operands=[(T - ((G - N) / (G + N) + N + S1) / 3.0) / (T + ((G - N) / (G + N) + N + S1) / 3.0)])
     self.T = T
     self.G = G
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDISIr(WCPSExpr):
   """Normalized Difference Impervious Surface Index Red"""
+  __slots__ = ('T', 'R', 'N', 'S1')
   short_name = "NDISIr"
   long_name = "Normalized Difference Impervious Surface Index Red"
   bands = ['T', 'R', 'N', 'S1']
@@ -2487,18 +2611,19 @@ class NDISIr(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, T: OperandType, R: OperandType, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"T": T, "R": R, "N": N, "S1": S1})])
+    super().__init__(operands=[(T - (R + N + S1) / 3.0) / (T + (R + N + S1) / 3.0)])
     self.T = T
     self.R = R
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDMI(WCPSExpr):
   """Normalized Difference Moisture Index"""
+  __slots__ = ('N', 'S1')
   short_name = "NDMI"
   long_name = "Normalized Difference Moisture Index"
   bands = ['N', 'S1']
@@ -2508,16 +2633,17 @@ class NDMI(WCPSExpr):
   contributor = "https://github.com/bpurinton"
 
   def __init__(self, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1})])
+    super().__init__(operands=[(N - S1) / (N + S1)])
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDPI(WCPSExpr):
   """Normalized Difference Phenology Index"""
+  __slots__ = ('N', 'alpha', 'R', 'S1')
   short_name = "NDPI"
   long_name = "Normalized Difference Phenology Index"
   bands = ['N', 'alpha', 'R', 'S1']
@@ -2527,18 +2653,19 @@ class NDPI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, alpha: OperandType, R: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "alpha": alpha, "R": R, "S1": S1})])
+    super().__init__(operands=[(N - (alpha * R + (1.0 - alpha) * S1)) / (N + (alpha * R + (1.0 - alpha) * S1))])
     self.N = N
     self.alpha = alpha
     self.R = R
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDPolI(WCPSExpr):
   """Normalized Difference Polarization Index"""
+  __slots__ = ('VV', 'VH')
   short_name = "NDPolI"
   long_name = "Normalized Difference Polarization Index"
   bands = ['VV', 'VH']
@@ -2548,16 +2675,17 @@ class NDPolI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VV: OperandType, VH: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VV": VV, "VH": VH})])
+    super().__init__(operands=[(VV - VH) / (VV + VH)])
     self.VV = VV
     self.VH = VH
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDPonI(WCPSExpr):
   """Normalized Difference Pond Index"""
+  __slots__ = ('S1', 'G')
   short_name = "NDPonI"
   long_name = "Normalized Difference Pond Index"
   bands = ['S1', 'G']
@@ -2567,16 +2695,17 @@ class NDPonI(WCPSExpr):
   contributor = "https://github.com/CvenGeo"
 
   def __init__(self, S1: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "G": G})])
+    super().__init__(operands=[(S1 - G) / (S1 + G)])
     self.S1 = S1
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDREI(WCPSExpr):
   """Normalized Difference Red Edge Index"""
+  __slots__ = ('N', 'RE1')
   short_name = "NDREI"
   long_name = "Normalized Difference Red Edge Index"
   bands = ['N', 'RE1']
@@ -2586,16 +2715,17 @@ class NDREI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "RE1": RE1})])
+    super().__init__(operands=[(N - RE1) / (N + RE1)])
     self.N = N
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDSI(WCPSExpr):
   """Normalized Difference Snow Index"""
+  __slots__ = ('G', 'S1')
   short_name = "NDSI"
   long_name = "Normalized Difference Snow Index"
   bands = ['G', 'S1']
@@ -2605,16 +2735,17 @@ class NDSI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "S1": S1})])
+    super().__init__(operands=[(G - S1) / (G + S1)])
     self.G = G
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDSII(WCPSExpr):
   """Normalized Difference Snow Ice Index"""
+  __slots__ = ('G', 'N')
   short_name = "NDSII"
   long_name = "Normalized Difference Snow Ice Index"
   bands = ['G', 'N']
@@ -2624,16 +2755,17 @@ class NDSII(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "N": N})])
+    super().__init__(operands=[(G - N) / (G + N)])
     self.G = G
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDSIWV(WCPSExpr):
   """WorldView Normalized Difference Soil Index"""
+  __slots__ = ('G', 'Y')
   short_name = "NDSIWV"
   long_name = "WorldView Normalized Difference Soil Index"
   bands = ['G', 'Y']
@@ -2643,16 +2775,17 @@ class NDSIWV(WCPSExpr):
   contributor = "https://github.com/remi-braun"
 
   def __init__(self, G: OperandType, Y: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "Y": Y})])
+    super().__init__(operands=[(G - Y) / (G + Y)])
     self.G = G
     self.Y = Y
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDSInw(WCPSExpr):
   """Normalized Difference Snow Index with no Water"""
+  __slots__ = ('N', 'S1', 'beta')
   short_name = "NDSInw"
   long_name = "Normalized Difference Snow Index with no Water"
   bands = ['N', 'S1', 'beta']
@@ -2662,17 +2795,18 @@ class NDSInw(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S1: OperandType, beta: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1, "beta": beta})])
+    super().__init__(operands=[(N - S1 - beta) / (N + S1)])
     self.N = N
     self.S1 = S1
     self.beta = beta
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDSWIR(WCPSExpr):
   """Normalized Difference SWIR"""
+  __slots__ = ('N', 'S1')
   short_name = "NDSWIR"
   long_name = "Normalized Difference SWIR"
   bands = ['N', 'S1']
@@ -2682,16 +2816,17 @@ class NDSWIR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1})])
+    super().__init__(operands=[(N - S1) / (N + S1)])
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDSaII(WCPSExpr):
   """Normalized Difference Snow and Ice Index"""
+  __slots__ = ('R', 'S1')
   short_name = "NDSaII"
   long_name = "Normalized Difference Snow and Ice Index"
   bands = ['R', 'S1']
@@ -2701,16 +2836,17 @@ class NDSaII(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "S1": S1})])
+    super().__init__(operands=[(R - S1) / (R + S1)])
     self.R = R
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDSoI(WCPSExpr):
   """Normalized Difference Soil Index"""
+  __slots__ = ('S2', 'G')
   short_name = "NDSoI"
   long_name = "Normalized Difference Soil Index"
   bands = ['S2', 'G']
@@ -2720,16 +2856,17 @@ class NDSoI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S2: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S2": S2, "G": G})])
+    super().__init__(operands=[(S2 - G) / (S2 + G)])
     self.S2 = S2
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDTI(WCPSExpr):
   """Normalized Difference Turbidity Index"""
+  __slots__ = ('R', 'G')
   short_name = "NDTI"
   long_name = "Normalized Difference Turbidity Index"
   bands = ['R', 'G']
@@ -2739,16 +2876,17 @@ class NDTI(WCPSExpr):
   contributor = "https://github.com/CvenGeo"
 
   def __init__(self, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "G": G})])
+    super().__init__(operands=[(R - G) / (R + G)])
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDVI(WCPSExpr):
   """Normalized Difference Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "NDVI"
   long_name = "Normalized Difference Vegetation Index"
   bands = ['N', 'R']
@@ -2758,16 +2896,17 @@ class NDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[(N - R) / (N + R)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDVI705(WCPSExpr):
   """Normalized Difference Vegetation Index (705 and 750 nm)"""
+  __slots__ = ('RE2', 'RE1')
   short_name = "NDVI705"
   long_name = "Normalized Difference Vegetation Index (705 and 750 nm)"
   bands = ['RE2', 'RE1']
@@ -2777,16 +2916,17 @@ class NDVI705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1})])
+    super().__init__(operands=[(RE2 - RE1) / (RE2 + RE1)])
     self.RE2 = RE2
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDVIMNDWI(WCPSExpr):
   """NDVI-MNDWI Model"""
+  __slots__ = ('N', 'R', 'G', 'S1')
   short_name = "NDVIMNDWI"
   long_name = "NDVI-MNDWI Model"
   bands = ['N', 'R', 'G', 'S1']
@@ -2796,18 +2936,19 @@ class NDVIMNDWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, G: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "G": G, "S1": S1})])
+    super().__init__(operands=[(N - R) / (N + R) - (G - S1) / (G + S1)])
     self.N = N
     self.R = R
     self.G = G
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDVIT(WCPSExpr):
   """Normalized Difference Vegetation Index Thermal"""
+  __slots__ = ('N', 'R', 'T')
   short_name = "NDVIT"
   long_name = "Normalized Difference Vegetation Index Thermal"
   bands = ['N', 'R', 'T']
@@ -2817,17 +2958,18 @@ class NDVIT(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "T": T})])
+    super().__init__(operands=[(N - R * T / 10000.0) / (N + R * T / 10000.0)])
     self.N = N
     self.R = R
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDWI(WCPSExpr):
   """Normalized Difference Water Index"""
+  __slots__ = ('G', 'N')
   short_name = "NDWI"
   long_name = "Normalized Difference Water Index"
   bands = ['G', 'N']
@@ -2837,16 +2979,17 @@ class NDWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "N": N})])
+    super().__init__(operands=[(G - N) / (G + N)])
     self.G = G
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDWIns(WCPSExpr):
   """Normalized Difference Water Index with no Snow Cover and Glaciers"""
+  __slots__ = ('G', 'alpha', 'N')
   short_name = "NDWIns"
   long_name = "Normalized Difference Water Index with no Snow Cover and Glaciers"
   bands = ['G', 'alpha', 'N']
@@ -2856,17 +2999,18 @@ class NDWIns(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, alpha: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "alpha": alpha, "N": N})])
+    super().__init__(operands=[(G - alpha * N) / (G + N)])
     self.G = G
     self.alpha = alpha
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NDYI(WCPSExpr):
   """Normalized Difference Yellowness Index"""
+  __slots__ = ('G', 'B')
   short_name = "NDYI"
   long_name = "Normalized Difference Yellowness Index"
   bands = ['G', 'B']
@@ -2876,16 +3020,17 @@ class NDYI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "B": B})])
+    super().__init__(operands=[(G - B) / (G + B)])
     self.G = G
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NGRDI(WCPSExpr):
   """Normalized Green Red Difference Index"""
+  __slots__ = ('G', 'R')
   short_name = "NGRDI"
   long_name = "Normalized Green Red Difference Index"
   bands = ['G', 'R']
@@ -2895,16 +3040,17 @@ class NGRDI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R})])
+    super().__init__(operands=[(G - R) / (G + R)])
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NHFD(WCPSExpr):
   """Non-Homogeneous Feature Difference"""
+  __slots__ = ('RE1', 'A')
   short_name = "NHFD"
   long_name = "Non-Homogeneous Feature Difference"
   bands = ['RE1', 'A']
@@ -2914,16 +3060,17 @@ class NHFD(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE1: OperandType, A: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "A": A})])
+    super().__init__(operands=[(RE1 - A) / (RE1 + A)])
     self.RE1 = RE1
     self.A = A
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NIRv(WCPSExpr):
   """Near-Infrared Reflectance of Vegetation"""
+  __slots__ = ('N', 'R')
   short_name = "NIRv"
   long_name = "Near-Infrared Reflectance of Vegetation"
   bands = ['N', 'R']
@@ -2933,16 +3080,17 @@ class NIRv(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[(N - R) / (N + R) * N])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NIRvH2(WCPSExpr):
   """Hyperspectral Near-Infrared Reflectance of Vegetation"""
+  __slots__ = ('N', 'R', 'k', 'lambdaN', 'lambdaR')
   short_name = "NIRvH2"
   long_name = "Hyperspectral Near-Infrared Reflectance of Vegetation"
   bands = ['N', 'R', 'k', 'lambdaN', 'lambdaR']
@@ -2952,19 +3100,20 @@ class NIRvH2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, k: OperandType, lambdaN: OperandType, lambdaR: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "k": k, "lambdaN": lambdaN, "lambdaR": lambdaR})])
+    super().__init__(operands=[N - R - k * (lambdaN - lambdaR)])
     self.N = N
     self.R = R
     self.k = k
     self.lambdaN = lambdaN
     self.lambdaR = lambdaR
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NIRvP(WCPSExpr):
   """Near-Infrared Reflectance of Vegetation and Incoming PAR"""
+  __slots__ = ('N', 'R', 'PAR')
   short_name = "NIRvP"
   long_name = "Near-Infrared Reflectance of Vegetation and Incoming PAR"
   bands = ['N', 'R', 'PAR']
@@ -2974,17 +3123,18 @@ class NIRvP(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, PAR: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "PAR": PAR})])
+    super().__init__(operands=[(N - R) / (N + R) * N * PAR])
     self.N = N
     self.R = R
     self.PAR = PAR
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NLI(WCPSExpr):
   """Non-Linear Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "NLI"
   long_name = "Non-Linear Vegetation Index"
   bands = ['N', 'R']
@@ -2994,16 +3144,17 @@ class NLI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[(N ** 2 - R) / (N ** 2 + R)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NMDI(WCPSExpr):
   """Normalized Multi-band Drought Index"""
+  __slots__ = ('N', 'S1', 'S2')
   short_name = "NMDI"
   long_name = "Normalized Multi-band Drought Index"
   bands = ['N', 'S1', 'S2']
@@ -3013,17 +3164,18 @@ class NMDI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S1": S1, "S2": S2})])
+    super().__init__(operands=[(N - (S1 - S2)) / (N + (S1 - S2))])
     self.N = N
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NRFIg(WCPSExpr):
   """Normalized Rapeseed Flowering Index Green"""
+  __slots__ = ('G', 'S2')
   short_name = "NRFIg"
   long_name = "Normalized Rapeseed Flowering Index Green"
   bands = ['G', 'S2']
@@ -3033,16 +3185,17 @@ class NRFIg(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "S2": S2})])
+    super().__init__(operands=[(G - S2) / (G + S2)])
     self.G = G
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NRFIr(WCPSExpr):
   """Normalized Rapeseed Flowering Index Red"""
+  __slots__ = ('R', 'S2')
   short_name = "NRFIr"
   long_name = "Normalized Rapeseed Flowering Index Red"
   bands = ['R', 'S2']
@@ -3052,16 +3205,17 @@ class NRFIr(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "S2": S2})])
+    super().__init__(operands=[(R - S2) / (R + S2)])
     self.R = R
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NSDS(WCPSExpr):
   """Normalized Shortwave Infrared Difference Soil-Moisture"""
+  __slots__ = ('S1', 'S2')
   short_name = "NSDS"
   long_name = "Normalized Shortwave Infrared Difference Soil-Moisture"
   bands = ['S1', 'S2']
@@ -3071,16 +3225,17 @@ class NSDS(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "S2": S2})])
+    super().__init__(operands=[(S1 - S2) / (S1 + S2)])
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NSDSI1(WCPSExpr):
   """Normalized Shortwave-Infrared Difference Bare Soil Moisture Index 1"""
+  __slots__ = ('S1', 'S2')
   short_name = "NSDSI1"
   long_name = "Normalized Shortwave-Infrared Difference Bare Soil Moisture Index 1"
   bands = ['S1', 'S2']
@@ -3090,16 +3245,17 @@ class NSDSI1(WCPSExpr):
   contributor = "https://github.com/CvenGeo"
 
   def __init__(self, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "S2": S2})])
+    super().__init__(operands=[(S1 - S2) / S1])
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NSDSI2(WCPSExpr):
   """Normalized Shortwave-Infrared Difference Bare Soil Moisture Index 2"""
+  __slots__ = ('S1', 'S2')
   short_name = "NSDSI2"
   long_name = "Normalized Shortwave-Infrared Difference Bare Soil Moisture Index 2"
   bands = ['S1', 'S2']
@@ -3109,16 +3265,17 @@ class NSDSI2(WCPSExpr):
   contributor = "https://github.com/CvenGeo"
 
   def __init__(self, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "S2": S2})])
+    super().__init__(operands=[(S1 - S2) / S2])
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NSDSI3(WCPSExpr):
   """Normalized Shortwave-Infrared Difference Bare Soil Moisture Index 3"""
+  __slots__ = ('S1', 'S2')
   short_name = "NSDSI3"
   long_name = "Normalized Shortwave-Infrared Difference Bare Soil Moisture Index 3"
   bands = ['S1', 'S2']
@@ -3128,16 +3285,17 @@ class NSDSI3(WCPSExpr):
   contributor = "https://github.com/CvenGeo"
 
   def __init__(self, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S1": S1, "S2": S2})])
+    super().__init__(operands=[(S1 - S2) / (S1 + S2)])
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NSTv1(WCPSExpr):
   """NIR-SWIR-Temperature Version 1"""
+  __slots__ = ('N', 'S2', 'T')
   short_name = "NSTv1"
   long_name = "NIR-SWIR-Temperature Version 1"
   bands = ['N', 'S2', 'T']
@@ -3147,17 +3305,18 @@ class NSTv1(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2, "T": T})])
+    super().__init__(operands=[(N - S2) / (N + S2) * T])
     self.N = N
     self.S2 = S2
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NSTv2(WCPSExpr):
   """NIR-SWIR-Temperature Version 2"""
+  __slots__ = ('N', 'S2', 'T')
   short_name = "NSTv2"
   long_name = "NIR-SWIR-Temperature Version 2"
   bands = ['N', 'S2', 'T']
@@ -3167,17 +3326,18 @@ class NSTv2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2, "T": T})])
+    super().__init__(operands=[(N - (S2 + T)) / (N + (S2 + T))])
     self.N = N
     self.S2 = S2
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NWI(WCPSExpr):
   """New Water Index"""
+  __slots__ = ('B', 'N', 'S1', 'S2')
   short_name = "NWI"
   long_name = "New Water Index"
   bands = ['B', 'N', 'S1', 'S2']
@@ -3187,18 +3347,19 @@ class NWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, N: OperandType, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "N": N, "S1": S1, "S2": S2})])
+    super().__init__(operands=[(B - (N + S1 + S2)) / (B + (N + S1 + S2))])
     self.B = B
     self.N = N
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NormG(WCPSExpr):
   """Normalized Green"""
+  __slots__ = ('G', 'N', 'R')
   short_name = "NormG"
   long_name = "Normalized Green"
   bands = ['G', 'N', 'R']
@@ -3208,17 +3369,18 @@ class NormG(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "N": N, "R": R})])
+    super().__init__(operands=[G / (N + G + R)])
     self.G = G
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NormNIR(WCPSExpr):
   """Normalized NIR"""
+  __slots__ = ('N', 'G', 'R')
   short_name = "NormNIR"
   long_name = "Normalized NIR"
   bands = ['N', 'G', 'R']
@@ -3228,17 +3390,18 @@ class NormNIR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "R": R})])
+    super().__init__(operands=[N / (N + G + R)])
     self.N = N
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class NormR(WCPSExpr):
   """Normalized Red"""
+  __slots__ = ('R', 'N', 'G')
   short_name = "NormR"
   long_name = "Normalized Red"
   bands = ['R', 'N', 'G']
@@ -3248,17 +3411,18 @@ class NormR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, N: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "N": N, "G": G})])
+    super().__init__(operands=[R / (N + G + R)])
     self.R = R
     self.N = N
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class OCVI(WCPSExpr):
   """Optimized Chlorophyll Vegetation Index"""
+  __slots__ = ('N', 'G', 'R', 'cexp')
   short_name = "OCVI"
   long_name = "Optimized Chlorophyll Vegetation Index"
   bands = ['N', 'G', 'R', 'cexp']
@@ -3268,18 +3432,19 @@ class OCVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, R: OperandType, cexp: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "R": R, "cexp": cexp})])
+    super().__init__(operands=[N / G * (R / G) ** cexp])
     self.N = N
     self.G = G
     self.R = R
     self.cexp = cexp
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class OSAVI(WCPSExpr):
   """Optimized Soil-Adjusted Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "OSAVI"
   long_name = "Optimized Soil-Adjusted Vegetation Index"
   bands = ['N', 'R']
@@ -3289,16 +3454,17 @@ class OSAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[(N - R) / (N + R + 0.16)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class OSI(WCPSExpr):
   """Oil Spill Index"""
+  __slots__ = ('G', 'R', 'B')
   short_name = "OSI"
   long_name = "Oil Spill Index"
   bands = ['G', 'R', 'B']
@@ -3308,17 +3474,18 @@ class OSI(WCPSExpr):
   contributor = "https://github.com/emanuelcastanho"
 
   def __init__(self, G: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "B": B})])
+    super().__init__(operands=[(G + R) / B])
     self.G = G
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class PI(WCPSExpr):
   """Plastic Index"""
+  __slots__ = ('N', 'R')
   short_name = "PI"
   long_name = "Plastic Index"
   bands = ['N', 'R']
@@ -3328,16 +3495,17 @@ class PI(WCPSExpr):
   contributor = "https://github.com/emanuelcastanho"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[N / (N + R)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class PISI(WCPSExpr):
   """Perpendicular Impervious Surface Index"""
+  __slots__ = ('B', 'N')
   short_name = "PISI"
   long_name = "Perpendicular Impervious Surface Index"
   bands = ['B', 'N']
@@ -3347,16 +3515,17 @@ class PISI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "N": N})])
+    super().__init__(operands=[0.8192 * B - 0.5735 * N + 0.075])
     self.B = B
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class PSRI(WCPSExpr):
   """Plant Senescing Reflectance Index"""
+  __slots__ = ('R', 'B', 'RE2')
   short_name = "PSRI"
   long_name = "Plant Senescing Reflectance Index"
   bands = ['R', 'B', 'RE2']
@@ -3366,17 +3535,18 @@ class PSRI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, B: OperandType, RE2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "B": B, "RE2": RE2})])
+    super().__init__(operands=[(R - B) / RE2])
     self.R = R
     self.B = B
     self.RE2 = RE2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class QpRVI(WCPSExpr):
   """Quad-Polarized Radar Vegetation Index"""
+  __slots__ = ('HV', 'HH', 'VV')
   short_name = "QpRVI"
   long_name = "Quad-Polarized Radar Vegetation Index"
   bands = ['HV', 'HH', 'VV']
@@ -3386,17 +3556,18 @@ class QpRVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, HV: OperandType, HH: OperandType, VV: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"HV": HV, "HH": HH, "VV": VV})])
+    super().__init__(operands=[8.0 * HV / (HH + VV + 2.0 * HV)])
     self.HV = HV
     self.HH = HH
     self.VV = VV
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RCC(WCPSExpr):
   """Red Chromatic Coordinate"""
+  __slots__ = ('R', 'G', 'B')
   short_name = "RCC"
   long_name = "Red Chromatic Coordinate"
   bands = ['R', 'G', 'B']
@@ -3406,17 +3577,18 @@ class RCC(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, G: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "G": G, "B": B})])
+    super().__init__(operands=[R / (R + G + B)])
     self.R = R
     self.G = G
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RDVI(WCPSExpr):
   """Renormalized Difference Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "RDVI"
   long_name = "Renormalized Difference Vegetation Index"
   bands = ['N', 'R']
@@ -3426,16 +3598,17 @@ class RDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[(N - R) / (N + R) ** 0.5])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class REDSI(WCPSExpr):
   """Red-Edge Disease Stress Index"""
+  __slots__ = ('RE3', 'R', 'RE1')
   short_name = "REDSI"
   long_name = "Red-Edge Disease Stress Index"
   bands = ['RE3', 'R', 'RE1']
@@ -3445,17 +3618,18 @@ class REDSI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE3: OperandType, R: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE3": RE3, "R": R, "RE1": RE1})])
+    super().__init__(operands=[((705.0 - 665.0) * (RE3 - R) - (783.0 - 665.0) * (RE1 - R)) / (2.0 * R)])
     self.RE3 = RE3
     self.R = R
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RENDVI(WCPSExpr):
   """Red Edge Normalized Difference Vegetation Index"""
+  __slots__ = ('RE2', 'RE1')
   short_name = "RENDVI"
   long_name = "Red Edge Normalized Difference Vegetation Index"
   bands = ['RE2', 'RE1']
@@ -3465,16 +3639,17 @@ class RENDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1})])
+    super().__init__(operands=[(RE2 - RE1) / (RE2 + RE1)])
     self.RE2 = RE2
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RFDI(WCPSExpr):
   """Radar Forest Degradation Index"""
+  __slots__ = ('HH', 'HV')
   short_name = "RFDI"
   long_name = "Radar Forest Degradation Index"
   bands = ['HH', 'HV']
@@ -3484,16 +3659,17 @@ class RFDI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, HH: OperandType, HV: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"HH": HH, "HV": HV})])
+    super().__init__(operands=[(HH - HV) / (HH + HV)])
     self.HH = HH
     self.HV = HV
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RGBVI(WCPSExpr):
   """Red Green Blue Vegetation Index"""
+  __slots__ = ('G', 'B', 'R')
   short_name = "RGBVI"
   long_name = "Red Green Blue Vegetation Index"
   bands = ['G', 'B', 'R']
@@ -3503,17 +3679,18 @@ class RGBVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, B: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "B": B, "R": R})])
+    super().__init__(operands=[(G ** 2.0 - B * R) / (G ** 2.0 + B * R)])
     self.G = G
     self.B = B
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RGRI(WCPSExpr):
   """Red-Green Ratio Index"""
+  __slots__ = ('R', 'G')
   short_name = "RGRI"
   long_name = "Red-Green Ratio Index"
   bands = ['R', 'G']
@@ -3523,16 +3700,17 @@ class RGRI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "G": G})])
+    super().__init__(operands=[R / G])
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RI(WCPSExpr):
   """Redness Index"""
+  __slots__ = ('R', 'G')
   short_name = "RI"
   long_name = "Redness Index"
   bands = ['R', 'G']
@@ -3542,16 +3720,17 @@ class RI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "G": G})])
+    super().__init__(operands=[(R - G) / (R + G)])
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RI4XS(WCPSExpr):
   """SPOT HRV XS-based Redness Index 4"""
+  __slots__ = ('R', 'G')
   short_name = "RI4XS"
   long_name = "SPOT HRV XS-based Redness Index 4"
   bands = ['R', 'G']
@@ -3561,16 +3740,17 @@ class RI4XS(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "G": G})])
+    super().__init__(operands=[R ** 2.0 / G ** 4.0])
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RNDVI(WCPSExpr):
   """Reversed Normalized Difference Vegetation Index"""
+  __slots__ = ('R', 'N')
   short_name = "RNDVI"
   long_name = "Reversed Normalized Difference Vegetation Index"
   bands = ['R', 'N']
@@ -3580,16 +3760,17 @@ class RNDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "N": N})])
+    super().__init__(operands=[(R - N) / (R + N)])
     self.R = R
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class RVI(WCPSExpr):
   """Ratio Vegetation Index"""
+  __slots__ = ('RE2', 'R')
   short_name = "RVI"
   long_name = "Ratio Vegetation Index"
   bands = ['RE2', 'R']
@@ -3599,16 +3780,17 @@ class RVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "R": R})])
+    super().__init__(operands=[RE2 / R])
     self.RE2 = RE2
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class S2REP(WCPSExpr):
   """Sentinel-2 Red-Edge Position"""
+  __slots__ = ('RE3', 'R', 'RE1', 'RE2')
   short_name = "S2REP"
   long_name = "Sentinel-2 Red-Edge Position"
   bands = ['RE3', 'R', 'RE1', 'RE2']
@@ -3618,18 +3800,19 @@ class S2REP(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE3: OperandType, R: OperandType, RE1: OperandType, RE2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE3": RE3, "R": R, "RE1": RE1, "RE2": RE2})])
+    super().__init__(operands=[705.0 + 35.0 * (((RE3 + R) / 2.0 - RE1) / (RE2 - RE1))])
     self.RE3 = RE3
     self.R = R
     self.RE1 = RE1
     self.RE2 = RE2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class S2WI(WCPSExpr):
   """Sentinel-2 Water Index"""
+  __slots__ = ('RE1', 'S2')
   short_name = "S2WI"
   long_name = "Sentinel-2 Water Index"
   bands = ['RE1', 'S2']
@@ -3639,16 +3822,17 @@ class S2WI(WCPSExpr):
   contributor = "https://github.com/MATRIX4284"
 
   def __init__(self, RE1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "S2": S2})])
+    super().__init__(operands=[(RE1 - S2) / (RE1 + S2)])
     self.RE1 = RE1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class S3(WCPSExpr):
   """S3 Snow Index"""
+  __slots__ = ('N', 'R', 'S1')
   short_name = "S3"
   long_name = "S3 Snow Index"
   bands = ['N', 'R', 'S1']
@@ -3658,17 +3842,18 @@ class S3(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "S1": S1})])
+    super().__init__(operands=[N * (R - S1) / ((N + R) * (N + S1))])
     self.N = N
     self.R = R
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SARVI(WCPSExpr):
   """Soil Adjusted and Atmospherically Resistant Vegetation Index"""
+  __slots__ = ('L', 'N', 'R', 'B')
   short_name = "SARVI"
   long_name = "Soil Adjusted and Atmospherically Resistant Vegetation Index"
   bands = ['L', 'N', 'R', 'B']
@@ -3678,18 +3863,19 @@ class SARVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, L: OperandType, N: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"L": L, "N": N, "R": R, "B": B})])
+    super().__init__(operands=[(1 + L) * (N - (R - (R - B))) / (N + (R - (R - B)) + L)])
     self.L = L
     self.N = N
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SAVI(WCPSExpr):
   """Soil-Adjusted Vegetation Index"""
+  __slots__ = ('L', 'N', 'R')
   short_name = "SAVI"
   long_name = "Soil-Adjusted Vegetation Index"
   bands = ['L', 'N', 'R']
@@ -3699,17 +3885,18 @@ class SAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, L: OperandType, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"L": L, "N": N, "R": R})])
+    super().__init__(operands=[(1.0 + L) * (N - R) / (N + R + L)])
     self.L = L
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SAVI2(WCPSExpr):
   """Soil-Adjusted Vegetation Index 2"""
+  __slots__ = ('N', 'R', 'slb', 'sla')
   short_name = "SAVI2"
   long_name = "Soil-Adjusted Vegetation Index 2"
   bands = ['N', 'R', 'slb', 'sla']
@@ -3719,18 +3906,19 @@ class SAVI2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, slb: OperandType, sla: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "slb": slb, "sla": sla})])
+    super().__init__(operands=[N / (R + slb / sla)])
     self.N = N
     self.R = R
     self.slb = slb
     self.sla = sla
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SAVIT(WCPSExpr):
   """Soil-Adjusted Vegetation Index Thermal"""
+  __slots__ = ('L', 'N', 'R', 'T')
   short_name = "SAVIT"
   long_name = "Soil-Adjusted Vegetation Index Thermal"
   bands = ['L', 'N', 'R', 'T']
@@ -3740,18 +3928,19 @@ class SAVIT(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, L: OperandType, N: OperandType, R: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"L": L, "N": N, "R": R, "T": T})])
+    super().__init__(operands=[(1.0 + L) * (N - R * T / 10000.0) / (N + R * T / 10000.0 + L)])
     self.L = L
     self.N = N
     self.R = R
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SEVI(WCPSExpr):
   """Shadow-Eliminated Vegetation Index"""
+  __slots__ = ('N', 'R', 'fdelta')
   short_name = "SEVI"
   long_name = "Shadow-Eliminated Vegetation Index"
   bands = ['N', 'R', 'fdelta']
@@ -3761,17 +3950,18 @@ class SEVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, fdelta: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "fdelta": fdelta})])
+    super().__init__(operands=[N / R + fdelta * (1.0 / R)])
     self.N = N
     self.R = R
     self.fdelta = fdelta
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SI(WCPSExpr):
   """Shadow Index"""
+  __slots__ = ('B', 'G', 'R')
   short_name = "SI"
   long_name = "Shadow Index"
   bands = ['B', 'G', 'R']
@@ -3781,17 +3971,18 @@ class SI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "G": G, "R": R})])
+    super().__init__(operands=[((1.0 - B) * (1.0 - G) * (1.0 - R)) ** (1 / 3)])
     self.B = B
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SIPI(WCPSExpr):
   """Structure Insensitive Pigment Index"""
+  __slots__ = ('N', 'A', 'R')
   short_name = "SIPI"
   long_name = "Structure Insensitive Pigment Index"
   bands = ['N', 'A', 'R']
@@ -3801,17 +3992,18 @@ class SIPI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, A: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "A": A, "R": R})])
+    super().__init__(operands=[(N - A) / (N - R)])
     self.N = N
     self.A = A
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SLAVI(WCPSExpr):
   """Specific Leaf Area Vegetation Index"""
+  __slots__ = ('N', 'R', 'S2')
   short_name = "SLAVI"
   long_name = "Specific Leaf Area Vegetation Index"
   bands = ['N', 'R', 'S2']
@@ -3821,17 +4013,18 @@ class SLAVI(WCPSExpr):
   contributor = "https://github.com/geoSanjeeb"
 
   def __init__(self, N: OperandType, R: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "S2": S2})])
+    super().__init__(operands=[N / (R + S2)])
     self.N = N
     self.R = R
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SR(WCPSExpr):
   """Simple Ratio"""
+  __slots__ = ('N', 'R')
   short_name = "SR"
   long_name = "Simple Ratio"
   bands = ['N', 'R']
@@ -3841,16 +4034,17 @@ class SR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[N / R])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SR2(WCPSExpr):
   """Simple Ratio (800 and 550 nm)"""
+  __slots__ = ('N', 'G')
   short_name = "SR2"
   long_name = "Simple Ratio (800 and 550 nm)"
   bands = ['N', 'G']
@@ -3860,16 +4054,17 @@ class SR2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G})])
+    super().__init__(operands=[N / G])
     self.N = N
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SR3(WCPSExpr):
   """Simple Ratio (860, 550 and 708 nm)"""
+  __slots__ = ('N2', 'G', 'RE1')
   short_name = "SR3"
   long_name = "Simple Ratio (860, 550 and 708 nm)"
   bands = ['N2', 'G', 'RE1']
@@ -3879,17 +4074,18 @@ class SR3(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N2: OperandType, G: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N2": N2, "G": G, "RE1": RE1})])
+    super().__init__(operands=[N2 / (G * RE1)])
     self.N2 = N2
     self.G = G
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SR555(WCPSExpr):
   """Simple Ratio (555 and 750 nm)"""
+  __slots__ = ('RE2', 'G')
   short_name = "SR555"
   long_name = "Simple Ratio (555 and 750 nm)"
   bands = ['RE2', 'G']
@@ -3899,16 +4095,17 @@ class SR555(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "G": G})])
+    super().__init__(operands=[RE2 / G])
     self.RE2 = RE2
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SR705(WCPSExpr):
   """Simple Ratio (705 and 750 nm)"""
+  __slots__ = ('RE2', 'RE1')
   short_name = "SR705"
   long_name = "Simple Ratio (705 and 750 nm)"
   bands = ['RE2', 'RE1']
@@ -3918,16 +4115,17 @@ class SR705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1})])
+    super().__init__(operands=[RE2 / RE1])
     self.RE2 = RE2
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SWI(WCPSExpr):
   """Snow Water Index"""
+  __slots__ = ('G', 'N', 'S1')
   short_name = "SWI"
   long_name = "Snow Water Index"
   bands = ['G', 'N', 'S1']
@@ -3937,17 +4135,18 @@ class SWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "N": N, "S1": S1})])
+    super().__init__(operands=[G * (N - S1) / ((G + N) * (N + S1))])
     self.G = G
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SWM(WCPSExpr):
   """Sentinel Water Mask"""
+  __slots__ = ('B', 'G', 'N', 'S1')
   short_name = "SWM"
   long_name = "Sentinel Water Mask"
   bands = ['B', 'G', 'N', 'S1']
@@ -3957,18 +4156,19 @@ class SWM(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, G: OperandType, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "G": G, "N": N, "S1": S1})])
+    super().__init__(operands=[(B + G) / (N + S1)])
     self.B = B
     self.G = G
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class SeLI(WCPSExpr):
   """Sentinel-2 LAI Green Index"""
+  __slots__ = ('N2', 'RE1')
   short_name = "SeLI"
   long_name = "Sentinel-2 LAI Green Index"
   bands = ['N2', 'RE1']
@@ -3978,16 +4178,17 @@ class SeLI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N2: OperandType, RE1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N2": N2, "RE1": RE1})])
+    super().__init__(operands=[(N2 - RE1) / (N2 + RE1)])
     self.N2 = N2
     self.RE1 = RE1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TCARI(WCPSExpr):
   """Transformed Chlorophyll Absorption in Reflectance Index"""
+  __slots__ = ('RE1', 'R', 'G')
   short_name = "TCARI"
   long_name = "Transformed Chlorophyll Absorption in Reflectance Index"
   bands = ['RE1', 'R', 'G']
@@ -3997,17 +4198,18 @@ class TCARI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE1: OperandType, R: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "R": R, "G": G})])
+    super().__init__(operands=[3 * (RE1 - R - 0.2 * (RE1 - G) * (RE1 / R))])
     self.RE1 = RE1
     self.R = R
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TCARIOSAVI(WCPSExpr):
   """TCARI/OSAVI Ratio"""
+  __slots__ = ('RE1', 'R', 'G', 'N')
   short_name = "TCARIOSAVI"
   long_name = "TCARI/OSAVI Ratio"
   bands = ['RE1', 'R', 'G', 'N']
@@ -4017,18 +4219,19 @@ class TCARIOSAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE1: OperandType, R: OperandType, G: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "R": R, "G": G, "N": N})])
+    super().__init__(operands=[3 * (RE1 - R - 0.2 * (RE1 - G) * (RE1 / R)) / (1.16 * (N - R) / (N + R + 0.16))])
     self.RE1 = RE1
     self.R = R
     self.G = G
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TCARIOSAVI705(WCPSExpr):
   """TCARI/OSAVI Ratio (705 and 750 nm)"""
+  __slots__ = ('RE2', 'RE1', 'G')
   short_name = "TCARIOSAVI705"
   long_name = "TCARI/OSAVI Ratio (705 and 750 nm)"
   bands = ['RE2', 'RE1', 'G']
@@ -4038,17 +4241,18 @@ class TCARIOSAVI705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType, G: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1, "G": G})])
+    super().__init__(operands=[3 * (RE2 - RE1 - 0.2 * (RE2 - G) * (RE2 / RE1)) / (1.16 * (RE2 - RE1) / (RE2 + RE1 + 0.16))])
     self.RE2 = RE2
     self.RE1 = RE1
     self.G = G
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TCI(WCPSExpr):
   """Triangular Chlorophyll Index"""
+  __slots__ = ('RE1', 'G', 'R')
   short_name = "TCI"
   long_name = "Triangular Chlorophyll Index"
   bands = ['RE1', 'G', 'R']
@@ -4058,17 +4262,18 @@ class TCI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE1: OperandType, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "G": G, "R": R})])
+    super().__init__(operands=[1.2 * (RE1 - G) - 1.5 * (R - G) * (RE1 / R) ** 0.5])
     self.RE1 = RE1
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TDVI(WCPSExpr):
   """Transformed Difference Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "TDVI"
   long_name = "Transformed Difference Vegetation Index"
   bands = ['N', 'R']
@@ -4078,16 +4283,17 @@ class TDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[1.5 * ((N - R) / (N ** 2.0 + R + 0.5) ** 0.5)])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TGI(WCPSExpr):
   """Triangular Greenness Index"""
+  __slots__ = ('R', 'G', 'B')
   short_name = "TGI"
   long_name = "Triangular Greenness Index"
   bands = ['R', 'G', 'B']
@@ -4097,17 +4303,18 @@ class TGI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, G: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "G": G, "B": B})])
+    super().__init__(operands=[-0.5 * (190 * (R - G) - 120 * (R - B))])
     self.R = R
     self.G = G
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TRRVI(WCPSExpr):
   """Transformed Red Range Vegetation Index"""
+  __slots__ = ('RE2', 'R', 'N')
   short_name = "TRRVI"
   long_name = "Transformed Red Range Vegetation Index"
   bands = ['RE2', 'R', 'N']
@@ -4117,17 +4324,18 @@ class TRRVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, R: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "R": R, "N": N})])
+    super().__init__(operands=[(RE2 - R) / (RE2 + R) / ((N - R) / (N + R) + 1.0)])
     self.RE2 = RE2
     self.R = R
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TSAVI(WCPSExpr):
   """Transformed Soil-Adjusted Vegetation Index"""
+  __slots__ = ('sla', 'N', 'R', 'slb')
   short_name = "TSAVI"
   long_name = "Transformed Soil-Adjusted Vegetation Index"
   bands = ['sla', 'N', 'R', 'slb']
@@ -4137,18 +4345,19 @@ class TSAVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, sla: OperandType, N: OperandType, R: OperandType, slb: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"sla": sla, "N": N, "R": R, "slb": slb})])
+    super().__init__(operands=[sla * (N - sla * R - slb) / (sla * N + R - sla * slb)])
     self.sla = sla
     self.N = N
     self.R = R
     self.slb = slb
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TTVI(WCPSExpr):
   """Transformed Triangular Vegetation Index"""
+  __slots__ = ('RE3', 'RE2', 'N2')
   short_name = "TTVI"
   long_name = "Transformed Triangular Vegetation Index"
   bands = ['RE3', 'RE2', 'N2']
@@ -4158,17 +4367,18 @@ class TTVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE3: OperandType, RE2: OperandType, N2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE3": RE3, "RE2": RE2, "N2": N2})])
+    super().__init__(operands=[0.5 * ((865.0 - 740.0) * (RE3 - RE2) - (N2 - RE2) * (783.0 - 740))])
     self.RE3 = RE3
     self.RE2 = RE2
     self.N2 = N2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TVI(WCPSExpr):
   """Transformed Vegetation Index"""
+  __slots__ = ('N', 'R')
   short_name = "TVI"
   long_name = "Transformed Vegetation Index"
   bands = ['N', 'R']
@@ -4178,16 +4388,17 @@ class TVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R})])
+    super().__init__(operands=[((N - R) / (N + R) + 0.5) ** 0.5])
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TWI(WCPSExpr):
   """Triangle Water Index"""
+  __slots__ = ('RE1', 'RE2', 'G', 'S2', 'B', 'N')
   short_name = "TWI"
   long_name = "Triangle Water Index"
   bands = ['RE1', 'RE2', 'G', 'S2', 'B', 'N']
@@ -4197,7 +4408,7 @@ class TWI(WCPSExpr):
   contributor = "https://github.com/remi-braun"
 
   def __init__(self, RE1: OperandType, RE2: OperandType, G: OperandType, S2: OperandType, B: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "RE2": RE2, "G": G, "S2": S2, "B": B, "N": N})])
+    super().__init__(operands=[2.84 * (RE1 - RE2) / (G + S2) + (1.25 * (G - B) - (N - B)) / (N + 1.25 * G - 0.25 * B)])
     self.RE1 = RE1
     self.RE2 = RE2
     self.G = G
@@ -4205,12 +4416,13 @@ class TWI(WCPSExpr):
     self.B = B
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class TriVI(WCPSExpr):
   """Triangular Vegetation Index"""
+  __slots__ = ('N', 'G', 'R')
   short_name = "TriVI"
   long_name = "Triangular Vegetation Index"
   bands = ['N', 'G', 'R']
@@ -4220,17 +4432,18 @@ class TriVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "G": G, "R": R})])
+    super().__init__(operands=[0.5 * (120 * (N - G) - 200 * (R - G))])
     self.N = N
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class UI(WCPSExpr):
   """Urban Index"""
+  __slots__ = ('S2', 'N')
   short_name = "UI"
   long_name = "Urban Index"
   bands = ['S2', 'N']
@@ -4240,16 +4453,17 @@ class UI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, S2: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"S2": S2, "N": N})])
+    super().__init__(operands=[(S2 - N) / (S2 + N)])
     self.S2 = S2
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VARI(WCPSExpr):
   """Visible Atmospherically Resistant Index"""
+  __slots__ = ('G', 'R', 'B')
   short_name = "VARI"
   long_name = "Visible Atmospherically Resistant Index"
   bands = ['G', 'R', 'B']
@@ -4259,17 +4473,18 @@ class VARI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "B": B})])
+    super().__init__(operands=[(G - R) / (G + R - B)])
     self.G = G
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VARI700(WCPSExpr):
   """Visible Atmospherically Resistant Index (700 nm)"""
+  __slots__ = ('RE1', 'R', 'B')
   short_name = "VARI700"
   long_name = "Visible Atmospherically Resistant Index (700 nm)"
   bands = ['RE1', 'R', 'B']
@@ -4279,17 +4494,18 @@ class VARI700(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE1: OperandType, R: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "R": R, "B": B})])
+    super().__init__(operands=[(RE1 - 1.7 * R + 0.7 * B) / (RE1 + 1.3 * R - 1.3 * B)])
     self.RE1 = RE1
     self.R = R
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VDDPI(WCPSExpr):
   """Vertical Dual De-Polarization Index"""
+  __slots__ = ('VV', 'VH')
   short_name = "VDDPI"
   long_name = "Vertical Dual De-Polarization Index"
   bands = ['VV', 'VH']
@@ -4299,16 +4515,17 @@ class VDDPI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VV: OperandType, VH: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VV": VV, "VH": VH})])
+    super().__init__(operands=[(VV + VH) / VV])
     self.VV = VV
     self.VH = VH
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VHVVD(WCPSExpr):
   """VH-VV Difference"""
+  __slots__ = ('VH', 'VV')
   short_name = "VHVVD"
   long_name = "VH-VV Difference"
   bands = ['VH', 'VV']
@@ -4318,16 +4535,17 @@ class VHVVD(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VH: OperandType, VV: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VH": VH, "VV": VV})])
+    super().__init__(operands=[VH - VV])
     self.VH = VH
     self.VV = VV
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VHVVP(WCPSExpr):
   """VH-VV Product"""
+  __slots__ = ('VH', 'VV')
   short_name = "VHVVP"
   long_name = "VH-VV Product"
   bands = ['VH', 'VV']
@@ -4337,16 +4555,17 @@ class VHVVP(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VH: OperandType, VV: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VH": VH, "VV": VV})])
+    super().__init__(operands=[VH * VV])
     self.VH = VH
     self.VV = VV
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VHVVR(WCPSExpr):
   """VH-VV Ratio"""
+  __slots__ = ('VH', 'VV')
   short_name = "VHVVR"
   long_name = "VH-VV Ratio"
   bands = ['VH', 'VV']
@@ -4356,16 +4575,17 @@ class VHVVR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VH: OperandType, VV: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VH": VH, "VV": VV})])
+    super().__init__(operands=[VH / VV])
     self.VH = VH
     self.VV = VV
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VI6T(WCPSExpr):
   """VI6T Index"""
+  __slots__ = ('N', 'T')
   short_name = "VI6T"
   long_name = "VI6T Index"
   bands = ['N', 'T']
@@ -4375,16 +4595,17 @@ class VI6T(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, T: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "T": T})])
+    super().__init__(operands=[(N - T / 10000.0) / (N + T / 10000.0)])
     self.N = N
     self.T = T
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VI700(WCPSExpr):
   """Vegetation Index (700 nm)"""
+  __slots__ = ('RE1', 'R')
   short_name = "VI700"
   long_name = "Vegetation Index (700 nm)"
   bands = ['RE1', 'R']
@@ -4394,16 +4615,17 @@ class VI700(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE1: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE1": RE1, "R": R})])
+    super().__init__(operands=[(RE1 - R) / (RE1 + R)])
     self.RE1 = RE1
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VIBI(WCPSExpr):
   """Vegetation Index Built-up Index"""
+  __slots__ = ('N', 'R', 'S1')
   short_name = "VIBI"
   long_name = "Vegetation Index Built-up Index"
   bands = ['N', 'R', 'S1']
@@ -4413,17 +4635,18 @@ class VIBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "S1": S1})])
+    super().__init__(operands=[(N - R) / (N + R) / ((N - R) / (N + R) + (S1 - N) / (S1 + N))])
     self.N = N
     self.R = R
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VIG(WCPSExpr):
   """Vegetation Index Green"""
+  __slots__ = ('G', 'R')
   short_name = "VIG"
   long_name = "Vegetation Index Green"
   bands = ['G', 'R']
@@ -4433,16 +4656,17 @@ class VIG(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R})])
+    super().__init__(operands=[(G - R) / (G + R)])
     self.G = G
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VVVHD(WCPSExpr):
   """VV-VH Difference"""
+  __slots__ = ('VV', 'VH')
   short_name = "VVVHD"
   long_name = "VV-VH Difference"
   bands = ['VV', 'VH']
@@ -4452,16 +4676,17 @@ class VVVHD(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VV: OperandType, VH: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VV": VV, "VH": VH})])
+    super().__init__(operands=[VV - VH])
     self.VV = VV
     self.VH = VH
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VVVHR(WCPSExpr):
   """VV-VH Ratio"""
+  __slots__ = ('VV', 'VH')
   short_name = "VVVHR"
   long_name = "VV-VH Ratio"
   bands = ['VV', 'VH']
@@ -4471,16 +4696,17 @@ class VVVHR(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VV: OperandType, VH: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VV": VV, "VH": VH})])
+    super().__init__(operands=[VV / VH])
     self.VV = VV
     self.VH = VH
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VVVHS(WCPSExpr):
   """VV-VH Sum"""
+  __slots__ = ('VV', 'VH')
   short_name = "VVVHS"
   long_name = "VV-VH Sum"
   bands = ['VV', 'VH']
@@ -4490,16 +4716,17 @@ class VVVHS(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, VV: OperandType, VH: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"VV": VV, "VH": VH})])
+    super().__init__(operands=[VV + VH])
     self.VV = VV
     self.VH = VH
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VgNIRBI(WCPSExpr):
   """Visible Green-Based Built-Up Index"""
+  __slots__ = ('G', 'N')
   short_name = "VgNIRBI"
   long_name = "Visible Green-Based Built-Up Index"
   bands = ['G', 'N']
@@ -4509,16 +4736,17 @@ class VgNIRBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "N": N})])
+    super().__init__(operands=[(G - N) / (G + N)])
     self.G = G
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class VrNIRBI(WCPSExpr):
   """Visible Red-Based Built-Up Index"""
+  __slots__ = ('R', 'N')
   short_name = "VrNIRBI"
   long_name = "Visible Red-Based Built-Up Index"
   bands = ['R', 'N']
@@ -4528,16 +4756,17 @@ class VrNIRBI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, R: OperandType, N: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"R": R, "N": N})])
+    super().__init__(operands=[(R - N) / (R + N)])
     self.R = R
     self.N = N
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class WDRVI(WCPSExpr):
   """Wide Dynamic Range Vegetation Index"""
+  __slots__ = ('alpha', 'N', 'R')
   short_name = "WDRVI"
   long_name = "Wide Dynamic Range Vegetation Index"
   bands = ['alpha', 'N', 'R']
@@ -4547,17 +4776,18 @@ class WDRVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, alpha: OperandType, N: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"alpha": alpha, "N": N, "R": R})])
+    super().__init__(operands=[(alpha * N - R) / (alpha * N + R)])
     self.alpha = alpha
     self.N = N
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class WDVI(WCPSExpr):
   """Weighted Difference Vegetation Index"""
+  __slots__ = ('N', 'sla', 'R')
   short_name = "WDVI"
   long_name = "Weighted Difference Vegetation Index"
   bands = ['N', 'sla', 'R']
@@ -4567,17 +4797,18 @@ class WDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, sla: OperandType, R: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "sla": sla, "R": R})])
+    super().__init__(operands=[N - sla * R])
     self.N = N
     self.sla = sla
     self.R = R
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class WI1(WCPSExpr):
   """Water Index 1"""
+  __slots__ = ('G', 'S2')
   short_name = "WI1"
   long_name = "Water Index 1"
   bands = ['G', 'S2']
@@ -4587,16 +4818,17 @@ class WI1(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "S2": S2})])
+    super().__init__(operands=[(G - S2) / (G + S2)])
     self.G = G
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class WI2(WCPSExpr):
   """Water Index 2"""
+  __slots__ = ('B', 'S2')
   short_name = "WI2"
   long_name = "Water Index 2"
   bands = ['B', 'S2']
@@ -4606,16 +4838,17 @@ class WI2(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, B: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"B": B, "S2": S2})])
+    super().__init__(operands=[(B - S2) / (B + S2)])
     self.B = B
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class WI2015(WCPSExpr):
   """Water Index 2015"""
+  __slots__ = ('G', 'R', 'N', 'S1', 'S2')
   short_name = "WI2015"
   long_name = "Water Index 2015"
   bands = ['G', 'R', 'N', 'S1', 'S2']
@@ -4625,19 +4858,20 @@ class WI2015(WCPSExpr):
   contributor = "https://github.com/remi-braun"
 
   def __init__(self, G: OperandType, R: OperandType, N: OperandType, S1: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "N": N, "S1": S1, "S2": S2})])
+    super().__init__(operands=[1.7204 + 171 * G + 3 * R - 70 * N - 45 * S1 - 71 * S2])
     self.G = G
     self.R = R
     self.N = N
     self.S1 = S1
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class WRI(WCPSExpr):
   """Water Ratio Index"""
+  __slots__ = ('G', 'R', 'N', 'S1')
   short_name = "WRI"
   long_name = "Water Ratio Index"
   bands = ['G', 'R', 'N', 'S1']
@@ -4647,18 +4881,19 @@ class WRI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, G: OperandType, R: OperandType, N: OperandType, S1: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"G": G, "R": R, "N": N, "S1": S1})])
+    super().__init__(operands=[(G + R) / (N + S1)])
     self.G = G
     self.R = R
     self.N = N
     self.S1 = S1
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class bNIRv(WCPSExpr):
   """Blue Near-Infrared Reflectance of Vegetation"""
+  __slots__ = ('N', 'B')
   short_name = "bNIRv"
   long_name = "Blue Near-Infrared Reflectance of Vegetation"
   bands = ['N', 'B']
@@ -4668,16 +4903,17 @@ class bNIRv(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, B: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "B": B})])
+    super().__init__(operands=[(N - B) / (N + B) * N])
     self.N = N
     self.B = B
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class kEVI(WCPSExpr):
   """Kernel Enhanced Vegetation Index"""
+  __slots__ = ('g', 'kNN', 'kNR', 'C1', 'C2', 'kNB', 'kNL')
   short_name = "kEVI"
   long_name = "Kernel Enhanced Vegetation Index"
   bands = ['g', 'kNN', 'kNR', 'C1', 'C2', 'kNB', 'kNL']
@@ -4687,7 +4923,7 @@ class kEVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, g: OperandType, kNN: OperandType, kNR: OperandType, C1: OperandType, C2: OperandType, kNB: OperandType, kNL: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"g": g, "kNN": kNN, "kNR": kNR, "C1": C1, "C2": C2, "kNB": kNB, "kNL": kNL})])
+    super().__init__(operands=[g * (kNN - kNR) / (kNN + C1 * kNR - C2 * kNB + kNL)])
     self.g = g
     self.kNN = kNN
     self.kNR = kNR
@@ -4696,12 +4932,13 @@ class kEVI(WCPSExpr):
     self.kNB = kNB
     self.kNL = kNL
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class kIPVI(WCPSExpr):
   """Kernel Infrared Percentage Vegetation Index"""
+  __slots__ = ('kNN', 'kNR')
   short_name = "kIPVI"
   long_name = "Kernel Infrared Percentage Vegetation Index"
   bands = ['kNN', 'kNR']
@@ -4711,16 +4948,17 @@ class kIPVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, kNN: OperandType, kNR: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"kNN": kNN, "kNR": kNR})])
+    super().__init__(operands=[kNN / (kNN + kNR)])
     self.kNN = kNN
     self.kNR = kNR
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class kNDVI(WCPSExpr):
   """Kernel Normalized Difference Vegetation Index"""
+  __slots__ = ('kNN', 'kNR')
   short_name = "kNDVI"
   long_name = "Kernel Normalized Difference Vegetation Index"
   bands = ['kNN', 'kNR']
@@ -4730,16 +4968,17 @@ class kNDVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, kNN: OperandType, kNR: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"kNN": kNN, "kNR": kNR})])
+    super().__init__(operands=[(kNN - kNR) / (kNN + kNR)])
     self.kNN = kNN
     self.kNR = kNR
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class kRVI(WCPSExpr):
   """Kernel Ratio Vegetation Index"""
+  __slots__ = ('kNN', 'kNR')
   short_name = "kRVI"
   long_name = "Kernel Ratio Vegetation Index"
   bands = ['kNN', 'kNR']
@@ -4749,16 +4988,17 @@ class kRVI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, kNN: OperandType, kNR: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"kNN": kNN, "kNR": kNR})])
+    super().__init__(operands=[kNN / kNR])
     self.kNN = kNN
     self.kNR = kNR
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class kVARI(WCPSExpr):
   """Kernel Visible Atmospherically Resistant Index"""
+  __slots__ = ('kGG', 'kGR', 'kGB')
   short_name = "kVARI"
   long_name = "Kernel Visible Atmospherically Resistant Index"
   bands = ['kGG', 'kGR', 'kGB']
@@ -4768,17 +5008,18 @@ class kVARI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, kGG: OperandType, kGR: OperandType, kGB: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"kGG": kGG, "kGR": kGR, "kGB": kGB})])
+    super().__init__(operands=[(kGG - kGR) / (kGG + kGR - kGB)])
     self.kGG = kGG
     self.kGR = kGR
     self.kGB = kGB
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class mND705(WCPSExpr):
   """Modified Normalized Difference (705, 750 and 445 nm)"""
+  __slots__ = ('RE2', 'RE1', 'A')
   short_name = "mND705"
   long_name = "Modified Normalized Difference (705, 750 and 445 nm)"
   bands = ['RE2', 'RE1', 'A']
@@ -4788,17 +5029,18 @@ class mND705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, RE1: OperandType, A: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "RE1": RE1, "A": A})])
+    super().__init__(operands=[(RE2 - RE1) / (RE2 + RE1 - A)])
     self.RE2 = RE2
     self.RE1 = RE1
     self.A = A
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class mSR705(WCPSExpr):
   """Modified Simple Ratio (705 and 445 nm)"""
+  __slots__ = ('RE2', 'A')
   short_name = "mSR705"
   long_name = "Modified Simple Ratio (705 and 445 nm)"
   bands = ['RE2', 'A']
@@ -4808,16 +5050,17 @@ class mSR705(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, RE2: OperandType, A: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"RE2": RE2, "A": A})])
+    super().__init__(operands=[(RE2 - A) / (RE2 + A)])
     self.RE2 = RE2
     self.A = A
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class sNIRvLSWI(WCPSExpr):
   """SWIR-enhanced Near-Infrared Reflectance of Vegetation for LSWI"""
+  __slots__ = ('N', 'S2')
   short_name = "sNIRvLSWI"
   long_name = "SWIR-enhanced Near-Infrared Reflectance of Vegetation for LSWI"
   bands = ['N', 'S2']
@@ -4827,16 +5070,17 @@ class sNIRvLSWI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "S2": S2})])
+    super().__init__(operands=[(N - S2) / (N + S2) * N])
     self.N = N
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class sNIRvNDPI(WCPSExpr):
   """SWIR-enhanced Near-Infrared Reflectance of Vegetation for NDPI"""
+  __slots__ = ('N', 'alpha', 'R', 'S2')
   short_name = "sNIRvNDPI"
   long_name = "SWIR-enhanced Near-Infrared Reflectance of Vegetation for NDPI"
   bands = ['N', 'alpha', 'R', 'S2']
@@ -4846,18 +5090,19 @@ class sNIRvNDPI(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, alpha: OperandType, R: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "alpha": alpha, "R": R, "S2": S2})])
+    super().__init__(operands=[(N - (alpha * R + (1.0 - alpha) * S2)) / (N + (alpha * R + (1.0 - alpha) * S2)) * N])
     self.N = N
     self.alpha = alpha
     self.R = R
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class sNIRvNDVILSWIP(WCPSExpr):
   """SWIR-enhanced Near-Infrared Reflectance of Vegetation for the NDVI-LSWI Product"""
+  __slots__ = ('N', 'R', 'S2')
   short_name = "sNIRvNDVILSWIP"
   long_name = "SWIR-enhanced Near-Infrared Reflectance of Vegetation for the NDVI-LSWI Product"
   bands = ['N', 'R', 'S2']
@@ -4867,17 +5112,18 @@ class sNIRvNDVILSWIP(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "S2": S2})])
+    super().__init__(operands=[(N - R) / (N + R) * ((N - S2) / (N + S2)) * N])
     self.N = N
     self.R = R
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class sNIRvNDVILSWIS(WCPSExpr):
   """SWIR-enhanced Near-Infrared Reflectance of Vegetation for the NDVI-LSWI Sum"""
+  __slots__ = ('N', 'R', 'S2')
   short_name = "sNIRvNDVILSWIS"
   long_name = "SWIR-enhanced Near-Infrared Reflectance of Vegetation for the NDVI-LSWI Sum"
   bands = ['N', 'R', 'S2']
@@ -4887,17 +5133,18 @@ class sNIRvNDVILSWIS(WCPSExpr):
   contributor = "https://github.com/davemlz"
 
   def __init__(self, N: OperandType, R: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "S2": S2})])
+    super().__init__(operands=[((N - R) / (N + R) + (N - S2) / (N + S2)) * N])
     self.N = N
     self.R = R
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 
 class sNIRvSWIR(WCPSExpr):
   """SWIR-enhanced Near-Infrared Reflectance of Vegetation"""
+  __slots__ = ('N', 'R', 'S2')
   short_name = "sNIRvSWIR"
   long_name = "SWIR-enhanced Near-Infrared Reflectance of Vegetation"
   bands = ['N', 'R', 'S2']
@@ -4907,12 +5154,12 @@ class sNIRvSWIR(WCPSExpr):
   contributor = "https://github.com/MartinuzziFrancesco"
 
   def __init__(self, N: OperandType, R: OperandType, S2: OperandType):
-    super().__init__(operands=[eval(self.formula, {}, {"N": N, "R": R, "S2": S2})])
+    super().__init__(operands=[(N - R - S2 ** 2.0) / (N + R + S2 ** 2.0) * N])
     self.N = N
     self.R = R
     self.S2 = S2
 
-  def __str__(self):
-    return super().__str__() + str(self.operands[0])
+  def _parts(self):
+    return (self.operands[0],)
 
 